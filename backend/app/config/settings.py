@@ -19,9 +19,45 @@ class Settings(BaseSettings):
     # Database
     mongo_url: str = Field(..., env="MONGO_URL")
     db_name: str = Field(..., env="DB_NAME")
+    # Documents per cursor batch when streaming whole collections
+    stream_batch_size: int = Field(default=200, env="STREAM_BATCH_SIZE")
     
     # GitHub
     github_token: str = Field(..., env="GITHUB_TOKEN")
+    # "git_data" pushes all files as one commit (blobs + tree + commit + ref),
+    # "contents" falls back to one Contents API call (and commit) per file
+    github_push_mode: str = Field(default="git_data", env="GITHUB_PUSH_MODE")
+    github_api_url: str = Field(default="https://api.github.com", env="GITHUB_API_URL")
+    github_timeout: float = Field(default=30.0, env="GITHUB_TIMEOUT")
+    github_max_connections: int = Field(default=20, env="GITHUB_MAX_CONNECTIONS")
+    github_max_concurrency: int = Field(default=8, env="GITHUB_MAX_CONCURRENCY")
+    github_rate_limit_reserve: int = Field(default=50, env="GITHUB_RATE_LIMIT_RESERVE")
+    github_max_retries: int = Field(default=3, env="GITHUB_MAX_RETRIES")
+    # Files up to this many characters are sent inline in the tree request
+    github_inline_blob_limit: int = Field(default=64 * 1024, env="GITHUB_INLINE_BLOB_LIMIT")
+    
+    # Background jobs
+    job_poll_interval: float = Field(default=2.0, env="JOB_POLL_INTERVAL")
+    job_lock_timeout: int = Field(default=900, env="JOB_LOCK_TIMEOUT")  # 15 minutes
+    # Running jobs renew their lock this often, well within the lock timeout
+    job_heartbeat_interval: float = Field(default=60.0, env="JOB_HEARTBEAT_INTERVAL")
+    job_max_attempts: int = Field(default=3, env="JOB_MAX_ATTEMPTS")
+    # A failed job waits this long before its second attempt, doubling after that
+    job_retry_delay: float = Field(default=30.0, env="JOB_RETRY_DELAY")
+    # Repositories upgraded at the same time by a fleet upgrade job
+    upgrade_concurrency: int = Field(default=4, env="UPGRADE_CONCURRENCY")
+    
+    # Templates
+    templates_path: str = Field(
+        default=str(Path(__file__).resolve().parents[2] / "templates"),
+        env="TEMPLATES_PATH"
+    )
+    # Precompiled catalog (scripts/build_catalog.py) used instead of the pack directory
+    templates_snapshot: Optional[str] = Field(default=None, env="TEMPLATES_SNAPSHOT")
+    # Reload changed template packs without a restart
+    templates_hot_reload: bool = Field(default=True, env="TEMPLATES_HOT_RELOAD")
+    # Rendered file sets kept in memory, in characters of path + content
+    render_cache_max_size: int = Field(default=16 * 1024 * 1024, env="RENDER_CACHE_MAX_SIZE")
     
     # CORS
     cors_origins: str = Field(
@@ -45,8 +81,22 @@ class Settings(BaseSettings):
     rate_limit_requests: int = Field(default=100, env="RATE_LIMIT_REQUESTS")
     rate_limit_window: int = Field(default=60, env="RATE_LIMIT_WINDOW")
     
+    # Status checks expire this many days after they are created
+    status_retention_days: int = Field(default=30, env="STATUS_RETENTION_DAYS")
+    # Status checks are buffered and written with insert_many: a batch is
+    # written once it is full or flush_interval seconds after the last one
+    status_buffer_batch_size: int = Field(default=500, env="STATUS_BUFFER_BATCH_SIZE")
+    status_buffer_flush_interval: float = Field(default=1.0, env="STATUS_BUFFER_FLUSH_INTERVAL")
+    # Checks held in memory before new ones wait, and how long they wait before a 503
+    status_buffer_max_pending: int = Field(default=10000, env="STATUS_BUFFER_MAX_PENDING")
+    status_buffer_enqueue_timeout: float = Field(default=5.0, env="STATUS_BUFFER_ENQUEUE_TIMEOUT")
+    # Write concern "w" of the batches: 0, 1, ... or "majority"
+    status_write_concern: str = Field(default="1", env="STATUS_WRITE_CONCERN")
+    
     # Cache
     cache_ttl: int = Field(default=300, env="CACHE_TTL")  # 5 minutes
+    # Project writes made by other processes reach cached statistics within this many seconds
+    stats_version_ttl: float = Field(default=5.0, env="STATS_VERSION_TTL")
     
     # File Upload
     max_file_size: int = Field(default=10 * 1024 * 1024, env="MAX_FILE_SIZE")  # 10MB
@@ -57,7 +107,7 @@ class Settings(BaseSettings):
         if self.cors_origins == "*":
             return ["*"]
         return [origin.strip() for origin in self.cors_origins.split(",")]
-
+    
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
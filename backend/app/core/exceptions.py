@@ -40,6 +40,26 @@ class GitHubError(ScaffoldForgeException):
         super().__init__(message, details, status_code=502)
 
 
+class GitHubAPIError(GitHubError):
+    """GitHub API error response carrying the upstream HTTP status."""
+    
+    def __init__(
+        self,
+        message: str,
+        status: int,
+        details: Optional[Dict[str, Any]] = None
+    ):
+        super().__init__(message, details)
+        self.status = status
+
+
+class GitHubRequestError(GitHubError):
+    """GitHub request that fails the same way on every attempt."""
+    
+    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
+        super().__init__(message, details)
+
+
 class TemplateError(ScaffoldForgeException):
     """Template processing error exception."""
     
@@ -52,3 +72,10 @@ class DatabaseError(ScaffoldForgeException):
     
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(message, details, status_code=500)
+
+
+class ServiceUnavailableError(ScaffoldForgeException):
+    """Temporary overload exception; the client should retry later."""
+    
+    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
+        super().__init__(message, details, status_code=503)
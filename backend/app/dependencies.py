@@ -0,0 +1,67 @@
+"""
+Application-scoped services and their FastAPI dependencies.
+
+Services are built once in the application lifespan and stored on
+``app.state``; the dependency functions below only look them up, so no
+request pays for constructing clients or rebuilding the template catalog.
+"""
+from typing import cast
+
+from fastapi import FastAPI, Request
+
+from app.repositories.client_stats import ClientStatsRepository
+from app.repositories.job import JobRepository
+from app.repositories.project import ProjectRepository
+from app.repositories.status import StatusCheckRepository
+from app.services.github_service import GitHubService
+from app.services.project_service import ProjectService
+from app.services.status_buffer import StatusCheckBuffer
+from app.services.template_service import TemplateService
+
+
+def init_services(app: FastAPI) -> None:
+    """Create the shared service instances on ``app.state``."""
+    state = app.state
+    state.template_service = TemplateService()
+    state.github_service = GitHubService()
+    state.project_repository = ProjectRepository()
+    state.job_repository = JobRepository()
+    state.status_repository = StatusCheckRepository()
+    state.client_stats_repository = ClientStatsRepository()
+    state.status_buffer = StatusCheckBuffer(state.status_repository, state.client_stats_repository)
+    state.project_service = ProjectService(
+        state.project_repository,
+        state.github_service,
+        state.template_service,
+        state.job_repository
+    )
+
+
+def get_template_service(request: Request) -> TemplateService:
+    """Dependency to get the shared template service."""
+    return cast(TemplateService, request.app.state.template_service)
+
+
+def get_github_service(request: Request) -> GitHubService:
+    """Dependency to get the shared GitHub service."""
+    return cast(GitHubService, request.app.state.github_service)
+
+
+def get_project_service(request: Request) -> ProjectService:
+    """Dependency to get the shared project service."""
+    return cast(ProjectService, request.app.state.project_service)
+
+
+def get_status_repository(request: Request) -> StatusCheckRepository:
+    """Dependency to get the shared status check repository."""
+    return cast(StatusCheckRepository, request.app.state.status_repository)
+
+
+def get_status_buffer(request: Request) -> StatusCheckBuffer:
+    """Dependency to get the shared status check ingestion buffer."""
+    return cast(StatusCheckBuffer, request.app.state.status_buffer)
+
+
+def get_client_stats_repository(request: Request) -> ClientStatsRepository:
+    """Dependency to get the shared client statistics repository."""
+    return cast(ClientStatsRepository, request.app.state.client_stats_repository)
@@ -1,13 +1,15 @@
 """
 Main FastAPI application entry point.
 """
-from fastapi import FastAPI, Request
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse, HTMLResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse
 from pathlib import Path
+import asyncio
 import logging
 import time
 
@@ -15,12 +17,77 @@ from app.config.settings import settings
 from app.core.database import database
 from app.core.logging import setup_logging, get_logger
 from app.core.exceptions import ScaffoldForgeException
+from app.dependencies import init_services
+from app.repositories.indexes import ensure_indexes
 from app.routers import projects, templates, status
+from app.services.github_client import github_client
 
 # Setup logging
 setup_logging()
 logger = get_logger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create shared resources on startup and release them on shutdown."""
+    logger.info("Starting Scaffold Forge application...")
+    
+    try:
+        # Connect to database
+        await database.connect()
+        logger.info("Database connection established")
+        await ensure_indexes()
+        
+        # Build application-scoped services once
+        init_services(app)
+        app.state.status_buffer.start()
+        
+        # Pick up edited template packs without a restart
+        template_watch_stop = asyncio.Event()
+        template_watch = None
+        if settings.templates_hot_reload:
+            template_watch = asyncio.create_task(
+                app.state.template_service.store.watch(template_watch_stop)
+            )
+        
+        # Test GitHub connection
+        github_connected = await app.state.github_service.test_connection()
+        if github_connected:
+            logger.info("GitHub API connection verified")
+        else:
+            logger.warning("GitHub API connection failed")
+        
+        logger.info("Application startup completed successfully")
+    
+    except Exception as e:
+        logger.error(f"Failed to start application: {str(e)}")
+        raise
+    
+    yield
+    
+    logger.info("Shutting down Scaffold Forge application...")
+    
+    try:
+        if template_watch is not None:
+            template_watch_stop.set()
+            await template_watch
+        
+        # Write the status checks still buffered before the connection closes
+        await app.state.status_buffer.stop()
+        
+        # Close the shared GitHub connection pool
+        await github_client.close()
+        
+        # Disconnect from database
+        await database.disconnect()
+        logger.info("Database connection closed")
+        
+        logger.info("Application shutdown completed")
+    
+    except Exception as e:
+        logger.error(f"Error during shutdown: {str(e)}")
+
+
 # Create FastAPI application
 app = FastAPI(
     title=settings.api_title,
@@ -28,7 +95,8 @@ app = FastAPI(
     version=settings.app_version,
     debug=settings.debug,
     docs_url="/docs" if settings.debug else None,
-    redoc_url="/redoc" if settings.debug else None
+    redoc_url="/redoc" if settings.debug else None,
+    lifespan=lifespan
 )
 
 # Add middleware
@@ -38,6 +106,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Add trusted host middleware for security
@@ -142,50 +211,6 @@ if static_dir.exists():
             raise HTTPException(status_code=404, detail="Frontend not built")
 
 
-# Application startup event
-@app.on_event("startup")
-async def startup_event():
-    """Initialize application on startup."""
-    logger.info("Starting Scaffold Forge application...")
-    
-    try:
-        # Connect to database
-        await database.connect()
-        logger.info("Database connection established")
-        
-        # Test GitHub connection
-        from app.services.github_service import GitHubService
-        github_service = GitHubService()
-        github_connected = await github_service.test_connection()
-        if github_connected:
-            logger.info("GitHub API connection verified")
-        else:
-            logger.warning("GitHub API connection failed")
-        
-        logger.info("Application startup completed successfully")
-        
-    except Exception as e:
-        logger.error(f"Failed to start application: {str(e)}")
-        raise
-
-
-# Application shutdown event
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup on application shutdown."""
-    logger.info("Shutting down Scaffold Forge application...")
-    
-    try:
-        # Disconnect from database
-        await database.disconnect()
-        logger.info("Database connection closed")
-        
-        logger.info("Application shutdown completed")
-        
-    except Exception as e:
-        logger.error(f"Error during shutdown: {str(e)}")
-
-
 if __name__ == "__main__":
     import uvicorn
     
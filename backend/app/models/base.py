@@ -3,11 +3,27 @@ Base models and common fields.
 """
 from datetime import datetime
 from typing import Any, Dict, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 import uuid
 
 
-class BaseDocument(BaseModel):
+class StoredModel(BaseModel):
+    """
+    Model read from the database.
+    
+    The repositories mark it ``trusted`` when its document was written by
+    this service, so read endpoints can send it without validating it
+    against their ``response_model`` again.
+    """
+    
+    _trusted: bool = PrivateAttr(default=False)
+    
+    @property
+    def trusted(self) -> bool:
+        return self._trusted
+
+
+class BaseDocument(StoredModel):
     """Base document model with common fields."""
     
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
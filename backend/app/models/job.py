@@ -0,0 +1,34 @@
+"""
+Background job models.
+"""
+from datetime import datetime
+from typing import Any, Dict, Optional
+from pydantic import BaseModel, Field
+
+from app.models.base import BaseDocument
+
+
+class Job(BaseDocument):
+    """Background job document model."""
+    
+    type: str = Field(default="generate_project", description="Job type")
+    status: str = Field(default="queued", description="Job status (queued, running, succeeded, failed)")
+    payload: Dict[str, Any] = Field(default_factory=dict, description="Job input")
+    result: Optional[Dict[str, Any]] = Field(default=None, description="Job output")
+    progress: Dict[str, Any] = Field(default_factory=dict, description="Steps completed by earlier attempts")
+    error: Optional[str] = None
+    attempts: int = 0
+    worker_id: Optional[str] = None
+    locked_at: Optional[datetime] = None
+    retry_at: Optional[datetime] = Field(default=None, description="Earliest time of the next attempt")
+    finished_at: Optional[datetime] = None
+
+
+class JobResponse(BaseModel):
+    """Response model for job submission."""
+    
+    success: bool = True
+    message: str
+    job_id: str
+    status: str
+    status_url: str
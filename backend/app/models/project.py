@@ -5,7 +5,7 @@ from typing import Optional
 from pydantic import BaseModel, Field, validator
 from datetime import datetime
 
-from app.models.base import BaseDocument
+from app.models.base import BaseDocument, StoredModel
 
 
 class ProjectRequest(BaseModel):
@@ -55,10 +55,25 @@ class Project(BaseDocument):
     metadata: Optional[dict] = Field(default_factory=dict, description="Additional metadata")
 
 
+class ProjectSummary(StoredModel):
+    """List entry of a project, without metadata."""
+    
+    id: str
+    name: str
+    description: str
+    language: str
+    template_id: str
+    github_username: str
+    repository_url: str
+    status: str = "created"
+    created_at: Optional[datetime] = None
+
+
 class ProjectListResponse(BaseModel):
     """Response model for project list."""
     
-    projects: list[Project]
+    projects: list[ProjectSummary]
     total: int
     page: int = 1
     page_size: int = 50
+    next_cursor: Optional[str] = Field(default=None, description="Pass as 'after' to get the next page")
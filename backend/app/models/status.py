@@ -5,7 +5,7 @@ from datetime import datetime
 from pydantic import BaseModel, Field
 from typing import Optional, Dict, Any
 
-from app.models.base import BaseDocument
+from app.models.base import BaseDocument, StoredModel
 
 
 class StatusCheckCreate(BaseModel):
@@ -22,6 +22,23 @@ class StatusCheck(BaseDocument):
     metadata: Optional[Dict[str, Any]] = Field(default_factory=dict)
 
 
+class StatusCheckSummary(StoredModel):
+    """List entry of a status check, without metadata."""
+    
+    id: str
+    client_name: str
+    created_at: Optional[datetime] = None
+
+
+class ClientStats(BaseModel):
+    """Running status check counters of one client."""
+    
+    client_name: str
+    check_count: int = 0
+    first_check: Optional[datetime] = None
+    last_check: Optional[datetime] = None
+
+
 class HealthCheck(BaseModel):
     """Health check response model."""
     
@@ -1,26 +1,140 @@
 """
 Base repository class with common database operations.
 """
-from typing import Any, Dict, List, Optional, Type, TypeVar
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Type, TypeVar
 from motor.motor_asyncio import AsyncIOMotorDatabase, AsyncIOMotorCollection
 from pydantic import BaseModel
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import BulkWriteError, ConnectionFailure, ExecutionTimeout, PyMongoError
+from pymongo.write_concern import WriteConcern
 from bson import ObjectId
+from bson.errors import InvalidId
 from datetime import datetime
+import base64
+import binascii
+import json
 
 from app.core.database import database
-from app.core.exceptions import DatabaseError, NotFoundError
+from app.core.exceptions import DatabaseError, NotFoundError, ValidationError
+from app.models.base import StoredModel
 
 T = TypeVar('T', bound=BaseModel)
+M = TypeVar('M', bound=BaseModel)
+
+# Newest first; _id breaks ties between documents created in the same millisecond
+KEYSET_SORT = [("created_at", DESCENDING), ("_id", DESCENDING)]
+
+# Stamped on every document a repository writes, with its ``schema_version``
+SCHEMA_FIELD = "_schema"
+
+
+def pack_cursor(data: Any) -> str:
+    """Opaque, URL-safe pagination token carrying JSON data."""
+    return base64.urlsafe_b64encode(json.dumps(data).encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def unpack_cursor(token: str) -> Any:
+    """
+    Data of a ``pack_cursor`` token.
+    
+    Raises:
+        ValueError: If the token is not valid base64 JSON
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        return json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError) as e:
+        raise ValueError(str(e))
+
+
+def encode_cursor(document: Dict[str, Any]) -> str:
+    """Opaque pagination token pointing after ``document`` in ``KEYSET_SORT`` order."""
+    created_at = document.get("created_at")
+    return pack_cursor([created_at.isoformat() if created_at else None, str(document["_id"])])
+
+
+def decode_cursor(token: str) -> Dict[str, Any]:
+    """
+    Turn a pagination token into the filter selecting the documents after it.
+    
+    Raises:
+        ValidationError: If the token was not produced by ``encode_cursor``
+    """
+    try:
+        created_at, object_id = unpack_cursor(token)
+        created_at = datetime.fromisoformat(created_at) if created_at is not None else None
+        object_id = ObjectId(object_id)
+    except (ValueError, TypeError, InvalidId):
+        raise ValidationError("Invalid pagination cursor")
+    
+    if created_at is None:
+        # Documents without created_at sort last; only _id orders them
+        return {"created_at": None, "_id": {"$lt": object_id}}
+    return {"$or": [
+        {"created_at": {"$lt": created_at}},
+        {"created_at": created_at, "_id": {"$lt": object_id}},
+        {"created_at": None}
+    ]}
 
 
 class BaseRepository:
-    """Base repository with common CRUD operations."""
+    """
+    Base repository with common CRUD operations.
+    
+    Subclasses declare the indexes their queries need in ``indexes``;
+    ``ensure_indexes`` creates them at startup, after ``ensure_collection``
+    for collections that need creation options.
+    
+    Documents written through a repository carry its ``schema_version``.
+    Models read back from such documents are marked trusted and skip the
+    response model validation of the read endpoints; documents without
+    the stamp (written by older versions or by hand) are still validated
+    there.
+    """
+    
+    # Every document carries a public string id next to Mongo's _id
+    indexes: List[IndexModel] = [
+        IndexModel([("id", ASCENDING)], unique=True, name="id_unique"),
+        IndexModel(KEYSET_SORT, name="created_at_id_desc")
+    ]
+    
+    # Slim model for list queries; only its fields are read from the database
+    summary_class: Optional[Type[BaseModel]] = None
+    
+    # Bump when stored documents stop matching the models
+    schema_version: int = 1
+    
+    # Order of keyset pages; page_cursor and cursor_filter follow it
+    keyset_sort: List[Tuple[str, int]] = KEYSET_SORT
     
     def __init__(self, collection_name: str, model_class: Type[T]):
         self.collection_name = collection_name
         self.model_class = model_class
         self._collection: Optional[AsyncIOMotorCollection] = None
     
+    def summary_projection(self) -> Dict[str, int]:
+        """Projection reading just the fields of ``summary_class``; ``id`` comes from ``_id``."""
+        fields = [name for name in self.summary_class.model_fields if name != "id"]
+        # created_at is always needed to build the next page's cursor
+        return {"_id": 1, "created_at": 1, SCHEMA_FIELD: 1, **{name: 1 for name in fields}}
+    
+    def build(self, model_class: Type[Any], document: Dict[str, Any]) -> Any:
+        """
+        Build a model from a stored document, trusted if this service wrote it.
+        
+        Every document still goes through the model's validator once: under
+        pydantic 2 that is also the cheapest way to build a model, cheaper
+        than ``model_construct`` (see scripts/bench_validation.py).
+        """
+        document['id'] = str(document['_id'])
+        return self.trust(model_class(**document), document)
+    
+    def trust(self, model: M, document: Dict[str, Any]) -> M:
+        """Mark a model trusted when its document carries this repository's stamp."""
+        if isinstance(model, StoredModel) and document.get(SCHEMA_FIELD) == self.schema_version:
+            model._trusted = True
+        return model
+    
     @property
     def collection(self) -> AsyncIOMotorCollection:
         """Get collection instance."""
@@ -29,23 +143,105 @@ class BaseRepository:
             self._collection = db[self.collection_name]
         return self._collection
     
+    async def ensure_collection(self) -> None:
+        """Create the collection if it needs options; plain collections are created on first write."""
+    
+    def page_cursor(self, page: List[Dict[str, Any]], after: Optional[str]) -> str:
+        """
+        Token of the page following ``page``.
+        
+        Args:
+            page: Documents of the current page, in ``keyset_sort`` order
+            after: Token the current page was read after, if any
+        """
+        return encode_cursor(page[-1])
+    
+    def cursor_filter(self, token: str) -> Dict[str, Any]:
+        """
+        Filter selecting the documents after a ``page_cursor`` token.
+        
+        Raises:
+            ValidationError: If the token is not one of this repository's
+        """
+        return decode_cursor(token)
+    
+    async def ensure_indexes(self) -> List[str]:
+        """Create the declared indexes; existing ones are left as they are."""
+        try:
+            return await self.collection.create_indexes(self.indexes)
+        except Exception as e:
+            raise DatabaseError(f"Failed to create indexes on {self.collection_name}: {str(e)}")
+    
     async def create(self, document: T) -> T:
         """Create a new document."""
         try:
             document_dict = document.dict()
+            document_dict[SCHEMA_FIELD] = self.schema_version
             result = await self.collection.insert_one(document_dict)
             document_dict['_id'] = result.inserted_id
-            return self.model_class(**document_dict)
+            return self.trust(self.model_class(**document_dict), document_dict)
         except Exception as e:
             raise DatabaseError(f"Failed to create document: {str(e)}")
     
+    async def insert_many(
+        self,
+        documents: List[Dict[str, Any]],
+        write_concern: Optional[WriteConcern] = None
+    ) -> int:
+        """
+        Insert prepared documents in one unordered batch.
+        
+        Args:
+            documents: Documents as they are stored, ``_id`` included if
+                the caller needs to know it; they are stamped in place
+            write_concern: Write concern of this batch instead of the
+                collection's
+        
+        Returns:
+            Number of documents sent
+        
+        Raises:
+            DatabaseError: If the insert failed. When the server reported
+                per-document results, ``details["failed_indexes"]`` lists
+                the positions in ``documents`` that were rejected; the
+                others were inserted. ``details["retryable"]`` is set when
+                the documents not listed may be missing or unacknowledged
+                and can be sent again: on connection errors, timeouts and
+                write concern errors
+        """
+        for document in documents:
+            document[SCHEMA_FIELD] = self.schema_version
+        collection = self.collection
+        if write_concern is not None:
+            collection = collection.with_options(write_concern=write_concern)
+        try:
+            result = await collection.insert_many(documents, ordered=False)
+            return len(result.inserted_ids)
+        except BulkWriteError as e:
+            failed = sorted({error["index"] for error in e.details.get("writeErrors", [])})
+            details: Dict[str, Any] = {"failed_indexes": failed}
+            if e.details.get("writeConcernErrors"):
+                # The others reached the primary but may still be rolled back
+                details["retryable"] = True
+            raise DatabaseError(
+                f"Failed to insert {len(failed)} of {len(documents)} documents: {str(e)}",
+                details=details
+            )
+        except PyMongoError as e:
+            retryable = isinstance(e, (ConnectionFailure, ExecutionTimeout)) or e.has_error_label("RetryableWriteError")
+            raise DatabaseError(
+                f"Failed to insert documents: {str(e)}",
+                details={"retryable": True} if retryable else None
+            )
+        except Exception as e:
+            raise DatabaseError(f"Failed to insert documents: {str(e)}")
+    
     async def get_by_id(self, document_id: str) -> Optional[T]:
         """Get document by ID."""
         try:
             document = await self.collection.find_one({"_id": ObjectId(document_id)})
             if document:
-                document['id'] = str(document['_id'])
-                return self.model_class(**document)
+                return self.build(self.model_class, document)
             return None
         except Exception as e:
             raise DatabaseError(f"Failed to get document by ID: {str(e)}")
@@ -55,8 +251,7 @@ class BaseRepository:
         try:
             document = await self.collection.find_one({field: value})
             if document:
-                document['id'] = str(document['_id'])
-                return self.model_class(**document)
+                return self.build(self.model_class, document)
             return None
         except Exception as e:
             raise DatabaseError(f"Failed to get document by field: {str(e)}")
@@ -65,20 +260,111 @@ class BaseRepository:
         self, 
         skip: int = 0, 
         limit: int = 100,
-        filter_dict: Optional[Dict[str, Any]] = None
+        filter_dict: Optional[Dict[str, Any]] = None,
+        sort: Optional[List[Tuple[str, int]]] = None
     ) -> List[T]:
         """Get all documents with pagination."""
         try:
             filter_dict = filter_dict or {}
-            cursor = self.collection.find(filter_dict).skip(skip).limit(limit)
+            cursor = self.collection.find(filter_dict)
+            if sort:
+                cursor = cursor.sort(sort)
+            cursor = cursor.skip(skip).limit(limit)
             documents = []
             async for document in cursor:
-                document['id'] = str(document['_id'])
-                documents.append(self.model_class(**document))
+                documents.append(self.build(self.model_class, document))
             return documents
         except Exception as e:
             raise DatabaseError(f"Failed to get documents: {str(e)}")
     
+    async def iter_all(
+        self,
+        filter_dict: Optional[Dict[str, Any]] = None,
+        sort: Optional[List[Tuple[str, int]]] = None,
+        summary: bool = False,
+        batch_size: Optional[int] = None
+    ) -> AsyncIterator[Any]:
+        """
+        Iterate over every matching document without loading them all.
+        
+        Only one cursor batch is held at a time. The cursor is closed when
+        the caller stops early, e.g. when a streamed response is aborted.
+        
+        Args:
+            filter_dict: Query filter
+            sort: Sort specification
+            summary: Read only the ``summary_class`` fields and yield
+                summary models instead of full documents
+            batch_size: Documents per cursor batch, the server's default if None
+        """
+        model_class = self.summary_class if summary else self.model_class
+        projection = self.summary_projection() if summary else None
+        cursor = self.collection.find(filter_dict or {}, projection)
+        if sort:
+            cursor = cursor.sort(sort)
+        if batch_size:
+            cursor = cursor.batch_size(batch_size)
+        try:
+            async for document in cursor:
+                yield self.build(model_class, document)
+        except Exception as e:
+            raise DatabaseError(f"Failed to iterate documents: {str(e)}")
+        finally:
+            await cursor.close()
+    
+    async def get_page(
+        self,
+        limit: int = 50,
+        after: Optional[str] = None,
+        filter_dict: Optional[Dict[str, Any]] = None,
+        skip: int = 0,
+        summary: bool = False
+    ) -> Tuple[List[Any], Optional[str]]:
+        """
+        Get one page of documents, newest first, with keyset pagination.
+        
+        Pages continue from the ``after`` token instead of skipping, so every
+        page is an index range scan costing the same as the first one.
+        
+        Args:
+            limit: Maximum number of documents to return
+            after: Cursor returned with the previous page
+            filter_dict: Additional filter
+            skip: Offset for clients still paging by offset; prefer ``after``
+            summary: Read only the ``summary_class`` fields and return
+                summary models instead of full documents
+        
+        Returns:
+            The documents and the cursor of the next page, None on the last page
+        """
+        query = dict(filter_dict or {})
+        if after:
+            keyset = self.cursor_filter(after)
+            query = {"$and": [query, keyset]} if query else keyset
+        
+        model_class = self.summary_class if summary else self.model_class
+        projection = self.summary_projection() if summary else None
+        try:
+            documents, more = await self.read_page(query, projection, skip, limit)
+        except Exception as e:
+            raise DatabaseError(f"Failed to get documents: {str(e)}")
+        
+        next_cursor = self.page_cursor(documents, after) if more else None
+        items = [self.build(model_class, document) for document in documents]
+        return items, next_cursor
+    
+    async def read_page(
+        self,
+        query: Dict[str, Any],
+        projection: Optional[Dict[str, Any]],
+        skip: int,
+        limit: int
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """Documents of one page in ``keyset_sort`` order, and whether more follow."""
+        cursor = self.collection.find(query, projection).sort(self.keyset_sort).skip(skip).limit(limit + 1)
+        documents = await cursor.to_list(limit + 1)
+        return documents[:limit], len(documents) > limit
+    
     async def update(self, document_id: str, update_data: Dict[str, Any]) -> Optional[T]:
         """Update document by ID."""
         try:
@@ -108,7 +394,9 @@ class BaseRepository:
     async def count(self, filter_dict: Optional[Dict[str, Any]] = None) -> int:
         """Count documents."""
         try:
-            filter_dict = filter_dict or {}
+            if not filter_dict:
+                # Collection metadata; counting with an empty filter scans everything
+                return await self.collection.estimated_document_count()
             return await self.collection.count_documents(filter_dict)
         except Exception as e:
             raise DatabaseError(f"Failed to count documents: {str(e)}")
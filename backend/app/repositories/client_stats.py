@@ -0,0 +1,182 @@
+"""
+Per-client status check counters.
+"""
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from pymongo import DESCENDING, IndexModel, UpdateOne
+from pymongo.errors import DuplicateKeyError
+from pymongo.write_concern import WriteConcern
+
+from app.core.exceptions import DatabaseError
+from app.core.logging import get_logger
+from app.models.status import ClientStats
+from app.repositories.base import BaseRepository
+
+logger = get_logger(__name__)
+
+# One marker per summary collection, claimed by the process that backfills it
+BACKFILLS_COLLECTION = "backfills"
+
+
+class ClientStatsRepository(BaseRepository):
+    """
+    Summary of status checks per client, one document per client.
+    
+    Counters are folded in with ``$inc``/``$min``/``$max`` upserts whenever
+    checks are written, so reading the statistics costs one small query
+    however long the check history is. Documents are keyed by client name
+    in ``_id``. Counts include checks the status check retention has
+    since expired.
+    """
+    
+    indexes = [
+        IndexModel([("check_count", DESCENDING), ("_id", DESCENDING)], name="check_count_desc")
+    ]
+    
+    def __init__(self, source_collection: str = "status_checks"):
+        super().__init__("status_client_stats", ClientStats)
+        self.source_collection = source_collection
+    
+    async def ensure_collection(self) -> None:
+        """
+        Build the summary from the stored checks the first time it is empty.
+        
+        Every process calls this at startup, so the backfill is claimed
+        with a marker document first and runs in one process only. It
+        counts the checks older than the claim; newer ones reach the
+        summary through ``record``, whose counters are added to, not
+        replaced.
+        """
+        try:
+            if await self.collection.estimated_document_count():
+                return
+            source = self.collection.database[self.source_collection]
+            if not await source.estimated_document_count():
+                return
+            started = datetime.utcnow()
+            try:
+                await self.backfills.insert_one({"_id": self.collection_name, "started": started})
+            except DuplicateKeyError:
+                return
+        except Exception as e:
+            raise DatabaseError(f"Failed to build {self.collection_name}: {str(e)}")
+        
+        pipeline = [
+            {"$match": {"created_at": {"$lt": started}}},
+            {
+                "$group": {
+                    "_id": "$client_name",
+                    "check_count": {"$sum": 1},
+                    "first_check": {"$min": "$created_at"},
+                    "last_check": {"$max": "$created_at"}
+                }
+            },
+            {
+                "$merge": {
+                    "into": self.collection_name,
+                    "whenMatched": [
+                        {
+                            "$set": {
+                                "check_count": {"$add": [{"$ifNull": ["$check_count", 0]}, "$$new.check_count"]},
+                                "first_check": {"$min": ["$first_check", "$$new.first_check"]},
+                                "last_check": {"$max": ["$last_check", "$$new.last_check"]}
+                            }
+                        }
+                    ],
+                    "whenNotMatched": "insert"
+                }
+            }
+        ]
+        try:
+            await source.aggregate(pipeline).to_list(None)
+        except Exception as e:
+            try:
+                # Let the next startup try again
+                await self.backfills.delete_one({"_id": self.collection_name})
+            except Exception:
+                logger.error(f"Failed to release the {self.collection_name} backfill")
+            raise DatabaseError(f"Failed to build {self.collection_name}: {str(e)}")
+        logger.info(f"Built {self.collection_name} from {self.source_collection}")
+    
+    @property
+    def backfills(self) -> Any:
+        return self.collection.database[BACKFILLS_COLLECTION]
+    
+    async def record(
+        self,
+        documents: Iterable[Dict[str, Any]],
+        write_concern: Optional[WriteConcern] = None
+    ) -> int:
+        """
+        Fold written status checks into the per-client counters.
+        
+        All checks of a client in the batch become a single upsert.
+        
+        Args:
+            documents: Stored status check documents
+            write_concern: Write concern of the upserts instead of the
+                collection's
+        
+        Returns:
+            Number of clients updated
+        """
+        counters: Dict[str, List[Any]] = defaultdict(lambda: [0, None, None])
+        for document in documents:
+            counter = counters[document["client_name"]]
+            created_at = document["created_at"]
+            counter[0] += 1
+            counter[1] = created_at if counter[1] is None else min(counter[1], created_at)
+            counter[2] = created_at if counter[2] is None else max(counter[2], created_at)
+        if not counters:
+            return 0
+        
+        operations = [
+            UpdateOne(
+                {"_id": client_name},
+                {
+                    "$inc": {"check_count": count},
+                    "$min": {"first_check": first},
+                    "$max": {"last_check": last}
+                },
+                upsert=True
+            )
+            for client_name, (count, first, last) in counters.items()
+        ]
+        collection = self.collection
+        if write_concern is not None:
+            collection = collection.with_options(write_concern=write_concern)
+        try:
+            await collection.bulk_write(operations, ordered=False)
+        except Exception as e:
+            raise DatabaseError(f"Failed to update client statistics: {str(e)}")
+        return len(operations)
+    
+    async def get_client_stats(self) -> Dict[str, Any]:
+        """
+        Get the per-client counters, busiest clients first.
+        
+        Returns:
+            Number of clients, and each client's check count and first and
+            last check
+        """
+        try:
+            cursor = self.collection.find({}).sort([("check_count", DESCENDING), ("_id", DESCENDING)])
+            documents = await cursor.to_list(None)
+        except Exception as e:
+            raise DatabaseError(f"Failed to get client statistics: {str(e)}")
+        
+        clients = [
+            {
+                "client_name": document["_id"],
+                "check_count": document.get("check_count", 0),
+                "first_check": document.get("first_check"),
+                "last_check": document.get("last_check")
+            }
+            for document in documents
+        ]
+        return {
+            "total_clients": len(clients),
+            "clients": clients
+        }
@@ -0,0 +1,47 @@
+"""
+Index bootstrap for every repository collection.
+"""
+from typing import Callable, Dict, List, Tuple
+
+from app.core.exceptions import DatabaseError
+from app.core.logging import get_logger
+from app.repositories.base import BaseRepository
+from app.repositories.client_stats import ClientStatsRepository
+from app.repositories.job import JobRepository
+from app.repositories.project import ProjectRepository
+from app.repositories.status import StatusCheckRepository
+
+logger = get_logger(__name__)
+
+# Built without arguments, each for its own collection
+REPOSITORIES: Tuple[Callable[[], BaseRepository], ...] = (
+    ProjectRepository,
+    JobRepository,
+    StatusCheckRepository,
+    # After status checks: an empty summary is built from them
+    ClientStatsRepository,
+)
+
+
+async def ensure_indexes() -> Dict[str, List[str]]:
+    """
+    Create each repository's collection when it needs options, then its indexes.
+    
+    Creating an index that already exists is a no-op, so this runs on every
+    startup. A collection whose indexes cannot be built (for example a
+    unique index over existing duplicates) is logged and skipped so the
+    application still starts.
+    
+    Returns:
+        Index names per collection
+    """
+    created: Dict[str, List[str]] = {}
+    for repository_class in REPOSITORIES:
+        repository = repository_class()
+        try:
+            await repository.ensure_collection()
+            created[repository.collection_name] = await repository.ensure_indexes()
+        except DatabaseError as e:
+            logger.error(str(e))
+    logger.info(f"Ensured indexes on {', '.join(created) or 'no collections'}")
+    return created
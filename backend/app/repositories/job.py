@@ -0,0 +1,158 @@
+"""
+Job repository for database operations.
+"""
+from typing import Any, Dict, Optional
+from datetime import datetime, timedelta
+from pymongo import ASCENDING, IndexModel, ReturnDocument
+
+from app.core.exceptions import DatabaseError
+from app.models.job import Job
+from app.repositories.base import BaseRepository
+
+
+class JobRepository(BaseRepository):
+    """Repository for background job operations."""
+    
+    indexes = BaseRepository.indexes + [
+        # claim_next: queued jobs oldest first, and expired running locks
+        IndexModel([("status", ASCENDING), ("created_at", ASCENDING)], name="status_created_at"),
+        IndexModel([("status", ASCENDING), ("locked_at", ASCENDING)], name="status_locked_at")
+    ]
+    
+    def __init__(self) -> None:
+        super().__init__("jobs", Job)
+    
+    async def get_job(self, job_id: str) -> Optional[Job]:
+        """
+        Get job by its public identifier.
+        
+        Unlike ``get_by_field`` this keeps the stored ``id``, the one
+        returned when the job was submitted, instead of replacing it with
+        the ``_id`` string.
+        """
+        try:
+            document = await self.collection.find_one({"id": job_id})
+        except Exception as e:
+            raise DatabaseError(f"Failed to get job: {str(e)}")
+        if document:
+            return self.trust(Job(**document), document)
+        return None
+    
+    async def claim_next(self, worker_id: str, lock_timeout: int, max_attempts: int) -> Optional[Job]:
+        """
+        Atomically claim the oldest runnable job.
+        
+        Queued jobs are claimed first-in first-out, once their ``retry_at``
+        has passed. Running jobs whose lock is
+        older than ``lock_timeout`` seconds belonged to a crashed worker and
+        are claimed again, counting as a new attempt. A stale job that has
+        already used ``max_attempts`` keeps crashing its worker and is marked
+        failed instead.
+        
+        Args:
+            worker_id: Identifier of the claiming worker
+            lock_timeout: Seconds after which a running job's lock expires
+            max_attempts: Attempts after which a stale job is not claimed again
+        
+        Returns:
+            The claimed job, or None if nothing is runnable
+        """
+        now = datetime.utcnow()
+        stale = {"status": "running", "locked_at": {"$lt": now - timedelta(seconds=lock_timeout)}}
+        try:
+            await self.collection.update_many(
+                {**stale, "attempts": {"$gte": max_attempts}},
+                {
+                    "$set": {
+                        "status": "failed",
+                        "error": f"Worker lock expired on the last of {max_attempts} attempts",
+                        "locked_at": None,
+                        "finished_at": now,
+                        "updated_at": now
+                    }
+                }
+            )
+            document = await self.collection.find_one_and_update(
+                {
+                    "$or": [
+                        {"status": "queued", "retry_at": {"$not": {"$gt": now}}},
+                        {**stale, "attempts": {"$lt": max_attempts}}
+                    ]
+                },
+                {
+                    "$set": {
+                        "status": "running",
+                        "worker_id": worker_id,
+                        "locked_at": now,
+                        "updated_at": now
+                    },
+                    "$inc": {"attempts": 1}
+                },
+                sort=[("created_at", 1)],
+                return_document=ReturnDocument.AFTER
+            )
+        except Exception as e:
+            raise DatabaseError(f"Failed to claim job: {str(e)}")
+        
+        if document:
+            return self.trust(Job(**document), document)
+        return None
+    
+    async def heartbeat(self, job_id: str, worker_id: str, progress: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Renew the lock of a running job, optionally saving its progress.
+        
+        Returns:
+            False if the job is no longer owned by ``worker_id``, i.e. its
+            lock expired and another worker claimed it
+        """
+        now = datetime.utcnow()
+        update: Dict[str, Any] = {"locked_at": now, "updated_at": now}
+        if progress is not None:
+            update["progress"] = progress
+        try:
+            result = await self.collection.update_one(
+                {"id": job_id, "worker_id": worker_id, "status": "running"},
+                {"$set": update}
+            )
+            return bool(result.matched_count > 0)
+        except Exception as e:
+            raise DatabaseError(f"Failed to renew job lock: {str(e)}")
+    
+    async def _finish(self, job_id: str, worker_id: str, update: Dict[str, Any]) -> bool:
+        """Update a job still owned by the given worker."""
+        now = datetime.utcnow()
+        update.update({"updated_at": now, "locked_at": None})
+        try:
+            result = await self.collection.update_one(
+                {"id": job_id, "worker_id": worker_id, "status": "running"},
+                {"$set": update}
+            )
+            return bool(result.modified_count > 0)
+        except Exception as e:
+            raise DatabaseError(f"Failed to update job: {str(e)}")
+    
+    async def mark_succeeded(self, job_id: str, worker_id: str, result: Dict[str, Any]) -> bool:
+        """Record a successful job result."""
+        return await self._finish(job_id, worker_id, {
+            "status": "succeeded",
+            "result": result,
+            "error": None,
+            "finished_at": datetime.utcnow()
+        })
+    
+    async def mark_failed(
+        self,
+        job_id: str,
+        worker_id: str,
+        error: str,
+        retry: bool,
+        retry_delay: float = 0
+    ) -> bool:
+        """Record a job failure, putting it back in the queue after ``retry_delay`` seconds when retrying."""
+        update: Dict[str, Any] = {"status": "queued" if retry else "failed", "error": error}
+        if retry:
+            update["retry_at"] = datetime.utcnow() + timedelta(seconds=retry_delay)
+        else:
+            update["finished_at"] = datetime.utcnow()
+        return await self._finish(job_id, worker_id, update)
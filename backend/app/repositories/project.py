@@ -1,16 +1,34 @@
 """
 Project repository for database operations.
 """
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
+from pymongo import ASCENDING, IndexModel
 
-from app.models.project import Project
-from app.repositories.base import BaseRepository
+from app.core.exceptions import DatabaseError
+from app.models.project import Project, ProjectSummary
+from app.repositories.base import KEYSET_SORT, BaseRepository
+
+# Users listed in the per-user statistics breakdown
+TOP_USERS = 50
+# Holds the version of the project set, bumped on every create and delete
+VERSIONS_COLLECTION = "collection_versions"
 
 
 class ProjectRepository(BaseRepository):
     """Repository for project operations."""
     
+    indexes = BaseRepository.indexes + [
+        # Project names are GitHub repository names, unique per account
+        IndexModel([("name", ASCENDING)], unique=True, name="name_unique"),
+        IndexModel([("language", ASCENDING), ("template_id", ASCENDING)], name="language_template"),
+        # Filtered list pages, in keyset order
+        IndexModel([("language", ASCENDING), *KEYSET_SORT], name="language_created_at_id"),
+        IndexModel([("github_username", ASCENDING), *KEYSET_SORT], name="github_username_created_at_id")
+    ]
+    
+    summary_class = ProjectSummary
+    
     def __init__(self):
         super().__init__("projects", Project)
     
@@ -26,27 +44,87 @@ class ProjectRepository(BaseRepository):
         """Get projects by programming language."""
         return await self.get_all(filter_dict={"language": language})
     
-    async def get_recent_projects(self, limit: int = 10) -> List[Project]:
-        """Get recently created projects."""
-        return await self.get_all(limit=limit)
+    async def get_recent_projects(self, limit: int = 10) -> List[ProjectSummary]:
+        """Get summaries of recently created projects."""
+        projects, _ = await self.get_page(limit=limit, summary=True)
+        return projects
     
     async def update_status(self, project_id: str, status: str) -> Optional[Project]:
         """Update project status."""
         return await self.update(project_id, {"status": status})
     
+    @property
+    def versions(self) -> Any:
+        return self.collection.database[VERSIONS_COLLECTION]
+    
+    async def get_stats_version(self) -> int:
+        """
+        Version of the project set, shared by every process.
+        
+        Statistics cached under an older version are out of date. Reading
+        it is a single ``_id`` lookup, far cheaper than the aggregation.
+        """
+        try:
+            document = await self.versions.find_one({"_id": self.collection_name})
+        except Exception as e:
+            raise DatabaseError(f"Failed to read project stats version: {str(e)}")
+        return document["version"] if document else 0
+    
+    async def bump_stats_version(self) -> None:
+        """Mark cached project statistics stale in every process."""
+        try:
+            await self.versions.update_one({"_id": self.collection_name}, {"$inc": {"version": 1}}, upsert=True)
+        except Exception as e:
+            raise DatabaseError(f"Failed to bump project stats version: {str(e)}")
+    
     async def get_project_stats(self) -> dict:
-        """Get project statistics."""
-        total_projects = await self.count()
-        languages = await self.collection.distinct("language")
+        """
+        Get project statistics in a single aggregation.
         
-        stats = {
-            "total_projects": total_projects,
-            "languages": len(languages),
-            "language_breakdown": {}
-        }
+        Returns:
+            Total count and per-language, per-template and per-user
+            breakdowns (the users with most projects, up to ``TOP_USERS``)
+        """
+        def breakdown(field: str, limit: Optional[int] = None) -> List[dict]:
+            stages: List[dict] = [
+                {"$group": {"_id": f"${field}", "count": {"$sum": 1}}},
+                {"$sort": {"count": -1, "_id": 1}}
+            ]
+            if limit:
+                stages.append({"$limit": limit})
+            return stages
+        
+        pipeline = [
+            {
+                "$facet": {
+                    "total": [{"$count": "count"}],
+                    "languages": breakdown("language"),
+                    "templates": breakdown("template_id"),
+                    "users": breakdown("github_username", TOP_USERS),
+                    "user_count": [{"$group": {"_id": "$github_username"}}, {"$count": "count"}]
+                }
+            }
+        ]
         
-        for language in languages:
-            count = await self.count({"language": language})
-            stats["language_breakdown"][language] = count
+        try:
+            results = await self.collection.aggregate(pipeline).to_list(1)
+        except Exception as e:
+            raise DatabaseError(f"Failed to aggregate project statistics: {str(e)}")
+        facets = results[0] if results else {}
         
-        return stats
+        def counts(name: str) -> Dict[str, int]:
+            return {item["_id"]: item["count"] for item in facets.get(name, [])}
+        
+        def single(name: str) -> int:
+            items = facets.get(name)
+            return items[0]["count"] if items else 0
+        
+        language_breakdown = counts("languages")
+        return {
+            "total_projects": single("total"),
+            "languages": len(language_breakdown),
+            "language_breakdown": language_breakdown,
+            "template_breakdown": counts("templates"),
+            "users": single("user_count"),
+            "user_breakdown": counts("users")
+        }
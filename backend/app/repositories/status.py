@@ -1,22 +1,140 @@
 """
 Status check repository for database operations.
 """
-from typing import List, Optional
-from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import CollectionInvalid
 
-from app.models.status import StatusCheck
-from app.repositories.base import BaseRepository
+from app.config.settings import settings
+from app.core.exceptions import DatabaseError, ValidationError
+from app.core.logging import get_logger
+from app.models.status import StatusCheck, StatusCheckSummary
+from app.repositories.base import KEYSET_SORT, BaseRepository, pack_cursor, unpack_cursor
+
+logger = get_logger(__name__)
+
+# Measurements are bucketed by client, in time order
+TIMESERIES = {"timeField": "created_at", "metaField": "client_name", "granularity": "seconds"}
+
+# Newest first on the time field alone: a time-series collection can serve
+# it from its time index without a blocking sort, which (created_at, _id)
+# cannot, as measurement _ids are not indexed
+TIME_SORT = [("created_at", DESCENDING)]
+
+CLIENT_INDEX = IndexModel([("client_name", ASCENDING), *KEYSET_SORT], name="client_name_created_at_id")
+TTL_INDEX_NAME = "created_at_ttl"
 
 
 class StatusCheckRepository(BaseRepository):
-    """Repository for status check operations."""
+    """
+    Repository for status check operations.
+    
+    Checks are stored in a time-series collection that MongoDB expires
+    ``STATUS_RETENTION_DAYS`` after ``created_at``, so no request ever
+    deletes old checks. A collection created before this as a regular one
+    gets a TTL index instead; drop it to switch to time-series storage.
+    """
+    
+    # Time-series collections cannot have unique indexes, and the indexes
+    # they support on every server version are on the time and meta fields.
+    # Keyset pages sort on created_at only and end where the timestamp
+    # changes, so the cursor needs no _id to order ties by.
+    # tests/integration/test_indexes.py explains these queries.
+    indexes = [
+        IndexModel([("created_at", DESCENDING)], name="created_at_desc"),
+        IndexModel([("client_name", ASCENDING), ("created_at", DESCENDING)], name="client_name_created_at")
+    ]
+    
+    summary_class = StatusCheckSummary
+    keyset_sort = TIME_SORT
     
     def __init__(self):
         super().__init__("status_checks", StatusCheck)
+        self.retention = settings.status_retention_days * 24 * 60 * 60
+    
+    async def ensure_collection(self) -> None:
+        """Create the time-series collection, or bring its retention in line with the settings."""
+        db = self.collection.database
+        try:
+            cursor = await db.list_collections(filter={"name": self.collection_name})
+            info = next(iter(await cursor.to_list(1)), None)
+            if info is None:
+                await db.create_collection(
+                    self.collection_name,
+                    timeseries=TIMESERIES,
+                    expireAfterSeconds=self.retention
+                )
+                logger.info(f"Created time-series collection {self.collection_name}")
+            elif info.get("type") == "timeseries":
+                if info["options"].get("expireAfterSeconds") != self.retention:
+                    await db.command("collMod", self.collection_name, expireAfterSeconds=self.retention)
+            else:
+                logger.warning(
+                    f"{self.collection_name} is a regular collection; expiring checks with a TTL index. "
+                    f"Drop it to switch to time-series storage"
+                )
+                await self._ensure_ttl_index()
+        except CollectionInvalid:
+            # Another process created it first
+            pass
+        except Exception as e:
+            raise DatabaseError(f"Failed to prepare {self.collection_name}: {str(e)}")
+    
+    async def _ensure_ttl_index(self) -> None:
+        self.indexes = BaseRepository.indexes + [
+            CLIENT_INDEX,
+            IndexModel([("created_at", ASCENDING)], expireAfterSeconds=self.retention, name=TTL_INDEX_NAME)
+        ]
+        existing = (await self.collection.index_information()).get(TTL_INDEX_NAME)
+        if existing is not None and existing.get("expireAfterSeconds") != self.retention:
+            await self.collection.database.command(
+                "collMod",
+                self.collection_name,
+                index={"name": TTL_INDEX_NAME, "expireAfterSeconds": self.retention}
+            )
+    
+    async def read_page(
+        self,
+        query: Dict[str, Any],
+        projection: Optional[Dict[str, Any]],
+        skip: int,
+        limit: int
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Documents of one page, ending on a timestamp boundary.
+        
+        Checks sharing the last timestamp of a full page move to the next
+        page, so the cursor is that timestamp alone. When they fill the
+        whole page, the rest of them is read and returned with it instead.
+        """
+        documents, _ = await super().read_page(query, projection, skip, limit + 1)
+        if len(documents) <= limit:
+            return documents, False
+        
+        page, boundary = documents[:limit], documents[limit]["created_at"]
+        complete = [document for document in page if document["created_at"] != boundary]
+        if complete:
+            return complete, True
+        ties = {"created_at": boundary, "_id": {"$nin": [document["_id"] for document in page]}}
+        rest = await self.collection.find({"$and": [query, ties]}, projection).to_list(None)
+        return page + rest, True
+    
+    def page_cursor(self, page: List[Dict[str, Any]], after: Optional[str]) -> str:
+        """Token holding the page's last timestamp."""
+        return pack_cursor(page[-1]["created_at"].isoformat())
+    
+    def cursor_filter(self, token: str) -> Dict[str, Any]:
+        """Checks older than the cursor's timestamp."""
+        try:
+            created_at = datetime.fromisoformat(unpack_cursor(token))
+        except (ValueError, TypeError):
+            raise ValidationError("Invalid pagination cursor")
+        return {"created_at": {"$lt": created_at}}
     
     async def get_recent_checks(self, limit: int = 100) -> List[StatusCheck]:
         """Get recent status checks."""
-        return await self.get_all(limit=limit)
+        return await self.get_all(limit=limit, sort=self.keyset_sort)
     
     async def get_by_client(self, client_name: str) -> List[StatusCheck]:
         """Get status checks by client name."""
@@ -25,39 +143,3 @@ class StatusCheckRepository(BaseRepository):
     async def get_checks_since(self, since: datetime) -> List[StatusCheck]:
         """Get status checks since a specific time."""
         return await self.get_all(filter_dict={"created_at": {"$gte": since}})
-    
-    async def cleanup_old_checks(self, days: int = 30) -> int:
-        """Remove status checks older than specified days."""
-        cutoff_date = datetime.utcnow() - timedelta(days=days)
-        result = await self.collection.delete_many({
-            "created_at": {"$lt": cutoff_date}
-        })
-        return result.deleted_count
-    
-    async def get_client_stats(self) -> dict:
-        """Get statistics about client status checks."""
-        pipeline = [
-            {
-                "$group": {
-                    "_id": "$client_name",
-                    "count": {"$sum": 1},
-                    "last_check": {"$max": "$created_at"}
-                }
-            },
-            {
-                "$sort": {"count": -1}
-            }
-        ]
-        
-        stats = []
-        async for result in self.collection.aggregate(pipeline):
-            stats.append({
-                "client_name": result["_id"],
-                "check_count": result["count"],
-                "last_check": result["last_check"]
-            })
-        
-        return {
-            "total_clients": len(stats),
-            "clients": stats
-        }
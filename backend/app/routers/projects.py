@@ -2,16 +2,17 @@
 Project-related API endpoints.
 """
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, Header, HTTPException, Query, Depends
 import logging
 
+from app.config.settings import settings
 from app.core.logging import get_logger
 from app.core.exceptions import ValidationError, NotFoundError, DatabaseError
-from app.models.project import Project, ProjectRequest, ProjectResponse, ProjectListResponse
+from app.models.job import Job, JobResponse
+from app.models.project import Project, ProjectRequest, ProjectListResponse, ProjectSummary
+from app.dependencies import get_project_service
 from app.services.project_service import ProjectService
-from app.services.github_service import GitHubService
-from app.services.template_service import TemplateService
-from app.repositories.project import ProjectRepository
+from app.utils.responses import negotiate_stream_format, read_json, stream_json
 
 logger = get_logger(__name__)
 
@@ -19,30 +20,31 @@ logger = get_logger(__name__)
 router = APIRouter(prefix="/projects", tags=["projects"])
 
 
-def get_project_service() -> ProjectService:
-    """Dependency to get project service instance."""
-    project_repo = ProjectRepository()
-    github_service = GitHubService()
-    template_service = TemplateService()
-    return ProjectService(project_repo, github_service, template_service)
-
-
-@router.post("/", response_model=ProjectResponse, status_code=201)
+@router.post("/", response_model=JobResponse, status_code=202)
 async def create_project(
     request: ProjectRequest,
     project_service: ProjectService = Depends(get_project_service)
 ):
     """
-    Create a new project with GitHub repository.
+    Queue creation of a new project with GitHub repository.
     
     - **name**: Project name (will be used as repository name)
     - **description**: Project description
     - **language**: Programming language (java, dotnet, etc.)
     - **template_id**: Template identifier
     - **github_username**: GitHub username for the repository
+    
+    Generation runs in a background worker; poll the returned status URL
+    for the result.
     """
     try:
-        return await project_service.create_project(request)
+        job = await project_service.submit_project(request)
+        return JobResponse(
+            message=f"Project '{request.name}' queued for generation",
+            job_id=job.id,
+            status=job.status,
+            status_url=f"{settings.api_prefix}/projects/jobs/{job.id}"
+        )
     except ValidationError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -50,38 +52,136 @@ async def create_project(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@router.post("/upgrade", response_model=JobResponse, status_code=202)
+async def upgrade_projects(
+    language: Optional[str] = Query(None, description="Only upgrade projects of this language"),
+    template_id: Optional[str] = Query(None, description="Only upgrade projects of this template"),
+    force: bool = Query(False, description="Compare repositories even if their template is unchanged"),
+    project_service: ProjectService = Depends(get_project_service)
+):
+    """
+    Queue an upgrade of every generated repository to its current template.
+    
+    - **language**: Only upgrade projects of this language
+    - **template_id**: Only upgrade projects of this template
+    - **force**: Compare repositories even if their template is unchanged
+    
+    Projects are upgraded in a background worker a few at a time; the job
+    result holds the counts of upgraded, unchanged, skipped and failed
+    projects.
+    """
+    try:
+        job = await project_service.submit_fleet_upgrade(language, template_id, force)
+        return JobResponse(
+            message="Project upgrade queued",
+            job_id=job.id,
+            status=job.status,
+            status_url=f"{settings.api_prefix}/projects/jobs/{job.id}"
+        )
+    except DatabaseError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error queueing project upgrade: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.post("/{project_id}/upgrade", response_model=JobResponse, status_code=202)
+async def upgrade_project(
+    project_id: str,
+    force: bool = Query(False, description="Compare the repository even if the template is unchanged"),
+    project_service: ProjectService = Depends(get_project_service)
+):
+    """
+    Queue an upgrade of a project's repository to its current template.
+    
+    - **project_id**: Project identifier
+    - **force**: Compare the repository even if the template is unchanged
+    
+    The template is rendered again and only files that differ from the
+    repository's default branch are pushed, as one commit.
+    """
+    try:
+        job = await project_service.submit_upgrade(project_id, force)
+        return JobResponse(
+            message=f"Upgrade of project '{project_id}' queued",
+            job_id=job.id,
+            status=job.status,
+            status_url=f"{settings.api_prefix}/projects/jobs/{job.id}"
+        )
+    except NotFoundError:
+        raise HTTPException(status_code=404, detail="Project not found")
+    except DatabaseError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error queueing upgrade of project {project_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.get("/jobs/{job_id}", response_model=Job)
+async def get_job(
+    job_id: str,
+    project_service: ProjectService = Depends(get_project_service)
+):
+    """
+    Get the status of a project generation job.
+    
+    - **job_id**: Job identifier returned when the project was submitted
+    """
+    try:
+        job = await project_service.get_job(job_id)
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+        return read_json(job)
+    except DatabaseError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting job {job_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
 @router.get("/", response_model=ProjectListResponse)
 async def get_projects(
-    skip: int = Query(0, ge=0, description="Number of projects to skip"),
+    after: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
+    skip: int = Query(0, ge=0, description="Number of projects to skip (deprecated, use after)"),
     limit: int = Query(50, ge=1, le=100, description="Maximum number of projects to return"),
     language: Optional[str] = Query(None, description="Filter by programming language"),
     github_username: Optional[str] = Query(None, description="Filter by GitHub username"),
     project_service: ProjectService = Depends(get_project_service)
 ):
     """
-    Get projects with optional filtering and pagination.
+    Get project summaries with optional filtering, newest first.
     
-    - **skip**: Number of projects to skip (for pagination)
+    - **after**: Cursor returned as `next_cursor` by the previous page
+    - **skip**: Number of projects to skip (deprecated; deep offsets are slow)
     - **limit**: Maximum number of projects to return (1-100)
     - **language**: Filter by programming language
     - **github_username**: Filter by GitHub username
+    
+    `next_cursor` is null on the last page. Entries leave out the project
+    metadata; get a project by id for the full document.
     """
     try:
-        projects = await project_service.get_projects(
+        projects, next_cursor = await project_service.get_projects(
             skip=skip,
             limit=limit,
             language=language,
-            github_username=github_username
+            github_username=github_username,
+            after=after
         )
         
-        total = await project_service.project_repository.count()
+        total = await project_service.count_projects(language, github_username)
         
-        return ProjectListResponse(
+        return read_json(ProjectListResponse(
             projects=projects,
             total=total,
             page=(skip // limit) + 1,
-            page_size=limit
-        )
+            page_size=limit,
+            next_cursor=next_cursor
+        ), trusted=projects)
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except DatabaseError as e:
         raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
@@ -89,6 +189,44 @@ async def get_projects(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@router.get("/export", response_model=List[ProjectSummary])
+async def export_projects(
+    stream_format: Optional[str] = Query(None, alias="format", description="json or ndjson"),
+    language: Optional[str] = Query(None, description="Filter by programming language"),
+    github_username: Optional[str] = Query(None, description="Filter by GitHub username"),
+    full: bool = Query(False, description="Include project metadata"),
+    accept: Optional[str] = Header(None),
+    project_service: ProjectService = Depends(get_project_service)
+):
+    """
+    Stream every matching project, newest first.
+    
+    - **format**: `json` (a JSON array) or `ndjson` (one project per line);
+      defaults to NDJSON when the Accept header asks for
+      `application/x-ndjson`, to a JSON array otherwise
+    - **language**: Filter by programming language
+    - **github_username**: Filter by GitHub username
+    - **full**: Return full projects with metadata instead of summaries
+    
+    Projects are sent as they are read from the database cursor, so the
+    response starts right away and memory does not grow with the
+    collection.
+    """
+    try:
+        stream_format = negotiate_stream_format(stream_format, accept)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    try:
+        projects = project_service.iter_projects(language, github_username, summary=not full)
+        return await stream_json(projects, stream_format)
+    except DatabaseError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error exporting projects: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
 @router.get("/{project_id}", response_model=Project)
 async def get_project(
     project_id: str,
@@ -103,7 +241,7 @@ async def get_project(
         project = await project_service.get_project_by_id(project_id)
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
-        return project
+        return read_json(project)
     except DatabaseError as e:
         raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
@@ -125,7 +263,7 @@ async def get_project_by_name(
         project = await project_service.get_project_by_name(project_name)
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
-        return project
+        return read_json(project)
     except DatabaseError as e:
         raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
@@ -133,18 +271,18 @@ async def get_project_by_name(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@router.get("/recent/", response_model=List[Project])
+@router.get("/recent/", response_model=List[ProjectSummary])
 async def get_recent_projects(
     limit: int = Query(10, ge=1, le=50, description="Maximum number of recent projects"),
     project_service: ProjectService = Depends(get_project_service)
 ):
     """
-    Get recently created projects.
+    Get summaries of recently created projects.
     
     - **limit**: Maximum number of projects to return (1-50)
     """
     try:
-        return await project_service.get_recent_projects(limit)
+        return read_json(await project_service.get_recent_projects(limit))
     except DatabaseError as e:
         raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
@@ -184,6 +322,11 @@ async def get_project_statistics(
 ):
     """
     Get project statistics and overview.
+    
+    Totals and per-language, per-template and per-user counts from one
+    aggregation, cached for ``CACHE_TTL`` seconds. Projects created or
+    deleted by other processes show up within ``STATS_VERSION_TTL``
+    seconds.
     """
     try:
         return await project_service.get_project_statistics()
@@ -1,17 +1,29 @@
 """
 Status and health check API endpoints.
 """
-from typing import List
-from fastapi import APIRouter, HTTPException, Depends
+from typing import List, Optional
+from fastapi import APIRouter, Header, HTTPException, Depends, Query, Response
 from datetime import datetime
 import logging
 
 from app.core.logging import get_logger
-from app.core.exceptions import DatabaseError
-from app.models.status import StatusCheck, StatusCheckCreate, HealthCheck
+from app.core.exceptions import DatabaseError, ServiceUnavailableError, ValidationError
+from app.models.status import StatusCheck, StatusCheckCreate, StatusCheckSummary, HealthCheck
+from app.dependencies import (
+    get_client_stats_repository,
+    get_github_service,
+    get_status_buffer,
+    get_status_repository,
+    get_template_service
+)
 from app.repositories.status import StatusCheckRepository
 from app.services.github_service import GitHubService
+from app.services.status_buffer import StatusCheckBuffer
+from app.services.template_service import TemplateService
 from app.core.database import database
+from app.config.settings import settings
+from app.repositories.client_stats import ClientStatsRepository
+from app.utils.responses import negotiate_stream_format, read_json, stream_json, trusted_json
 
 logger = get_logger(__name__)
 
@@ -22,16 +34,6 @@ router = APIRouter(prefix="/status", tags=["status"])
 app_start_time = datetime.utcnow()
 
 
-def get_status_repository() -> StatusCheckRepository:
-    """Dependency to get status check repository instance."""
-    return StatusCheckRepository()
-
-
-def get_github_service() -> GitHubService:
-    """Dependency to get GitHub service instance."""
-    return GitHubService()
-
-
 @router.get("/health", response_model=HealthCheck)
 async def health_check(
     github_service: GitHubService = Depends(get_github_service)
@@ -76,16 +78,43 @@ async def health_check(
         raise HTTPException(status_code=500, detail="Health check failed")
 
 
-@router.post("/check", response_model=StatusCheck, status_code=201)
+@router.get("/metrics")
+async def get_metrics(
+    github_service: GitHubService = Depends(get_github_service),
+    template_service: TemplateService = Depends(get_template_service),
+    status_buffer: StatusCheckBuffer = Depends(get_status_buffer)
+):
+    """
+    Get runtime metrics.
+    
+    Returns the GitHub API budget (limit, remaining calls, reset time), the
+    scheduler state (concurrency, in-flight and queued calls), the
+    rendered template cache statistics, the template blob store size and
+    the status check buffer depth and flush latency.
+    """
+    return {
+        "github": github_service.client.scheduler.snapshot(),
+        "render_cache": template_service.render_cache.snapshot(),
+        "blob_store": template_service.store.blobs.snapshot(),
+        "status_buffer": status_buffer.snapshot()
+    }
+
+
+@router.post("/check", response_model=StatusCheck, status_code=202)
 async def create_status_check(
     request: StatusCheckCreate,
-    status_repository: StatusCheckRepository = Depends(get_status_repository)
+    status_buffer: StatusCheckBuffer = Depends(get_status_buffer)
 ):
     """
-    Create a new status check record.
+    Record a status check.
     
     - **client_name**: Name of the client making the check
     - **metadata**: Additional metadata (optional)
+    
+    The check is queued and written with others in one batch shortly
+    after, so it can take up to ``STATUS_BUFFER_FLUSH_INTERVAL`` seconds
+    to show up in the lists. Answers 503 with ``Retry-After`` while the
+    queue is full.
     """
     try:
         status_check = StatusCheck(
@@ -93,28 +122,45 @@ async def create_status_check(
             metadata=request.metadata
         )
         
-        created_check = await status_repository.create(status_check)
-        logger.info(f"Status check created for client: {request.client_name}")
+        queued_check = await status_buffer.submit(status_check)
+        logger.debug(f"Status check queued for client: {request.client_name}")
         
-        return created_check
+        # Built here from the validated request
+        return trusted_json(queued_check, status_code=202)
+    except ServiceUnavailableError as e:
+        retry_after = max(1, round(status_buffer.flush_interval))
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(retry_after)})
     except Exception as e:
         logger.error(f"Error creating status check: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to create status check")
 
 
-@router.get("/checks", response_model=List[StatusCheck])
+@router.get("/checks", response_model=List[StatusCheckSummary])
 async def get_status_checks(
-    limit: int = 100,
+    response: Response,
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of status checks to return"),
+    after: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header"),
     status_repository: StatusCheckRepository = Depends(get_status_repository)
 ):
     """
-    Get recent status checks.
+    Get summaries of recent status checks, newest first.
     
     - **limit**: Maximum number of status checks to return (default: 100)
+    - **after**: Cursor from the `X-Next-Cursor` header of the previous page
+    
+    The `X-Next-Cursor` response header is set while more pages remain.
+    Pages end where the check timestamp changes, so a page can hold fewer
+    checks than `limit`, or more when more checks share one timestamp.
+    Entries leave out the check metadata; the per-client endpoint returns
+    full documents.
     """
     try:
-        checks = await status_repository.get_recent_checks(limit)
-        return checks
+        checks, next_cursor = await status_repository.get_page(limit=limit, after=after, summary=True)
+        headers = {"X-Next-Cursor": next_cursor} if next_cursor else {}
+        response.headers.update(headers)
+        return read_json(checks, headers=headers)
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except DatabaseError as e:
         raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
@@ -122,67 +168,79 @@ async def get_status_checks(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@router.get("/checks/client/{client_name}", response_model=List[StatusCheck])
-async def get_status_checks_by_client(
-    client_name: str,
+@router.get("/checks/export", response_model=List[StatusCheckSummary])
+async def export_status_checks(
+    stream_format: Optional[str] = Query(None, alias="format", description="json or ndjson"),
+    client_name: Optional[str] = Query(None, description="Only checks of this client"),
+    accept: Optional[str] = Header(None),
     status_repository: StatusCheckRepository = Depends(get_status_repository)
 ):
     """
-    Get status checks for a specific client.
+    Stream summaries of every status check, newest first.
     
-    - **client_name**: Name of the client
+    - **format**: `json` (a JSON array) or `ndjson` (one check per line);
+      defaults to NDJSON when the Accept header asks for
+      `application/x-ndjson`, to a JSON array otherwise
+    - **client_name**: Only checks of this client
+    
+    Checks are sent as they are read from the database cursor.
     """
     try:
-        checks = await status_repository.get_by_client(client_name)
-        return checks
+        stream_format = negotiate_stream_format(stream_format, accept)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    try:
+        checks = status_repository.iter_all(
+            {"client_name": client_name} if client_name else None,
+            sort=status_repository.keyset_sort,
+            summary=True,
+            batch_size=settings.stream_batch_size
+        )
+        return await stream_json(checks, stream_format)
     except DatabaseError as e:
         raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
-        logger.error(f"Error getting status checks for client {client_name}: {str(e)}")
+        logger.error(f"Error exporting status checks: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@router.get("/stats/clients")
-async def get_client_statistics(
+@router.get("/checks/client/{client_name}", response_model=List[StatusCheck])
+async def get_status_checks_by_client(
+    client_name: str,
     status_repository: StatusCheckRepository = Depends(get_status_repository)
 ):
     """
-    Get statistics about client status checks.
+    Get status checks for a specific client.
     
-    Returns information about clients and their check frequency.
+    - **client_name**: Name of the client
     """
     try:
-        stats = await status_repository.get_client_stats()
-        return stats
+        checks = await status_repository.get_by_client(client_name)
+        return read_json(checks)
     except DatabaseError as e:
         raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
-        logger.error(f"Error getting client statistics: {str(e)}")
+        logger.error(f"Error getting status checks for client {client_name}: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@router.delete("/cleanup")
-async def cleanup_old_status_checks(
-    days: int = 30,
-    status_repository: StatusCheckRepository = Depends(get_status_repository)
+@router.get("/stats/clients")
+async def get_client_statistics(
+    stats_repository: ClientStatsRepository = Depends(get_client_stats_repository)
 ):
     """
-    Clean up old status checks.
-    
-    - **days**: Number of days to keep status checks (default: 30)
+    Get statistics about client status checks.
     
-    Removes status checks older than the specified number of days.
+    Returns every client with its check count and first and last check,
+    busiest first. The counters are kept up to date as checks are written,
+    so this reads one small summary document per client; counts include
+    checks that have since expired.
     """
     try:
-        deleted_count = await status_repository.cleanup_old_checks(days)
-        logger.info(f"Cleaned up {deleted_count} old status checks")
-        
-        return {
-            "message": f"Cleaned up {deleted_count} status checks older than {days} days",
-            "deleted_count": deleted_count
-        }
+        return await stats_repository.get_client_stats()
     except DatabaseError as e:
         raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
-        logger.error(f"Error cleaning up status checks: {str(e)}")
+        logger.error(f"Error getting client statistics: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
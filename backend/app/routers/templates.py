@@ -1,24 +1,86 @@
 """
 Template-related API endpoints.
 """
-from typing import List
-from fastapi import APIRouter, HTTPException, Depends
+from typing import List, Optional, Tuple
+from urllib.parse import quote
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 import logging
+import re
 
 from app.core.logging import get_logger
 from app.core.exceptions import ValidationError
 from app.models.template import LanguageListResponse, TemplateListResponse
+from app.dependencies import get_template_service
+from app.services.archive import ARCHIVE_FORMATS, stream_archive
 from app.services.template_service import TemplateService
+from app.utils.validators import validate_project_name
 
 logger = get_logger(__name__)
 
 # Create router
 router = APIRouter(prefix="/templates", tags=["templates"])
 
+# Characters kept as they are in the plain Content-Disposition filename
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9._-]")
 
-def get_template_service() -> TemplateService:
-    """Dependency to get template service instance."""
-    return TemplateService()
+
+def _content_disposition(filename: str) -> str:
+    """
+    Attachment header for a user-supplied filename.
+    
+    The plain ``filename`` replaces anything outside ``[A-Za-z0-9._-]``,
+    so whitespace and control characters never reach the header; the
+    RFC 5987 ``filename*`` carries the exact name for clients that read it.
+    """
+    fallback = _UNSAFE_FILENAME_CHARS.sub("_", filename)
+    return f"attachment; filename=\"{fallback}\"; filename*=UTF-8''{quote(filename, safe='')}"
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an entity tag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return any(tag[2:] == etag if tag.startswith("W/") else tag == etag for tag in tags)
+
+
+def _parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single ``Range: bytes=...`` header.
+    
+    Args:
+        header: Range header value
+        size: Size of the full representation in bytes
+    
+    Returns:
+        Inclusive (start, end) byte positions, or None to send everything
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        # Missing, other units or multiple ranges: serve the whole file
+        return None
+    
+    start_text, _, end_text = header[len("bytes="):].strip().partition("-")
+    try:
+        if start_text:
+            start = int(start_text)
+            end = int(end_text) if end_text else size - 1
+        else:
+            # Suffix range: the last N bytes
+            start = max(size - int(end_text), 0)
+            end = size - 1
+    except ValueError:
+        return None
+    
+    if start >= size or end < start:
+        raise HTTPException(
+            status_code=416,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"}
+        )
+    return start, min(end, size - 1)
 
 
 @router.get("/languages", response_model=LanguageListResponse)
@@ -83,12 +145,19 @@ async def get_template_details(
     """
     try:
         template = template_service.get_template(language, template_id)
+        compiled = template_service.get_compiled_template(template)
         return {
             "template": template,
             "variables": template.variables,
+            "required_variables": sorted(compiled.variables),
+            "file_variables": {
+                path: sorted(names)
+                for path, names in compiled.file_variables.items() if names
+            },
             "dependencies": template.dependencies,
             "setup_instructions": template.setup_instructions,
-            "file_count": len(template.files)
+            "file_count": len(template.files),
+            "static_file_count": compiled.static_count
         }
     except ValidationError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -99,21 +168,27 @@ async def get_template_details(
 
 @router.get("/{language}/{template_id}/preview")
 async def preview_template(
+    request: Request,
     language: str,
     template_id: str,
     project_name: str = "my-project",
     project_description: str = "A sample project",
+    offset: int = Query(default=0, ge=0, description="Index of the first file"),
+    limit: int = Query(default=100, ge=1, le=500, description="Maximum number of files"),
     template_service: TemplateService = Depends(get_template_service)
 ):
     """
-    Preview a template with sample variables.
+    Preview a template: list the files it generates, with their sizes.
     
     - **language**: Programming language
     - **template_id**: Template identifier
     - **project_name**: Sample project name
     - **project_description**: Sample project description
+    - **offset** / **limit**: Page of the file list
     
-    Returns a preview of the template files with variables substituted.
+    Sizes are computed without rendering any file content. Fetch the content
+    of a file from `/preview/{file_path}`. Responses carry an ETag and
+    answer `If-None-Match` with 304 Not Modified.
     """
     try:
         template = template_service.get_template(language, template_id)
@@ -127,27 +202,120 @@ async def preview_template(
         # Validate variables
         template_service.validate_template_variables(template, variables)
         
-        # Process template
-        processed_files = template_service.process_template(template, variables)
+        etag = template_service.render_etag(template, variables, "files", str(offset), str(limit))
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers={"ETag": etag})
         
-        # Return preview (limit file content for response size)
-        preview_files = {}
-        for file_path, content in processed_files.items():
-            # Truncate large files for preview
-            if len(content) > 1000:
-                content = content[:1000] + "\n... (truncated for preview)"
-            preview_files[file_path] = content
+        files = template_service.list_rendered_files(template, variables)
+        page = files[offset:offset + limit]
         
-        return {
+        return JSONResponse({
             "template_id": template.id,
             "template_name": template.name,
             "language": template.language,
-            "files": preview_files,
-            "total_files": len(processed_files),
+            "files": [{"path": path, "size": size} for path, size in page],
+            "total_files": len(files),
+            "total_size": sum(size for _, size in files),
+            "offset": offset,
+            "limit": limit,
             "variables_used": variables
-        }
+        }, headers={"ETag": etag})
     except ValidationError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error previewing template {template_id}: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.get("/{language}/{template_id}/preview/{file_path:path}")
+async def preview_template_file(
+    request: Request,
+    language: str,
+    template_id: str,
+    file_path: str,
+    project_name: str = "my-project",
+    project_description: str = "A sample project",
+    template_service: TemplateService = Depends(get_template_service)
+):
+    """
+    Render a single file of a template preview.
+    
+    - **file_path**: Rendered path of the file, as listed by `/preview`
+    
+    Only the requested file is rendered. Supports `Range: bytes=...` for
+    partial content and `If-None-Match` for 304 Not Modified.
+    """
+    try:
+        template = template_service.get_template(language, template_id)
+        variables = {
+            "project_name": project_name,
+            "project_description": project_description
+        }
+        template_service.validate_template_variables(template, variables)
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    etag = template_service.render_etag(template, variables, "file", file_path)
+    headers = {"ETag": etag, "Accept-Ranges": "bytes"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    
+    content = template_service.render_file(template, variables, file_path)
+    if content is None:
+        raise HTTPException(status_code=404, detail=f"File '{file_path}' not found in template '{template_id}'")
+    
+    data = content.encode("utf-8")
+    byte_range = _parse_range(request.headers.get("range"), len(data))
+    if byte_range is None:
+        return Response(data, media_type="text/plain; charset=utf-8", headers=headers)
+    
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{len(data)}"
+    return Response(data[start:end + 1], status_code=206, media_type="text/plain; charset=utf-8", headers=headers)
+
+
+@router.get("/{language}/{template_id}/archive")
+async def download_template_archive(
+    language: str,
+    template_id: str,
+    project_name: str = "my-project",
+    project_description: str = "A sample project",
+    archive_format: str = Query(default="zip", alias="format", description="zip or tar.gz"),
+    template_service: TemplateService = Depends(get_template_service)
+):
+    """
+    Download a generated project as an archive, without GitHub.
+    
+    - **language**: Programming language
+    - **template_id**: Template identifier
+    - **project_name**: Project name, also the archive's top-level directory
+    - **project_description**: Project description
+    - **format**: Archive format, `zip` (default) or `tar.gz`
+    
+    The archive is streamed while it is being built, one file at a time.
+    """
+    if archive_format not in ARCHIVE_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported archive format '{archive_format}', use one of: {', '.join(ARCHIVE_FORMATS)}"
+        )
+    if not validate_project_name(project_name):
+        raise HTTPException(status_code=400, detail="Invalid project name")
+    
+    try:
+        template = template_service.get_template(language, template_id)
+        variables = {
+            "project_name": project_name,
+            "project_description": project_description
+        }
+        template_service.validate_template_variables(template, variables)
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    media_type, extension = ARCHIVE_FORMATS[archive_format]
+    files = template_service.iter_template_files(template, variables)
+    return StreamingResponse(
+        stream_archive(files, project_name, archive_format),
+        media_type=media_type,
+        headers={"Content-Disposition": _content_disposition(f"{project_name}{extension}")}
+    )
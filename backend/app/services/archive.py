@@ -0,0 +1,123 @@
+"""
+Streaming ZIP and tar.gz archives of rendered projects.
+
+The archive writers emit bytes through a sink that is drained after every
+chunk, so a response built on ``stream_archive`` sends the archive while it
+is being produced and never holds more than one file plus one compressed
+chunk in memory.
+"""
+import io
+import tarfile
+import time
+import zipfile
+from typing import Any, Iterable, Iterator, List, Tuple
+
+# format -> (media type, file extension)
+ARCHIVE_FORMATS = {
+    "zip": ("application/zip", ".zip"),
+    "tar.gz": ("application/gzip", ".tar.gz"),
+}
+
+CHUNK_SIZE = 64 * 1024
+
+
+class _Sink(io.RawIOBase):
+    """Write-only, non-seekable buffer that hands out what was written."""
+    
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+    
+    def writable(self) -> bool:
+        return True
+    
+    def write(self, data: Any) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+    
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _member_name(root: str, path: str) -> str:
+    return f"{root}/{path}" if root else path
+
+
+def stream_zip(files: Iterable[Tuple[str, str]], root: str = "") -> Iterator[bytes]:
+    """
+    Write files into a ZIP archive, yielding it chunk by chunk.
+    
+    Args:
+        files: (path, content) pairs, consumed lazily
+        root: Directory all files are placed under
+    
+    Yields:
+        Archive bytes
+    """
+    sink = _Sink()
+    date_time = time.localtime()[:6]
+    # zipfile writes data descriptors when the target cannot seek
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for path, content in files:
+            info = zipfile.ZipInfo(_member_name(root, path), date_time=date_time)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o644 << 16
+            data = memoryview(content.encode("utf-8"))
+            with archive.open(info, "w") as entry:
+                for start in range(0, len(data), CHUNK_SIZE):
+                    entry.write(data[start:start + CHUNK_SIZE])
+                    chunk = sink.drain()
+                    if chunk:
+                        yield chunk
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    yield sink.drain()
+
+
+def stream_tar_gz(files: Iterable[Tuple[str, str]], root: str = "") -> Iterator[bytes]:
+    """
+    Write files into a gzip-compressed tar archive, yielding it chunk by chunk.
+    
+    Args:
+        files: (path, content) pairs, consumed lazily
+        root: Directory all files are placed under
+    
+    Yields:
+        Archive bytes
+    """
+    sink = _Sink()
+    mtime = int(time.time())
+    # "w|gz" is tarfile's streaming mode: it never seeks on the target
+    with tarfile.open(fileobj=sink, mode="w|gz") as archive:
+        for path, content in files:
+            data = content.encode("utf-8")
+            info = tarfile.TarInfo(_member_name(root, path))
+            info.size = len(data)
+            info.mtime = mtime
+            info.mode = 0o644
+            archive.addfile(info, io.BytesIO(data))
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    yield sink.drain()
+
+
+def stream_archive(files: Iterable[Tuple[str, str]], root: str, archive_format: str) -> Iterator[bytes]:
+    """
+    Stream files as an archive of the given format.
+    
+    Args:
+        files: (path, content) pairs, consumed lazily
+        root: Directory all files are placed under
+        archive_format: One of ``ARCHIVE_FORMATS``
+    
+    Returns:
+        Iterator of archive bytes
+    """
+    if archive_format == "zip":
+        return stream_zip(files, root)
+    if archive_format == "tar.gz":
+        return stream_tar_gz(files, root)
+    raise ValueError(f"Unsupported archive format '{archive_format}'")
@@ -0,0 +1,96 @@
+"""
+Content-addressed store of template file contents.
+
+Template packs share many identical files (the same CI, security and
+release workflows ship with every Java template). Loading them through the
+store keeps one string per unique content, keyed by its git blob SHA, so
+the SHA of a static file is known before it is ever pushed. Rendering
+returns static files by reference, which lets ``sha`` find the precomputed
+SHA by object identity instead of hashing the content again.
+"""
+import hashlib
+from typing import Dict, Iterable, Optional, Tuple
+
+
+def git_blob_sha(content: str) -> str:
+    """SHA-1 of a text file as git stores it (``blob <size>\\0<data>``)."""
+    data = content.encode("utf-8")
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+class BlobStore:
+    """Reference-counted, deduplicated file contents keyed by git blob SHA."""
+    
+    def __init__(self) -> None:
+        self._blobs: Dict[str, str] = {}
+        self._refs: Dict[str, int] = {}
+        # id(content) -> (sha, content); holding the content keeps the id valid
+        self._by_id: Dict[int, Tuple[str, str]] = {}
+        self.hashed = 0
+    
+    def __len__(self) -> int:
+        return len(self._blobs)
+    
+    def __contains__(self, sha: str) -> bool:
+        return sha in self._blobs
+    
+    def intern(self, content: str, sha: Optional[str] = None) -> str:
+        """
+        Add a content reference to the store.
+        
+        Args:
+            content: File content
+            sha: Git blob SHA of ``content`` when already known, e.g. from a
+                catalog snapshot; it is computed otherwise
+        
+        Returns:
+            The shared string for this content, which may be a different
+            object from ``content``
+        """
+        if sha is None:
+            sha = git_blob_sha(content)
+            self.hashed += 1
+        shared = self._blobs.get(sha)
+        if shared is None:
+            shared = self._blobs[sha] = content
+            self._by_id[id(shared)] = (sha, shared)
+        self._refs[sha] = self._refs.get(sha, 0) + 1
+        return shared
+    
+    def release(self, contents: Iterable[str]) -> None:
+        """Drop one reference to each content; unused blobs are freed."""
+        for content in contents:
+            entry = self._by_id.get(id(content))
+            if entry is None or entry[1] is not content:
+                continue
+            sha = entry[0]
+            self._refs[sha] -= 1
+            if self._refs[sha] <= 0:
+                del self._refs[sha]
+                del self._blobs[sha]
+                del self._by_id[id(content)]
+    
+    def get(self, sha: str) -> str:
+        """Content of a stored blob; raises KeyError when unknown."""
+        return self._blobs[sha]
+    
+    def sha(self, content: str) -> str:
+        """Git blob SHA of a content, precomputed when it is a stored blob."""
+        entry = self._by_id.get(id(content))
+        if entry is not None and entry[1] is content:
+            return entry[0]
+        self.hashed += 1
+        return git_blob_sha(content)
+    
+    def snapshot(self) -> Dict[str, int]:
+        """Store statistics for the metrics endpoint."""
+        return {
+            "blobs": len(self._blobs),
+            "references": sum(self._refs.values()),
+            "size": sum(len(content) for content in self._blobs.values()),
+            "hashed": self.hashed
+        }
+
+
+# Global store shared by every template pack store in the process
+blob_store = BlobStore()
@@ -0,0 +1,237 @@
+"""
+Precompiled, memory-mapped template catalog snapshot.
+
+``build_snapshot`` compiles the template pack directory into one binary
+file: a JSON index (languages, manifests, per-template digests and the
+git blob SHA of every file) followed by each unique file content once.
+Workers open it with ``CatalogSnapshot``, which memory-maps the file and
+parses only the index at startup. Contents are sliced out of the mapping
+when a template is first used, and the unused pages stay in the shared
+page cache for every forked worker instead of being copied per process.
+
+The index also records every source file's stat and blob SHA, which lets
+the next build re-read only the sources that changed and report which
+templates it affected.
+
+Layout::
+
+    MAGIC (8 bytes) | format version (u32) | index length (u64) | index | blobs
+"""
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.exceptions import TemplateError
+
+MAGIC = b"SFCATLG\0"
+FORMAT_VERSION = 1
+_PREAMBLE = struct.Struct("<8sIQ")
+
+logger = logging.getLogger(__name__)
+
+
+def template_digest(manifest: Dict[str, Any], file_shas: List[str]) -> str:
+    """Digest of a template's manifest and file contents."""
+    digest = hashlib.sha1(json.dumps(manifest, sort_keys=True).encode("utf-8"))
+    for sha in file_shas:
+        digest.update(sha.encode("ascii"))
+    return digest.hexdigest()
+
+
+class CatalogSnapshot:
+    """Read-only view of a snapshot file through ``mmap``."""
+    
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        try:
+            with open(self.path, "rb") as f:
+                stat = os.fstat(f.fileno())
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise TemplateError(f"Cannot open catalog snapshot {self.path}: {str(e)}")
+        
+        try:
+            magic, version, index_length = _PREAMBLE.unpack_from(self._mmap, 0)
+            if magic != MAGIC:
+                raise ValueError("not a catalog snapshot")
+            if version != FORMAT_VERSION:
+                raise ValueError(f"format version {version}, expected {FORMAT_VERSION}")
+            start = _PREAMBLE.size
+            self.index: Dict[str, Any] = json.loads(self._mmap[start:start + index_length])
+        except (struct.error, ValueError) as e:
+            self._mmap.close()
+            raise TemplateError(f"Invalid catalog snapshot {self.path}: {str(e)}")
+        self._data_start = start + index_length
+        # (mtime_ns, size) of the mapped file, to notice a rebuilt snapshot
+        self.stat = (stat.st_mtime_ns, stat.st_size)
+    
+    @property
+    def version(self) -> str:
+        """Digest of the whole catalog the snapshot was built from."""
+        return str(self.index["catalog_version"])
+    
+    def read_blob_bytes(self, sha: str) -> bytes:
+        """Raw bytes of one file content."""
+        offset, length = self.index["blobs"][sha]
+        start = self._data_start + offset
+        return self._mmap[start:start + length]
+    
+    def read_blob(self, sha: str) -> str:
+        """Decode one file content from the mapping."""
+        return self.read_blob_bytes(sha).decode("utf-8")
+    
+    def close(self) -> None:
+        self._mmap.close()
+
+
+def _open_previous(path: Path) -> Optional[CatalogSnapshot]:
+    """The snapshot being replaced, if there is a readable one."""
+    if not path.is_file():
+        return None
+    try:
+        return CatalogSnapshot(path)
+    except TemplateError as e:
+        logger.warning(f"Ignoring previous snapshot: {str(e)}")
+        return None
+
+
+def build_snapshot(root: Path, output: Path, incremental: bool = True) -> Dict[str, Any]:
+    """
+    Compile the template packs below ``root`` into a snapshot file.
+    
+    Every source file (pack file or shared fragment) is recorded in the
+    index with its stat and blob SHA. An incremental build reuses the SHA
+    and bytes of sources whose stat is unchanged from the snapshot at
+    ``output``, so only changed fragments and pack files are read and
+    hashed, and a fragment used by several templates is read once.
+    
+    The file is written next to ``output`` and renamed into place, so
+    workers watching it never see a half-written snapshot.
+    
+    Args:
+        root: Template pack directory
+        output: Snapshot file to write
+        incremental: Reuse unchanged sources of the existing snapshot
+    
+    Returns:
+        Change manifest: catalog versions, template ids that were added,
+        changed, removed or left unchanged with their digests, the source
+        files that were re-read, and counts
+    """
+    # Imported here: the pack store itself reads snapshots from this module
+    from app.services.blob_store import BlobStore, git_blob_sha
+    from app.services.template_packs import TemplatePackStore, source_path
+    
+    root = Path(root)
+    output = Path(output)
+    previous = _open_previous(output) if incremental else None
+    previous_sources: Dict[str, List[Any]] = previous.index.get("sources", {}) if previous else {}
+    previous_templates: Dict[str, Dict[str, Any]] = {}
+    if previous is not None:
+        for packs in previous.index["templates"].values():
+            previous_templates.update(packs)
+    
+    store = TemplatePackStore(root, BlobStore())
+    sources: Dict[str, List[Any]] = {}
+    blobs: Dict[str, bytes] = {}
+    reread: List[str] = []
+    
+    def read_source(path: Path) -> str:
+        key = path.relative_to(root).as_posix()
+        if key in sources:
+            return str(sources[key][2])
+        try:
+            stat = path.stat()
+        except OSError as e:
+            raise TemplateError(f"Missing template source {key}: {str(e)}")
+        
+        sha: str
+        cached = previous_sources.get(key)
+        if previous is not None and cached is not None and cached[:2] == [stat.st_mtime_ns, stat.st_size]:
+            sha = cached[2]
+            if sha not in blobs:
+                blobs[sha] = previous.read_blob_bytes(sha)
+        else:
+            data = path.read_bytes()
+            sha = git_blob_sha(data.decode("utf-8"))
+            blobs.setdefault(sha, data)
+            reread.append(key)
+        sources[key] = [stat.st_mtime_ns, stat.st_size, sha]
+        return sha
+    
+    templates: Dict[str, Dict[str, Any]] = {}
+    digests: Dict[str, str] = {}
+    for language, packs in store.packs.items():
+        templates[language] = {}
+        for template_id, pack in packs.items():
+            shas = [read_source(source_path(pack.path, pack.manifest, relative)) for relative in pack.file_paths]
+            digests[template_id] = template_digest(pack.manifest, shas)
+            templates[language][template_id] = {
+                "manifest": pack.manifest,
+                "files": shas,
+                "digest": digests[template_id]
+            }
+    
+    if previous is not None:
+        # Reused contents were copied out of the mapping above
+        previous.close()
+    
+    offsets: Dict[str, Tuple[int, int]] = {}
+    position = 0
+    for sha, data in blobs.items():
+        offsets[sha] = (position, len(data))
+        position += len(data)
+    
+    languages = [
+        {"order": order, **info.dict()}
+        for order, info in enumerate(store.languages.values(), start=1)
+    ]
+    version = hashlib.sha1(json.dumps(
+        [languages, {lang: {tid: t["digest"] for tid, t in packs.items()} for lang, packs in templates.items()}],
+        sort_keys=True
+    ).encode("utf-8")).hexdigest()
+    
+    index = json.dumps({
+        "catalog_version": version,
+        "built_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "languages": languages,
+        "templates": templates,
+        "sources": sources,
+        "blobs": offsets
+    }, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    
+    output.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=output.parent, prefix=output.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(index)))
+            f.write(index)
+            for data in blobs.values():
+                f.write(data)
+        os.replace(temp_path, output)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+    
+    previous_digests = {template_id: entry["digest"] for template_id, entry in previous_templates.items()}
+    return {
+        "catalog_version": version,
+        "previous_version": previous.version if previous is not None else None,
+        "added": sorted(tid for tid in digests if tid not in previous_digests),
+        "changed": sorted(tid for tid, digest in digests.items() if previous_digests.get(tid) not in (None, digest)),
+        "removed": sorted(tid for tid in previous_digests if tid not in digests),
+        "unchanged": sorted(tid for tid, digest in digests.items() if previous_digests.get(tid) == digest),
+        "digests": digests,
+        "sources_read": sorted(reread),
+        "templates": len(digests),
+        "files": sum(len(entry["files"]) for packs in templates.values() for entry in packs.values()),
+        "blobs": len(blobs),
+        "size": output.stat().st_size
+    }
@@ -0,0 +1,130 @@
+"""
+Async GitHub REST API client.
+"""
+from typing import Any, Dict, Optional
+import httpx
+
+from app.config.settings import settings
+from app.core.exceptions import GitHubAPIError
+from app.core.logging import get_logger
+from app.services.github_scheduler import RateLimitScheduler
+
+logger = get_logger(__name__)
+
+
+class GitHubClient:
+    """
+    Async GitHub REST client.
+    
+    All requests share one httpx connection pool, so concurrent calls reuse
+    keep-alive connections instead of opening a session per call, and pass
+    through one RateLimitScheduler that paces them against the API quota.
+    """
+    
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        base_url: Optional[str] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        scheduler: Optional[RateLimitScheduler] = None
+    ):
+        self.token = token or settings.github_token
+        self.base_url = base_url or settings.github_api_url
+        self.transport = transport
+        self.scheduler = scheduler or RateLimitScheduler()
+        self._http: Optional[httpx.AsyncClient] = None
+    
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use."""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers={
+                    "Authorization": f"Bearer {self.token}",
+                    "Accept": "application/vnd.github+json",
+                    "X-GitHub-Api-Version": "2022-11-28",
+                },
+                timeout=settings.github_timeout,
+                limits=httpx.Limits(
+                    max_connections=settings.github_max_connections,
+                    max_keepalive_connections=settings.github_max_connections
+                ),
+                transport=self.transport
+            )
+        return self._http
+    
+    async def request(
+        self,
+        method: str,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """
+        Send a request and return the decoded JSON body.
+        
+        Args:
+            method: HTTP method
+            path: API path relative to the base URL
+            json: JSON request body
+            params: Query string parameters
+        
+        Returns:
+            Decoded JSON body, or None for empty responses
+        
+        Raises:
+            GitHubAPIError: If GitHub answers with an error status
+        """
+        try:
+            response = await self.scheduler.call(
+                lambda: self.http.request(method, path, json=json, params=params)
+            )
+        except httpx.HTTPError as e:
+            raise GitHubAPIError(f"GitHub request {method} {path} failed: {str(e)}", status=0)
+        
+        if response.is_error:
+            try:
+                message = response.json().get("message", response.text)
+            except ValueError:
+                message = response.text
+            raise GitHubAPIError(
+                f"GitHub API {method} {path} returned {response.status_code}: {message}",
+                status=response.status_code,
+                details={"path": path, "status": response.status_code}
+            )
+        
+        if not response.content:
+            return None
+        return response.json()
+    
+    async def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """Send a GET request."""
+        return await self.request("GET", path, params=params)
+    
+    async def post(self, path: str, json: Dict[str, Any]) -> Any:
+        """Send a POST request."""
+        return await self.request("POST", path, json=json)
+    
+    async def put(self, path: str, json: Dict[str, Any]) -> Any:
+        """Send a PUT request."""
+        return await self.request("PUT", path, json=json)
+    
+    async def patch(self, path: str, json: Dict[str, Any]) -> Any:
+        """Send a PATCH request."""
+        return await self.request("PATCH", path, json=json)
+    
+    async def delete(self, path: str) -> Any:
+        """Send a DELETE request."""
+        return await self.request("DELETE", path)
+    
+    async def close(self) -> None:
+        """Close the shared connection pool."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+            logger.info("GitHub client connection pool closed")
+
+
+# Global GitHub client instance
+github_client = GitHubClient()
@@ -0,0 +1,229 @@
+"""
+Rate-limit-aware scheduler for GitHub API calls.
+"""
+import asyncio
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+import httpx
+
+from app.config.settings import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# GitHub asks clients to back off at least a minute on secondary limits
+SECONDARY_LIMIT_BACKOFF = 60.0
+
+
+def parse_retry_after(value: str, now: float) -> Optional[float]:
+    """
+    Seconds to wait from a ``Retry-After`` header.
+    
+    The header is either a number of seconds or an HTTP-date (RFC 9110).
+    
+    Returns:
+        Seconds from ``now``, never negative, or None if the value is neither
+    """
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        # "-0000" dates carry no zone; HTTP-dates are always GMT
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, retry_at.timestamp() - now)
+
+
+class RateLimitScheduler:
+    """
+    Admission control for GitHub API calls.
+    
+    Every response feeds its ``X-RateLimit-*`` and ``Retry-After`` headers
+    back into the scheduler, which then:
+    
+    - caps the number of in-flight calls, halving the cap when GitHub
+      throttles us and growing it by one after a run of successes;
+    - spaces calls out once the remaining quota gets low, so it lasts
+      until the reset time;
+    - holds calls in a queue while paused by ``Retry-After`` or while the
+      quota is down to the reserve.
+    """
+    
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        reserve: Optional[int] = None,
+        pacing_threshold: float = 0.2,
+        increase_after: int = 20
+    ):
+        self.max_concurrency = max_concurrency or settings.github_max_concurrency
+        self.reserve = settings.github_rate_limit_reserve if reserve is None else reserve
+        self.pacing_threshold = pacing_threshold
+        self.increase_after = increase_after
+        
+        self.concurrency = self.max_concurrency
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at: Optional[float] = None
+        self.resource: Optional[str] = None
+        
+        self.active = 0
+        self.waiting = 0
+        self.throttled_total = 0
+        self.requests_total = 0
+        self._successes = 0
+        self._paused_until = 0.0
+        self._next_slot = 0.0
+        self._condition: Optional[asyncio.Condition] = None
+    
+    @property
+    def condition(self) -> asyncio.Condition:
+        """Get the condition variable, creating it inside the running loop."""
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+    
+    def _delay(self, now: float) -> Tuple[float, float]:
+        """Seconds to wait before the next call may start, and the pacing interval."""
+        delay = self._paused_until - now
+        interval = 0.0
+        
+        if self.remaining is not None and self.reset_at and self.reset_at > now:
+            if self.remaining <= self.reserve:
+                # Quota is exhausted, hold everything until it resets
+                delay = max(delay, self.reset_at - now)
+            elif self.limit and self.remaining < self.limit * self.pacing_threshold:
+                # Spread what is left evenly over the rest of the window
+                interval = (self.reset_at - now) / (self.remaining - self.reserve)
+                delay = max(delay, self._next_slot - now)
+        return delay, interval
+    
+    async def acquire(self) -> None:
+        """Wait until a call may be sent."""
+        async with self.condition:
+            self.waiting += 1
+            try:
+                while True:
+                    delay, interval = self._delay(time.time())
+                    if delay <= 0 and self.active < self.concurrency:
+                        break
+                    try:
+                        await asyncio.wait_for(self.condition.wait(), delay if delay > 0 else None)
+                    except asyncio.TimeoutError:
+                        pass
+            finally:
+                self.waiting -= 1
+            
+            self.active += 1
+            self.requests_total += 1
+            if interval:
+                self._next_slot = time.time() + interval
+    
+    async def release(self, response: Optional[httpx.Response]) -> None:
+        """Free the call slot and learn from the response headers."""
+        async with self.condition:
+            self.active -= 1
+            if response is not None:
+                self.observe(response)
+            self.condition.notify_all()
+    
+    def observe(self, response: httpx.Response) -> None:
+        """Update quota, pacing and concurrency from a response."""
+        headers = response.headers
+        now = time.time()
+        
+        if "x-ratelimit-remaining" in headers:
+            self.limit = int(headers.get("x-ratelimit-limit", self.limit or 0)) or None
+            self.remaining = int(headers["x-ratelimit-remaining"])
+            self.reset_at = float(headers.get("x-ratelimit-reset", self.reset_at or 0)) or None
+            self.resource = headers.get("x-ratelimit-resource", self.resource)
+        
+        if self.is_throttled(response):
+            self.throttled_total += 1
+            self._successes = 0
+            self.concurrency = max(1, self.concurrency // 2)
+            
+            retry_after = headers.get("retry-after")
+            pause = parse_retry_after(retry_after, now) if retry_after is not None else None
+            if pause is None:
+                if self.remaining == 0 and self.reset_at:
+                    pause = self.reset_at - now
+                else:
+                    pause = SECONDARY_LIMIT_BACKOFF
+            self._paused_until = max(self._paused_until, now + pause)
+            
+            logger.warning(
+                f"GitHub rate limited (status {response.status_code}), pausing {pause:.1f}s "
+                f"with concurrency {self.concurrency}"
+            )
+        elif not response.is_error:
+            self._successes += 1
+            if self._successes >= self.increase_after and self.concurrency < self.max_concurrency:
+                self.concurrency += 1
+                self._successes = 0
+    
+    @staticmethod
+    def is_throttled(response: httpx.Response) -> bool:
+        """Check whether a response is a primary or secondary rate limit."""
+        if response.status_code == 429:
+            return True
+        if response.status_code != 403:
+            return False
+        if "retry-after" in response.headers or response.headers.get("x-ratelimit-remaining") == "0":
+            return True
+        return "rate limit" in response.text.lower()
+    
+    async def call(
+        self,
+        send: Callable[[], Awaitable[httpx.Response]],
+        max_retries: Optional[int] = None
+    ) -> httpx.Response:
+        """
+        Send a request through the scheduler.
+        
+        Rate-limited responses are retried (after the pause they trigger) up
+        to ``max_retries`` times; the last response is returned either way.
+        
+        Args:
+            send: Coroutine factory performing the HTTP request
+            max_retries: Retries for rate-limited responses
+        
+        Returns:
+            The HTTP response
+        """
+        retries = settings.github_max_retries if max_retries is None else max_retries
+        attempt = 0
+        while True:
+            await self.acquire()
+            response = None
+            try:
+                response = await send()
+            finally:
+                await self.release(response)
+            
+            if not self.is_throttled(response) or attempt >= retries:
+                return response
+            attempt += 1
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Get the current budget and scheduler state."""
+        now = time.time()
+        return {
+            "limit": self.limit,
+            "remaining": self.remaining,
+            "reset_at": datetime.utcfromtimestamp(self.reset_at).isoformat() if self.reset_at else None,
+            "resource": self.resource,
+            "concurrency": self.concurrency,
+            "max_concurrency": self.max_concurrency,
+            "active": self.active,
+            "queued": self.waiting,
+            "paused_for": round(max(0.0, self._paused_until - now), 3),
+            "requests_total": self.requests_total,
+            "throttled_total": self.throttled_total
+        }
@@ -1,39 +1,61 @@
 """
 GitHub service for repository operations.
 """
-import time
-from typing import Dict, List, Optional
-from github import Github, GithubException
+import asyncio
+import base64
+from collections import Counter, OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple
 import logging
 
 from app.config.settings import settings
-from app.core.exceptions import GitHubError
+from app.core.exceptions import GitHubAPIError, GitHubError, GitHubRequestError
 from app.core.logging import get_logger
+from app.services.blob_store import BlobStore, blob_store
+from app.services.github_client import GitHubClient, github_client
 
 logger = get_logger(__name__)
 
+# Repositories whose blob SHAs are remembered between pushes
+KNOWN_BLOB_REPOSITORIES = 256
+
 
 class GitHubService:
     """Service for GitHub API operations."""
     
-    def __init__(self):
-        self.client = Github(settings.github_token)
-        self._user = None
+    def __init__(self, client: Optional[GitHubClient] = None, blobs: Optional[BlobStore] = None):
+        self.client = client or github_client
+        self.blobs = blobs if blobs is not None else blob_store
+        self.push_mode = settings.github_push_mode
+        self.inline_blob_limit = settings.github_inline_blob_limit
+        self._login: Optional[str] = None
+        # repo path -> blob SHAs already present in that repository
+        self._known_blobs: "OrderedDict[str, Set[str]]" = OrderedDict()
+    
+    def _remember_blobs(self, repo_path: str, shas: Set[str]) -> None:
+        known = self._known_blobs.setdefault(repo_path, set())
+        known.update(shas)
+        self._known_blobs.move_to_end(repo_path)
+        while len(self._known_blobs) > KNOWN_BLOB_REPOSITORIES:
+            self._known_blobs.popitem(last=False)
     
-    @property
-    def user(self):
-        """Get authenticated user."""
-        if not self._user:
+    async def get_login(self) -> str:
+        """Get the login of the authenticated user."""
+        if not self._login:
             try:
-                self._user = self.client.get_user()
-            except GithubException as e:
+                user = await self.client.get("/user")
+            except GitHubAPIError as e:
                 raise GitHubError(f"Failed to get GitHub user: {str(e)}")
-        return self._user
+            self._login = user["login"]
+        return self._login
+    
+    async def _repo_path(self, repo_name: str) -> str:
+        """Build the API path of a repository owned by the authenticated user."""
+        return f"/repos/{await self.get_login()}/{repo_name}"
     
     async def create_repository(
-        self, 
-        name: str, 
-        description: str, 
+        self,
+        name: str,
+        description: str,
         private: bool = False
     ) -> Dict[str, str]:
         """
@@ -43,7 +65,7 @@ class GitHubService:
             name: Repository name
             description: Repository description
             private: Whether repository should be private
-            
+        
         Returns:
             Dictionary with repository information
         """
@@ -52,42 +74,46 @@ class GitHubService:
             repo_name = name.lower().replace(" ", "-").replace("_", "-")
             
             # Check if repository already exists
-            try:
-                existing_repo = self.user.get_repo(repo_name)
-                if existing_repo:
-                    raise GitHubError(f"Repository '{repo_name}' already exists")
-            except GithubException:
-                # Repository doesn't exist, which is what we want
-                pass
+            if await self.get_repository(repo_name):
+                raise GitHubRequestError(f"Repository '{repo_name}' already exists")
             
-            # Create repository
-            repo = self.user.create_repo(
-                name=repo_name,
-                description=description,
-                private=private,
-                auto_init=False
-            )
+            # Create repository. The Git Data API rejects empty repositories,
+            # so the single-commit push needs an initialised default branch.
+            repo = await self.client.post("/user/repos", {
+                "name": repo_name,
+                "description": description,
+                "private": private,
+                "auto_init": self.push_mode == "git_data"
+            })
             
             logger.info(f"Created repository: {repo_name}")
             
+            # A recreated repository starts without any earlier blobs
+            self._known_blobs.pop(await self._repo_path(repo["name"]), None)
+            
             return {
-                "name": repo.name,
-                "full_name": repo.full_name,
-                "html_url": repo.html_url,
-                "clone_url": repo.clone_url,
-                "ssh_url": repo.ssh_url
+                "name": repo["name"],
+                "full_name": repo["full_name"],
+                "html_url": repo["html_url"],
+                "clone_url": repo["clone_url"],
+                "ssh_url": repo["ssh_url"]
             }
-            
-        except GithubException as e:
+        
+        except GitHubAPIError as e:
             logger.error(f"GitHub API error: {str(e)}")
+            if e.status == 422:
+                # Invalid name, or created by someone else since the check above
+                raise GitHubRequestError(f"Failed to create repository: {str(e)}")
             raise GitHubError(f"Failed to create repository: {str(e)}")
+        except GitHubError:
+            raise
         except Exception as e:
             logger.error(f"Unexpected error: {str(e)}")
             raise GitHubError(f"Unexpected error creating repository: {str(e)}")
     
     async def create_files(
-        self, 
-        repo_name: str, 
+        self,
+        repo_name: str,
         files: Dict[str, str],
         commit_message: str = "Initial commit"
     ) -> bool:
@@ -98,65 +124,265 @@ class GitHubService:
             repo_name: Repository name
             files: Dictionary of file paths and contents
             commit_message: Commit message
-            
+        
         Returns:
             True if successful
         """
         try:
-            repo = self.user.get_repo(repo_name)
+            repo_path = await self._repo_path(repo_name)
             
-            for file_path, content in files.items():
+            if self.push_mode == "git_data":
                 try:
-                    repo.create_file(
-                        path=file_path,
-                        message=f"{commit_message}: Add {file_path}",
-                        content=content,
-                        branch="main"
-                    )
-                    logger.debug(f"Created file: {file_path}")
-                    
-                    # Small delay to avoid rate limiting
-                    time.sleep(0.5)
-                    
-                except GithubException as e:
-                    logger.error(f"Failed to create file {file_path}: {str(e)}")
-                    # Continue with other files
-                    continue
+                    await self._push_single_commit(repo_path, files, commit_message)
+                except GitHubAPIError as e:
+                    if e.status != 409:
+                        raise
+                    # 409 means the repository is still empty
+                    logger.warning(f"Repository {repo_name} is empty, pushing files one by one")
+                    await self._push_file_by_file(repo_path, files, commit_message)
+            else:
+                await self._push_file_by_file(repo_path, files, commit_message)
             
             logger.info(f"Created {len(files)} files in repository {repo_name}")
             return True
-            
-        except GithubException as e:
+        
+        except GitHubAPIError as e:
             logger.error(f"GitHub API error: {str(e)}")
             raise GitHubError(f"Failed to create files: {str(e)}")
         except Exception as e:
             logger.error(f"Unexpected error: {str(e)}")
             raise GitHubError(f"Unexpected error creating files: {str(e)}")
     
+    async def _push_single_commit(
+        self,
+        repo_path: str,
+        files: Dict[str, str],
+        commit_message: str
+    ) -> str:
+        """
+        Push all files as a single commit through the Git Data API.
+        
+        Builds one tree holding exactly the given files, creates one commit
+        on top of the branch head and moves the branch ref to it. Blob SHAs
+        are computed locally (precomputed for static template files), so
+        content the repository already has is referenced by SHA, identical
+        files are uploaded once and single small files travel inline in the
+        tree request instead of costing a blob call each.
+        
+        Args:
+            repo_path: Repository API path
+            files: Dictionary of file paths and contents
+            commit_message: Commit message
+        
+        Returns:
+            SHA of the created commit
+        """
+        repo = await self.client.get(repo_path)
+        branch = repo.get("default_branch") or "main"
+        
+        entries, shas, uploads = await self._tree_entries(repo_path, files)
+        
+        tree = await self.client.post(f"{repo_path}/git/trees", {"tree": entries})
+        
+        try:
+            ref = await self.client.get(f"{repo_path}/git/ref/heads/{branch}")
+        except GitHubAPIError as e:
+            if e.status != 404:
+                raise
+            ref = None
+        
+        commit = await self.client.post(f"{repo_path}/git/commits", {
+            "message": commit_message,
+            "tree": tree["sha"],
+            "parents": [ref["object"]["sha"]] if ref else []
+        })
+        
+        if ref:
+            await self.client.patch(f"{repo_path}/git/refs/heads/{branch}", {"sha": commit["sha"]})
+        else:
+            await self.client.post(f"{repo_path}/git/refs", {
+                "ref": f"refs/heads/{branch}",
+                "sha": commit["sha"]
+            })
+        
+        self._remember_blobs(repo_path, set(shas.values()))
+        logger.debug(
+            f"Pushed {len(files)} files in commit {commit['sha']} "
+            f"({uploads} blob uploads, {len(files) - uploads} reused or inline)"
+        )
+        return commit["sha"]
+    
+    async def _tree_entries(
+        self,
+        repo_path: str,
+        files: Dict[str, str]
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, str], int]:
+        """
+        Build tree entries for files, uploading the blobs that need it.
+        
+        Content the repository already has is referenced by SHA, blobs
+        that several paths share or that are too large to inline are
+        uploaded once, and everything else travels inline in the tree.
+        
+        Returns:
+            Tree entries, blob SHA per path and the number of uploads
+        """
+        shas = {path: self.blobs.sha(content) for path, content in files.items()}
+        known = self._known_blobs.get(repo_path, set())
+        counts = Counter(shas.values())
+        
+        # The client's scheduler bounds how many uploads run at once
+        uploads: Dict[str, str] = {}
+        for path, sha in shas.items():
+            content = files[path]
+            if sha not in known and (counts[sha] > 1 or len(content) > self.inline_blob_limit):
+                uploads.setdefault(sha, content)
+        
+        async def upload(sha: str, content: str) -> None:
+            blob = await self.client.post(f"{repo_path}/git/blobs", {
+                "content": content,
+                "encoding": "utf-8"
+            })
+            if blob["sha"] != sha:
+                # Should not happen; trust GitHub's SHA for the tree
+                logger.warning(f"Blob SHA mismatch for upload: expected {sha}, got {blob['sha']}")
+                for path, path_sha in shas.items():
+                    if path_sha == sha:
+                        shas[path] = blob["sha"]
+        
+        await asyncio.gather(*(upload(sha, content) for sha, content in uploads.items()))
+        
+        entries = []
+        for path, sha in shas.items():
+            entry = {"path": path, "mode": "100644", "type": "blob"}
+            if sha in known or sha in uploads:
+                entry["sha"] = sha
+            else:
+                entry["content"] = files[path]
+            entries.append(entry)
+        return entries, shas, len(uploads)
+    
+    async def upgrade_files(
+        self,
+        repo_name: str,
+        files: Dict[str, str],
+        commit_message: str
+    ) -> Dict[str, Any]:
+        """
+        Bring the given files of an existing repository up to date.
+        
+        Reads the branch head's tree, compares its blob SHAs with the SHAs
+        of ``files`` (precomputed for static template files) and pushes
+        only the files that differ, as one commit on top of the head with
+        the head tree as base. Files not in ``files`` are left alone, and
+        nothing is pushed when every file already matches.
+        
+        Args:
+            repo_name: Repository name
+            files: Dictionary of file paths and their wanted contents
+            commit_message: Commit message
+        
+        Returns:
+            Commit SHA (None when up to date) and the changed and
+            unchanged paths
+        """
+        try:
+            repo_path = await self._repo_path(repo_name)
+            repo = await self.client.get(repo_path)
+            branch = repo.get("default_branch") or "main"
+            
+            ref = await self.client.get(f"{repo_path}/git/ref/heads/{branch}")
+            head = ref["object"]["sha"]
+            tree = await self.client.get(f"{repo_path}/git/trees/{head}", {"recursive": "1"})
+            if tree.get("truncated"):
+                # Paths missing from a truncated listing are simply pushed again
+                logger.warning(f"Tree of {repo_name} is truncated; some unchanged files may be re-sent")
+            current = {item["path"]: item["sha"] for item in tree["tree"] if item["type"] == "blob"}
+            self._remember_blobs(repo_path, set(current.values()))
+            
+            changed = {
+                path: content for path, content in files.items()
+                if current.get(path) != self.blobs.sha(content)
+            }
+            result: Dict[str, Any] = {
+                "commit": None,
+                "changed_files": sorted(changed),
+                "unchanged_files": len(files) - len(changed)
+            }
+            if not changed:
+                logger.info(f"Repository {repo_name} is up to date")
+                return result
+            
+            entries, shas, uploads = await self._tree_entries(repo_path, changed)
+            new_tree = await self.client.post(f"{repo_path}/git/trees", {
+                "base_tree": tree["sha"],
+                "tree": entries
+            })
+            commit = await self.client.post(f"{repo_path}/git/commits", {
+                "message": commit_message,
+                "tree": new_tree["sha"],
+                "parents": [head]
+            })
+            # Not forced: a push that raced us makes this fail instead of being lost
+            await self.client.patch(f"{repo_path}/git/refs/heads/{branch}", {"sha": commit["sha"]})
+            
+            self._remember_blobs(repo_path, set(shas.values()))
+            logger.info(
+                f"Upgraded {len(changed)} of {len(files)} files in {repo_name} "
+                f"(commit {commit['sha']}, {uploads} blob uploads)"
+            )
+            result["commit"] = commit["sha"]
+            return result
+        
+        except GitHubAPIError as e:
+            logger.error(f"GitHub API error: {str(e)}")
+            raise GitHubError(f"Failed to upgrade files: {str(e)}")
+    
+    async def _push_file_by_file(
+        self,
+        repo_path: str,
+        files: Dict[str, str],
+        commit_message: str
+    ) -> None:
+        """Create files one Contents API call (and one commit) at a time."""
+        for file_path, content in files.items():
+            try:
+                await self.client.put(f"{repo_path}/contents/{file_path}", {
+                    "message": f"{commit_message}: Add {file_path}",
+                    "content": base64.b64encode(content.encode("utf-8")).decode("ascii"),
+                    "branch": "main"
+                })
+                logger.debug(f"Created file: {file_path}")
+            
+            except GitHubAPIError as e:
+                logger.error(f"Failed to create file {file_path}: {str(e)}")
+                # Continue with other files
+                continue
+    
     async def get_repository(self, repo_name: str) -> Optional[Dict[str, str]]:
         """
         Get repository information.
         
         Args:
             repo_name: Repository name
-            
+        
         Returns:
             Repository information or None if not found
         """
         try:
-            repo = self.user.get_repo(repo_name)
+            repo = await self.client.get(await self._repo_path(repo_name))
             return {
-                "name": repo.name,
-                "full_name": repo.full_name,
-                "html_url": repo.html_url,
-                "clone_url": repo.clone_url,
-                "ssh_url": repo.ssh_url,
-                "description": repo.description,
-                "private": repo.private,
-                "created_at": repo.created_at.isoformat(),
-                "updated_at": repo.updated_at.isoformat()
+                "name": repo["name"],
+                "full_name": repo["full_name"],
+                "html_url": repo["html_url"],
+                "clone_url": repo["clone_url"],
+                "ssh_url": repo["ssh_url"],
+                "description": repo["description"],
+                "private": repo["private"],
+                "created_at": repo["created_at"],
+                "updated_at": repo["updated_at"]
             }
-        except GithubException:
+        except GitHubAPIError:
             return None
     
     async def delete_repository(self, repo_name: str) -> bool:
@@ -165,16 +391,17 @@ class GitHubService:
         
         Args:
             repo_name: Repository name
-            
+        
         Returns:
             True if successful
         """
         try:
-            repo = self.user.get_repo(repo_name)
-            repo.delete()
+            repo_path = await self._repo_path(repo_name)
+            await self.client.delete(repo_path)
+            self._known_blobs.pop(repo_path, None)
             logger.info(f"Deleted repository: {repo_name}")
             return True
-        except GithubException as e:
+        except GitHubAPIError as e:
             logger.error(f"Failed to delete repository: {str(e)}")
             raise GitHubError(f"Failed to delete repository: {str(e)}")
     
@@ -186,12 +413,8 @@ class GitHubService:
             True if connection is successful
         """
         try:
-            self.user.get_repo("test")  # This will fail but test the connection
+            # Rate limit lookups verify the token without spending quota
+            await self.client.get("/rate_limit")
             return True
-        except GithubException as e:
-            if e.status == 404:
-                # Repository not found, but connection is working
-                return True
-            return False
         except Exception:
             return False
@@ -1,19 +1,30 @@
 """
 Project service for managing project operations.
 """
-from typing import Dict, List, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+import asyncio
 import logging
 from datetime import datetime
 
-from app.core.exceptions import ValidationError, GitHubError, DatabaseError
+from app.config.settings import settings
+from app.core.exceptions import ValidationError, GitHubError, DatabaseError, NotFoundError, TemplateError
 from app.core.logging import get_logger
-from app.models.project import Project, ProjectRequest, ProjectResponse
+from app.models.job import Job
+from app.models.project import Project, ProjectRequest, ProjectResponse, ProjectSummary
+from app.repositories.base import KEYSET_SORT
+from app.repositories.job import JobRepository
 from app.repositories.project import ProjectRepository
 from app.services.github_service import GitHubService
 from app.services.template_service import TemplateService
+from app.utils.cache import TTLCache
 
 logger = get_logger(__name__)
 
+# Per-project errors kept in a fleet upgrade result
+MAX_REPORTED_ERRORS = 50
+# Projects read per query by a fleet upgrade
+UPGRADE_PAGE_SIZE = 100
+
 
 class ProjectService:
     """Service for project operations."""
@@ -22,22 +33,113 @@ class ProjectService:
         self,
         project_repository: ProjectRepository,
         github_service: GitHubService,
-        template_service: TemplateService
+        template_service: TemplateService,
+        job_repository: Optional[JobRepository] = None
     ):
         self.project_repository = project_repository
         self.github_service = github_service
         self.template_service = template_service
+        self.job_repository = job_repository or JobRepository()
+        self.stats_cache = TTLCache(settings.cache_ttl)
+        self.stats_versions = TTLCache(settings.stats_version_ttl)
+        self._stats_version: Optional[int] = None
+    
+    async def submit_project(self, request: ProjectRequest) -> Job:
+        """
+        Queue project generation as a background job.
+        
+        The template is checked up front so that bad requests fail fast;
+        rendering and the GitHub push happen in a worker.
+        
+        Args:
+            request: Project creation request
+        
+        Returns:
+            The queued job
+        """
+        self.template_service.get_template(request.language, request.template_id)
+        
+        job = Job(type="generate_project", payload=request.dict())
+        created_job = await self.job_repository.create(job)
+        
+        logger.info(f"Queued project generation job {created_job.id} for {request.name}")
+        return created_job
+    
+    async def submit_upgrade(self, project_id: str, force: bool = False) -> Job:
+        """
+        Queue an upgrade of one project's repository to its current template.
+        
+        Args:
+            project_id: Project identifier
+            force: Compare the repository even if the template is unchanged
+        
+        Returns:
+            The queued job
+        """
+        project = await self.get_project_by_id(project_id)
+        if not project:
+            raise NotFoundError("Project not found")
+        
+        job = Job(type="upgrade_project", payload={"project_id": project_id, "force": force})
+        created_job = await self.job_repository.create(job)
+        
+        logger.info(f"Queued upgrade job {created_job.id} for project {project.name}")
+        return created_job
+    
+    async def submit_fleet_upgrade(
+        self,
+        language: Optional[str] = None,
+        template_id: Optional[str] = None,
+        force: bool = False
+    ) -> Job:
+        """Queue an upgrade of every matching project as a single job."""
+        job = Job(type="upgrade_projects", payload={
+            "language": language,
+            "template_id": template_id,
+            "force": force
+        })
+        created_job = await self.job_repository.create(job)
+        
+        logger.info(f"Queued fleet upgrade job {created_job.id}")
+        return created_job
+    
+    async def get_job(self, job_id: str) -> Optional[Job]:
+        """Get a background job by ID."""
+        try:
+            return await self.job_repository.get_job(job_id)
+        except Exception as e:
+            logger.error(f"Error getting job {job_id}: {str(e)}")
+            raise DatabaseError(f"Failed to get job: {str(e)}")
     
-    async def create_project(self, request: ProjectRequest) -> ProjectResponse:
+    async def create_project(
+        self,
+        request: ProjectRequest,
+        progress: Optional[Dict[str, Any]] = None,
+        on_progress: Optional[Callable[[Dict[str, Any]], Awaitable[Any]]] = None
+    ) -> ProjectResponse:
         """
         Create a new project with GitHub repository.
         
+        Creation runs in steps (repository, files, project record) that are
+        recorded in ``progress`` as they complete. Passing the progress of
+        an earlier, failed attempt resumes after its last completed step, so
+        a retry reuses the repository it created instead of failing on it.
+        
         Args:
             request: Project creation request
-            
+            progress: Steps completed by an earlier attempt; updated in place
+            on_progress: Called with ``progress`` after each completed step
+        
         Returns:
             Project creation response
         """
+        progress = {} if progress is None else progress
+        
+        async def completed(step: str, value: Any) -> None:
+            progress[step] = value
+            if on_progress is not None:
+                await on_progress(progress)
+        
         try:
             logger.info(f"Creating project: {request.name}")
             
@@ -55,38 +157,52 @@ class ProjectService:
             
             # Process template files
             processed_files = self.template_service.process_template(template, template_variables)
+            template_digest = self.template_service.get_compiled_template(template).digest
             
             # Create GitHub repository
-            repo_info = await self.github_service.create_repository(
-                name=request.name,
-                description=request.description,
-                private=False
-            )
+            repo_info = progress.get("repository")
+            if repo_info:
+                logger.info(f"Reusing repository {repo_info['name']} from an earlier attempt")
+            else:
+                repo_info = await self.github_service.create_repository(
+                    name=request.name,
+                    description=request.description,
+                    private=False
+                )
+                await completed("repository", repo_info)
             
-            # Create files in repository
-            await self.github_service.create_files(
-                repo_name=repo_info["name"],
-                files=processed_files,
-                commit_message=f"Initial commit: {request.name}"
-            )
+            # Create files in repository; pushing again replaces a partial push
+            if not progress.get("files_pushed"):
+                await self.github_service.create_files(
+                    repo_name=repo_info["name"],
+                    files=processed_files,
+                    commit_message=f"Initial commit: {request.name}"
+                )
+                await completed("files_pushed", True)
             
             # Save project to database
-            project = Project(
-                name=request.name,
-                description=request.description,
-                language=request.language,
-                template_id=request.template_id,
-                github_username=request.github_username,
-                repository_url=repo_info["html_url"],
-                status="created",
-                metadata={
-                    "template_used": template.id,
-                    "files_created": len(processed_files),
-                    "github_repo": repo_info["name"]
-                }
-            )
-            
-            created_project = await self.project_repository.create(project)
+            project_id = progress.get("project_id")
+            if not project_id:
+                project = Project(
+                    name=request.name,
+                    description=request.description,
+                    language=request.language,
+                    template_id=request.template_id,
+                    github_username=request.github_username,
+                    repository_url=repo_info["html_url"],
+                    status="created",
+                    metadata={
+                        "template_used": template.id,
+                        "files_created": len(processed_files),
+                        "github_repo": repo_info["name"],
+                        "template_digest": template_digest
+                    }
+                )
+                
+                created_project = await self.project_repository.create(project)
+                project_id = created_project.id
+                await completed("project_id", project_id)
+                await self._invalidate_stats()
             
             logger.info(f"Successfully created project: {request.name}")
             
@@ -94,12 +210,16 @@ class ProjectService:
                 success=True,
                 message=f"Project '{request.name}' created successfully!",
                 repository_url=repo_info["html_url"],
-                project_id=created_project.id
+                project_id=project_id
             )
-            
+        
         except ValidationError as e:
             logger.error(f"Validation error: {str(e)}")
             raise
+        except TemplateError as e:
+            # Rendering fails the same way on every attempt
+            logger.error(f"Template error: {str(e)}")
+            raise ValidationError(f"Failed to create project: {str(e)}")
         except GitHubError as e:
             logger.error(f"GitHub error: {str(e)}")
             raise
@@ -107,47 +227,226 @@ class ProjectService:
             logger.error(f"Database error: {str(e)}")
             raise
         except Exception as e:
+            # Network and server errors are left for the worker to retry
             logger.error(f"Unexpected error creating project: {str(e)}")
-            raise ValidationError(f"Failed to create project: {str(e)}")
+            raise
+    
+    async def upgrade_project(self, project: Project, force: bool = False) -> Dict[str, Any]:
+        """
+        Push the changes between a project's repository and its template.
+        
+        The template is rendered again with the project's variables and only
+        files whose blob SHA differs from the repository's head tree are
+        committed. Projects whose template is unchanged since they were
+        created or last upgraded are skipped without any GitHub call unless
+        ``force`` is set.
+        
+        Args:
+            project: Project to upgrade
+            force: Compare the repository even if the template is unchanged
+        
+        Returns:
+            Upgrade summary
+        """
+        metadata = project.metadata or {}
+        repo_name = metadata.get("github_repo")
+        if not repo_name:
+            raise ValidationError(f"Project '{project.name}' has no GitHub repository")
+        
+        template = self.template_service.get_template(project.language, project.template_id)
+        template_digest = self.template_service.get_compiled_template(template).digest
+        result: Dict[str, Any] = {
+            "project_id": project.id,
+            "repository": repo_name,
+            "template_digest": template_digest,
+            "skipped": False,
+            "commit": None,
+            "changed_files": [],
+            "unchanged_files": 0
+        }
+        if not force and metadata.get("template_digest") == template_digest:
+            result["skipped"] = True
+            return result
+        
+        template_variables = {
+            "project_name": project.name,
+            "project_description": project.description
+        }
+        self.template_service.validate_template_variables(template, template_variables)
+        files = self.template_service.process_template(template, template_variables)
+        
+        result.update(await self.github_service.upgrade_files(
+            repo_name,
+            files,
+            commit_message=f"Upgrade to latest {template.name} template"
+        ))
+        
+        await self.project_repository.update(project.id, {
+            "metadata": {
+                **metadata,
+                "template_digest": template_digest,
+                "upgraded_at": datetime.utcnow().isoformat()
+            }
+        })
+        return result
+    
+    async def upgrade_projects(
+        self,
+        language: Optional[str] = None,
+        template_id: Optional[str] = None,
+        force: bool = False,
+        concurrency: int = 4
+    ) -> Dict[str, Any]:
+        """
+        Upgrade every matching project, ``concurrency`` at a time.
+        
+        Projects are read in keyset pages into a bounded queue, so memory
+        stays flat however many projects there are. Each page is a short
+        query of its own: a cursor held open across the slow GitHub calls
+        would hit the server's idle cursor timeout on a large fleet. A
+        failing project is recorded and does not stop the others.
+        
+        Args:
+            language: Only upgrade projects of this language
+            template_id: Only upgrade projects of this template
+            force: Compare repositories even if their template is unchanged
+            concurrency: Number of projects upgraded at the same time
+        
+        Returns:
+            Counts of upgraded, unchanged, skipped and failed projects
+        """
+        filter_dict = {}
+        if language:
+            filter_dict["language"] = language
+        if template_id:
+            filter_dict["template_id"] = template_id
+        
+        summary: Dict[str, Any] = {"projects": 0, "upgraded": 0, "unchanged": 0, "skipped": 0, "failed": 0, "errors": {}}
+        queue: "asyncio.Queue[Optional[Project]]" = asyncio.Queue(maxsize=concurrency)
+        
+        async def upgrade_next() -> None:
+            while True:
+                project = await queue.get()
+                if project is None:
+                    return
+                try:
+                    result = await self.upgrade_project(project, force=force)
+                except Exception as e:
+                    logger.error(f"Failed to upgrade project {project.name}: {str(e)}")
+                    summary["failed"] += 1
+                    if len(summary["errors"]) < MAX_REPORTED_ERRORS:
+                        summary["errors"][project.id] = str(e)
+                    continue
+                if result["skipped"]:
+                    summary["skipped"] += 1
+                elif result["commit"]:
+                    summary["upgraded"] += 1
+                else:
+                    summary["unchanged"] += 1
+        
+        workers = [asyncio.create_task(upgrade_next()) for _ in range(concurrency)]
+        try:
+            after = None
+            while True:
+                projects, after = await self.project_repository.get_page(
+                    limit=UPGRADE_PAGE_SIZE,
+                    after=after,
+                    filter_dict=filter_dict
+                )
+                for project in projects:
+                    summary["projects"] += 1
+                    await queue.put(project)
+                if after is None:
+                    break
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+        
+        logger.info(
+            f"Upgraded {summary['upgraded']} of {summary['projects']} projects "
+            f"({summary['unchanged']} unchanged, {summary['skipped']} skipped, {summary['failed']} failed)"
+        )
+        return summary
     
     async def get_projects(
         self, 
         skip: int = 0, 
         limit: int = 50,
         language: Optional[str] = None,
-        github_username: Optional[str] = None
-    ) -> List[Project]:
+        github_username: Optional[str] = None,
+        after: Optional[str] = None
+    ) -> Tuple[List[ProjectSummary], Optional[str]]:
         """
-        Get projects with optional filtering.
+        Get a page of project summaries with optional filtering, newest first.
         
         Args:
-            skip: Number of projects to skip
+            skip: Number of projects to skip (prefer ``after``)
             limit: Maximum number of projects to return
             language: Filter by programming language
             github_username: Filter by GitHub username
-            
+            after: Cursor returned with the previous page
+        
         Returns:
-            List of projects
+            Project summaries and the cursor of the next page
         """
         try:
-            filter_dict = {}
-            if language:
-                filter_dict["language"] = language
-            if github_username:
-                filter_dict["github_username"] = github_username
-            
-            projects = await self.project_repository.get_all(
-                skip=skip,
+            return await self.project_repository.get_page(
                 limit=limit,
-                filter_dict=filter_dict
+                after=after,
+                filter_dict=self._project_filter(language, github_username),
+                skip=skip,
+                summary=True
             )
-            
-            return projects
-            
+        except ValidationError:
+            raise
         except Exception as e:
             logger.error(f"Error getting projects: {str(e)}")
             raise DatabaseError(f"Failed to get projects: {str(e)}")
     
+    def iter_projects(
+        self,
+        language: Optional[str] = None,
+        github_username: Optional[str] = None,
+        summary: bool = True
+    ) -> AsyncIterator[Any]:
+        """
+        Iterate over every project matching the list filters, newest first.
+        
+        Documents are read one cursor batch at a time, for streaming
+        responses over the whole collection.
+        
+        Args:
+            language: Filter by programming language
+            github_username: Filter by GitHub username
+            summary: Yield project summaries instead of full projects
+        """
+        return self.project_repository.iter_all(
+            self._project_filter(language, github_username),
+            sort=KEYSET_SORT,
+            summary=summary,
+            batch_size=settings.stream_batch_size
+        )
+    
+    async def count_projects(
+        self,
+        language: Optional[str] = None,
+        github_username: Optional[str] = None
+    ) -> int:
+        """Count projects matching the list filters."""
+        return await self.project_repository.count(self._project_filter(language, github_username))
+    
+    @staticmethod
+    def _project_filter(language: Optional[str], github_username: Optional[str]) -> Dict[str, Any]:
+        filter_dict = {}
+        if language:
+            filter_dict["language"] = language
+        if github_username:
+            filter_dict["github_username"] = github_username
+        return filter_dict
+    
     async def get_project_by_id(self, project_id: str) -> Optional[Project]:
         """Get project by ID."""
         try:
@@ -164,8 +463,8 @@ class ProjectService:
             logger.error(f"Error getting project {name}: {str(e)}")
             raise DatabaseError(f"Failed to get project: {str(e)}")
     
-    async def get_recent_projects(self, limit: int = 10) -> List[Project]:
-        """Get recently created projects."""
+    async def get_recent_projects(self, limit: int = 10) -> List[ProjectSummary]:
+        """Get summaries of recently created projects."""
         try:
             return await self.project_repository.get_recent_projects(limit)
         except Exception as e:
@@ -184,10 +483,38 @@ class ProjectService:
             logger.error(f"Error updating project status: {str(e)}")
             raise DatabaseError(f"Failed to update project status: {str(e)}")
     
+    async def _invalidate_stats(self) -> None:
+        """
+        Make every process reload project statistics on its next read.
+        
+        Projects are created in worker processes while the API serves the
+        statistics, so the invalidation goes through a version stored in
+        the database rather than this process's cache. A failed bump leaves
+        the statistics to expire with the cache TTL.
+        """
+        try:
+            await self.project_repository.bump_stats_version()
+        except Exception as e:
+            logger.error(f"Error invalidating project statistics: {str(e)}")
+        # This process sees its own writes at once
+        self.stats_versions.invalidate()
+    
     async def get_project_statistics(self) -> Dict:
-        """Get project statistics."""
+        """
+        Get project statistics, cached for ``settings.cache_ttl`` seconds.
+        
+        The cache is dropped once any process creates or deletes a project.
+        The version telling so is itself cached for
+        ``settings.stats_version_ttl`` seconds, so most reads cost no
+        database round trip and another process's write shows up within
+        that time.
+        """
         try:
-            return await self.project_repository.get_project_stats()
+            version = await self.stats_versions.get_or_load("projects", self.project_repository.get_stats_version)
+            if version != self._stats_version:
+                self.stats_cache.invalidate()
+                self._stats_version = version
+            return await self.stats_cache.get_or_load(("projects", version), self.project_repository.get_project_stats)
         except Exception as e:
             logger.error(f"Error getting project statistics: {str(e)}")
             raise DatabaseError(f"Failed to get project statistics: {str(e)}")
@@ -206,12 +533,13 @@ class ProjectService:
             
             # Delete from database
             success = await self.project_repository.delete(project_id)
+            await self._invalidate_stats()
             
             if success:
                 logger.info(f"Successfully deleted project: {project.name}")
             
             return success
-            
+        
         except Exception as e:
             logger.error(f"Error deleting project: {str(e)}")
             raise DatabaseError(f"Failed to delete project: {str(e)}")
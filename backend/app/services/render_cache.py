@@ -0,0 +1,122 @@
+"""
+Bounded cache of rendered template file sets.
+
+Entries are keyed by template id, the hash of the template content and a
+hash of the variables, and evicted least recently used first once the
+cached text exceeds a size budget. The preview and generation endpoints
+render the same template with the same variables over and over (the UI
+always previews with ``my-project``), so most renders become a lookup.
+"""
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional, Set, Tuple
+
+CacheKey = Tuple[str, str, str]
+
+
+def hash_variables(variables: Mapping[str, str]) -> str:
+    """Stable hash of a variables mapping, independent of key order."""
+    data = json.dumps(variables, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+
+def rendered_size(files: Mapping[str, str]) -> int:
+    """Approximate memory held by a rendered file set, in characters."""
+    return sum(len(path) + len(content) for path, content in files.items())
+
+
+class RenderCache:
+    """Size-aware LRU cache of rendered file sets."""
+    
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.size = 0
+        self._entries: "OrderedDict[CacheKey, Tuple[Dict[str, str], int]]" = OrderedDict()
+        self._keys_by_template: Dict[str, Set[CacheKey]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key: CacheKey) -> Optional[Dict[str, str]]:
+        """
+        Look up a rendered file set.
+        
+        Args:
+            key: (template id, content hash, variables hash)
+        
+        Returns:
+            A copy of the cached files, or None on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        # Callers may modify the dict; the strings themselves are shared
+        return dict(entry[0])
+    
+    def put(self, key: CacheKey, files: Dict[str, str]) -> None:
+        """Store a rendered file set, evicting old entries to stay in budget."""
+        size = rendered_size(files)
+        if size > self.max_size:
+            return
+        
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (dict(files), size)
+        self._keys_by_template.setdefault(key[0], set()).add(key)
+        self.size += size
+        
+        while self.size > self.max_size:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+    
+    def invalidate(self, template_id: str) -> int:
+        """
+        Drop every entry of a template.
+        
+        Returns:
+            Number of entries removed
+        """
+        keys = self._keys_by_template.pop(template_id, set())
+        for key in keys:
+            _, size = self._entries.pop(key)
+            self.size -= size
+        self.invalidations += len(keys)
+        return len(keys)
+    
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+        self._keys_by_template.clear()
+        self.size = 0
+    
+    def _remove(self, key: CacheKey) -> None:
+        _, size = self._entries.pop(key)
+        self.size -= size
+        keys = self._keys_by_template.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_template[key[0]]
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Cache statistics for the metrics endpoint."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "size": self.size,
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations
+        }
@@ -0,0 +1,298 @@
+"""
+Write-behind buffer for status check ingestion.
+
+Clients ping on a fixed schedule, so status checks arrive as a steady
+stream of tiny writes. The buffer acknowledges a check as soon as it is
+queued and a background task writes the queue with ``insert_many``, one
+batch whenever ``batch_size`` checks are waiting or ``flush_interval``
+seconds have passed. Checks the database rejects are dropped. Checks
+that failed on a connection or write concern error are queued again and
+retried until they are written, which keeps the queue full (and clients
+backing off) while the database is away; a check whose write was not
+acknowledged may end up stored twice. A batch failing with any other error
+is retried a few times, then dropped. Checks are lost if the process dies
+before they are written; a clean shutdown drains everything.
+
+Every written batch is also folded into the per-client statistics, one
+upsert per client in the batch.
+"""
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson import ObjectId
+from pymongo.write_concern import WriteConcern
+
+from app.config.settings import settings
+from app.core.exceptions import DatabaseError, ServiceUnavailableError
+from app.core.logging import get_logger
+from app.models.status import StatusCheck
+from app.repositories.client_stats import ClientStatsRepository
+from app.repositories.status import StatusCheckRepository
+
+logger = get_logger(__name__)
+
+# Attempts at a batch before it is dropped, unless its error was a
+# connection or write concern error and the buffer is not shutting down
+MAX_FLUSH_ATTEMPTS = 3
+# Longest wait, in seconds, between two attempts at the same batch
+MAX_RETRY_DELAY = 30.0
+
+
+def parse_write_concern(value: str) -> WriteConcern:
+    """Write concern from a ``w`` setting such as ``"1"`` or ``"majority"``."""
+    value = value.strip()
+    return WriteConcern(w=int(value) if value.isdigit() else value)
+
+
+class StatusCheckBuffer:
+    """
+    Bounded in-process queue of status checks, written in batches.
+    
+    At most ``max_pending`` checks wait in memory, plus the batch being
+    written. When the queue is full, ``submit`` waits for the next flush
+    to make room and gives up with ``ServiceUnavailableError`` after
+    ``enqueue_timeout`` seconds, which slows clients down to the rate the
+    database accepts instead of growing the queue.
+    
+    Until ``start`` is called (and after ``stop``) checks are written
+    through, one ``insert_many`` per check.
+    """
+    
+    def __init__(
+        self,
+        repository: StatusCheckRepository,
+        stats_repository: Optional[ClientStatsRepository] = None,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        max_pending: Optional[int] = None,
+        enqueue_timeout: Optional[float] = None,
+        write_concern: Optional[WriteConcern] = None
+    ):
+        self.repository = repository
+        self.stats_repository = stats_repository
+        self.batch_size = batch_size or settings.status_buffer_batch_size
+        self.flush_interval = settings.status_buffer_flush_interval if flush_interval is None else flush_interval
+        self.max_pending = max(max_pending or settings.status_buffer_max_pending, self.batch_size)
+        self.enqueue_timeout = (
+            settings.status_buffer_enqueue_timeout if enqueue_timeout is None else enqueue_timeout
+        )
+        self.write_concern = write_concern or parse_write_concern(settings.status_write_concern)
+        
+        self._pending: List[Dict[str, Any]] = []
+        self._condition: Optional[asyncio.Condition] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._stopping = False
+        
+        self.in_flight = 0
+        self.accepted_total = 0
+        self.written_total = 0
+        self.failed_total = 0
+        self.stats_failed_total = 0
+        self.rejected_total = 0
+        self.waited_total = 0
+        self.flushes = 0
+        self.last_flush_seconds = 0.0
+        self.max_flush_seconds = 0.0
+        self._flush_seconds_total = 0.0
+    
+    @property
+    def condition(self) -> asyncio.Condition:
+        """Get the condition variable, creating it inside the running loop."""
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+    
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._stopping
+    
+    def start(self) -> None:
+        """Start the background flush task."""
+        if self._task is None:
+            self._stopping = False
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """Write every queued check, then stop the flush task."""
+        if self._task is None:
+            return
+        async with self.condition:
+            self._stopping = True
+            self.condition.notify_all()
+        await self._task
+        self._task = None
+        logger.info(f"Status check buffer drained, {self.written_total} checks written")
+    
+    async def submit(self, check: StatusCheck) -> StatusCheck:
+        """
+        Queue a status check for writing.
+        
+        The check gets its ``_id`` here, so the returned id is the one the
+        read endpoints will report once the check is written.
+        
+        Raises:
+            ServiceUnavailableError: If the queue stayed full for
+                ``enqueue_timeout`` seconds
+            DatabaseError: If the buffer is not running and the direct
+                write failed
+        """
+        object_id = ObjectId()
+        check.id = str(object_id)
+        document = {**check.dict(), "_id": object_id}
+        
+        if not self.running:
+            # Written through, so the caller sees a failed write
+            try:
+                self.written_total += await self.repository.insert_many([document], self.write_concern)
+            except DatabaseError as e:
+                # Stored despite the error when only the write concern failed
+                await self._record_stats(self._written_part([document], e))
+                raise
+            await self._record_stats([document])
+            return check
+        
+        async with self.condition:
+            if len(self._pending) >= self.max_pending:
+                self.waited_total += 1
+                try:
+                    await asyncio.wait_for(
+                        self.condition.wait_for(lambda: len(self._pending) < self.max_pending),
+                        self.enqueue_timeout
+                    )
+                except asyncio.TimeoutError:
+                    self.rejected_total += 1
+                    raise ServiceUnavailableError("Status check buffer is full, retry later")
+            self._pending.append(document)
+            self.accepted_total += 1
+            if len(self._pending) >= self.batch_size:
+                self.condition.notify_all()
+        return check
+    
+    async def _run(self) -> None:
+        attempts = 0
+        while True:
+            async with self.condition:
+                if not self._stopping and len(self._pending) < self.batch_size:
+                    try:
+                        await asyncio.wait_for(
+                            self.condition.wait_for(
+                                lambda: self._stopping or len(self._pending) >= self.batch_size
+                            ),
+                            self.flush_interval
+                        )
+                    except asyncio.TimeoutError:
+                        pass
+                batch = self._pending[:self.batch_size]
+                del self._pending[:self.batch_size]
+                # Producers waiting on a full queue can go on
+                self.condition.notify_all()
+                done = self._stopping and not self._pending
+            
+            if batch:
+                try:
+                    retry, retryable = await self._flush(batch)
+                except Exception as e:
+                    # The task has to survive: /check keeps queueing while it runs
+                    logger.error(f"Failed to flush {len(batch)} status checks: {str(e)}")
+                    retry, retryable = batch, False
+                if not retry:
+                    attempts = 0
+                elif attempts + 1 < MAX_FLUSH_ATTEMPTS or (retryable and not self._stopping):
+                    attempts += 1
+                    async with self.condition:
+                        self._pending[:0] = retry
+                        done = False
+                        try:
+                            # Waiting on the condition lets stop() cut the backoff short
+                            await asyncio.wait_for(
+                                self.condition.wait_for(lambda: self._stopping),
+                                min(self.flush_interval * 2 ** (attempts - 1), MAX_RETRY_DELAY)
+                            )
+                        except asyncio.TimeoutError:
+                            pass
+                else:
+                    attempts = 0
+                    self.failed_total += len(retry)
+                    logger.error(f"Dropped {len(retry)} status checks after {MAX_FLUSH_ATTEMPTS} failed flushes")
+            if done:
+                return
+    
+    async def _flush(self, batch: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Write a batch and fold the stored checks into the statistics.
+        
+        Returns:
+            The checks to write again, and whether they failed on a
+            connection or write concern error
+        """
+        self.in_flight = len(batch)
+        started = time.perf_counter()
+        try:
+            try:
+                self.written_total += await self.repository.insert_many(batch, self.write_concern)
+            except DatabaseError as e:
+                rejected = set(e.details.get("failed_indexes", []))
+                if rejected:
+                    self.failed_total += len(rejected)
+                    logger.error(f"Dropped {len(rejected)} of {len(batch)} status checks: {str(e)}")
+                batch = [document for index, document in enumerate(batch) if index not in rejected]
+                if batch and not self._confirmed(e):
+                    logger.error(f"Failed to write {len(batch)} status checks, retrying: {str(e)}")
+                    return batch, bool(e.details.get("retryable"))
+                self.written_total += len(batch)
+            await self._record_stats(batch)
+            return [], False
+        finally:
+            elapsed = time.perf_counter() - started
+            self.in_flight = 0
+            self.flushes += 1
+            self.last_flush_seconds = elapsed
+            self.max_flush_seconds = max(self.max_flush_seconds, elapsed)
+            self._flush_seconds_total += elapsed
+    
+    @staticmethod
+    def _confirmed(error: DatabaseError) -> bool:
+        """Whether the documents a failed insert did not reject are known to be stored."""
+        return "failed_indexes" in error.details and not error.details.get("retryable")
+    
+    @classmethod
+    def _written_part(cls, batch: List[Dict[str, Any]], error: DatabaseError) -> List[Dict[str, Any]]:
+        """The documents of a failed unordered insert that are known to be stored."""
+        if not cls._confirmed(error):
+            return []
+        failed = set(error.details["failed_indexes"])
+        return [document for index, document in enumerate(batch) if index not in failed]
+    
+    async def _record_stats(self, batch: List[Dict[str, Any]]) -> None:
+        if self.stats_repository is None or not batch:
+            return
+        try:
+            await self.stats_repository.record(batch, self.write_concern)
+        except Exception as e:
+            # The checks are stored; only the summary falls behind, and the
+            # batch must not be retried
+            self.stats_failed_total += len(batch)
+            logger.error(f"Client statistics missed {len(batch)} status checks: {str(e)}")
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Buffer depth, throughput and flush latency for the metrics endpoint."""
+        return {
+            "running": self.running,
+            "depth": len(self._pending),
+            "in_flight": self.in_flight,
+            "max_pending": self.max_pending,
+            "batch_size": self.batch_size,
+            "flush_interval": self.flush_interval,
+            "write_concern": self.write_concern.document.get("w", 1),
+            "accepted_total": self.accepted_total,
+            "written_total": self.written_total,
+            "failed_total": self.failed_total,
+            "stats_failed_total": self.stats_failed_total,
+            "rejected_total": self.rejected_total,
+            "waited_total": self.waited_total,
+            "flushes": self.flushes,
+            "last_flush_ms": round(self.last_flush_seconds * 1000, 3),
+            "avg_flush_ms": round(self._flush_seconds_total / self.flushes * 1000, 3) if self.flushes else 0.0,
+            "max_flush_ms": round(self.max_flush_seconds * 1000, 3)
+        }
@@ -0,0 +1,178 @@
+"""
+Compiled template rendering.
+
+Template text is split once into alternating literal and placeholder
+segments. Rendering is then a single ``str.join`` over the segments, so its
+cost follows the size of the output instead of re-scanning every file once
+per variable.
+"""
+import hashlib
+import re
+from typing import AbstractSet, Dict, FrozenSet, Iterator, List, Mapping, Optional, Tuple
+
+# Placeholders look like ``{project_name}``. GitHub expressions
+# (``${{ matrix.os }}``) and Maven properties (``${junit.version}``) do not
+# match because of the spaces and dots they contain.
+PLACEHOLDER_PATTERN = re.compile(r"\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
+
+def content_digest(files: Mapping[str, str]) -> str:
+    """Hash of a template's paths and contents, used to key rendered output."""
+    digest = hashlib.sha1()
+    for path in sorted(files):
+        digest.update(path.encode("utf-8") + b"\0")
+        digest.update(files[path].encode("utf-8") + b"\0")
+    return digest.hexdigest()
+
+
+class CompiledText:
+    """
+    A piece of template text parsed into literal and placeholder segments.
+    
+    When ``allowed`` is given only those names become placeholders; any
+    other ``{name}`` stays part of the literal text.
+    """
+    
+    __slots__ = ("source", "literals", "names", "positions", "literal_size", "ignored")
+    
+    def __init__(self, source: str, allowed: Optional[AbstractSet[str]] = None):
+        self.source = source
+        literals: List[str] = []
+        names: List[str] = []
+        positions: List[int] = []
+        ignored = set()
+        
+        last = 0
+        for match in PLACEHOLDER_PATTERN.finditer(source):
+            name = match.group(1)
+            if allowed is not None and name not in allowed:
+                ignored.add(name)
+                continue
+            literals.append(source[last:match.start()])
+            names.append(name)
+            positions.append(match.start())
+            last = match.end()
+        literals.append(source[last:])
+        
+        # literals always has one more entry than names
+        self.literals: Tuple[str, ...] = tuple(literals)
+        self.names: Tuple[str, ...] = tuple(names)
+        self.positions: Tuple[int, ...] = tuple(positions)
+        # UTF-8 size of the text without its placeholders
+        self.literal_size = sum(len(literal.encode("utf-8")) for literal in literals)
+        # Brace tokens that look like placeholders but are not variables
+        self.ignored: FrozenSet[str] = frozenset(ignored)
+    
+    @property
+    def is_static(self) -> bool:
+        """Whether the text contains no placeholders at all."""
+        return not self.names
+    
+    def render(self, variables: Mapping[str, str]) -> str:
+        """
+        Substitute variables into the text.
+        
+        Placeholders without a value are kept verbatim, matching the old
+        ``str.replace`` behaviour for braces that are not template variables.
+        
+        Args:
+            variables: Variable values by name
+        
+        Returns:
+            Rendered text
+        """
+        if not self.names:
+            return self.source
+        
+        literals = self.literals
+        parts = [literals[0]]
+        for index, name in enumerate(self.names):
+            value = variables.get(name)
+            parts.append(value if value is not None else "{" + name + "}")
+            parts.append(literals[index + 1])
+        return "".join(parts)
+    
+    def rendered_size(self, value_sizes: Mapping[str, int]) -> int:
+        """
+        UTF-8 size of the rendered text, computed without rendering it.
+        
+        Args:
+            value_sizes: UTF-8 size of each variable value by name
+        
+        Returns:
+            Size in bytes
+        """
+        size = self.literal_size
+        for name in self.names:
+            value_size = value_sizes.get(name)
+            # Unknown placeholders stay verbatim as "{name}"
+            size += value_size if value_size is not None else len(name) + 2
+        return size
+
+
+class CompiledTemplate:
+    """
+    All files of a template, compiled path and content alike.
+    
+    Compiling scans every file once and indexes which variables each file
+    uses, so validation checks the placeholders the files really contain
+    and rendering passes files without placeholders through untouched.
+    ``variables`` are the declared variable names; without them every
+    ``{name}`` token is treated as a variable.
+    """
+    
+    __slots__ = ("source", "files", "digest", "static", "file_variables", "variables", "ignored")
+    
+    def __init__(self, files: Dict[str, str], variables: Optional[AbstractSet[str]] = None):
+        self.source = files
+        self.digest = content_digest(files)
+        self.files: Tuple[Tuple[CompiledText, CompiledText], ...] = tuple(
+            (CompiledText(path, variables), CompiledText(content, variables))
+            for path, content in files.items()
+        )
+        # Per file: whether it can be passed through by reference
+        self.static: Tuple[bool, ...] = tuple(
+            path.is_static and content.is_static for path, content in self.files
+        )
+        # Variable index: names used by each file (by source path) and overall
+        self.file_variables: Dict[str, FrozenSet[str]] = {
+            path.source: frozenset(path.names) | frozenset(content.names)
+            for path, content in self.files
+        }
+        self.variables: FrozenSet[str] = frozenset().union(*self.file_variables.values())
+        self.ignored: FrozenSet[str] = frozenset().union(
+            *(path.ignored | content.ignored for path, content in self.files)
+        )
+    
+    @property
+    def static_count(self) -> int:
+        """Number of files without any placeholder."""
+        return sum(self.static)
+    
+    def render(self, variables: Mapping[str, str]) -> Dict[str, str]:
+        """
+        Render every file of the template.
+        
+        Args:
+            variables: Variable values by name
+        
+        Returns:
+            Dictionary of rendered file paths and contents
+        """
+        return dict(self.iter_render(variables))
+    
+    def iter_render(self, variables: Mapping[str, str]) -> Iterator[Tuple[str, str]]:
+        """
+        Render the files one at a time.
+        
+        Args:
+            variables: Variable values by name
+        
+        Yields:
+            Rendered (path, content) pairs
+        """
+        for (path, content), static in zip(self.files, self.static):
+            if static:
+                yield path.source, content.source
+            else:
+                yield path.render(variables), content.render(variables)
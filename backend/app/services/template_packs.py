@@ -0,0 +1,352 @@
+"""
+On-disk template packs.
+
+Every template lives in its own directory::
+
+    templates/<language>/language.json
+    templates/<language>/<template_id>/template.json
+    templates/<language>/<template_id>/files/...
+    templates/_fragments/...
+
+Files shared by several packs (the CI and release workflows) are kept once
+under ``_fragments`` and mapped into a pack by its manifest's
+``"fragments": {"<file path>": "<fragment path>"}``.
+
+Only the small JSON manifests are read when the store is created. File
+contents are read the first time a template is used, and ``watch`` rescans
+the tree when it changes so edited, added or removed packs take effect
+without a restart.
+
+This module deliberately avoids importing the application settings so the
+legacy ``server.py`` can use it as well.
+"""
+import asyncio
+import json
+import logging
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.exceptions import TemplateError
+from app.models.template import LanguageInfo, Template, TemplateInfo
+from app.services.blob_store import BlobStore, blob_store
+from app.services.catalog_snapshot import CatalogSnapshot
+
+logger = logging.getLogger(__name__)
+
+LANGUAGE_MANIFEST = "language.json"
+TEMPLATE_MANIFEST = "template.json"
+FILES_DIR = "files"
+FRAGMENTS_DIR = "_fragments"
+
+# (path, mtime_ns, size) of the manifest and every listed file, or
+# ("digest", template digest) for a pack read from a catalog snapshot
+Signature = Tuple[Tuple[Any, ...], ...]
+
+
+def _read_json(path: Path) -> Dict[str, Any]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            data: Dict[str, Any] = json.load(f)
+        return data
+    except (OSError, ValueError) as e:
+        raise TemplateError(f"Invalid manifest {path}: {str(e)}")
+
+
+def source_path(pack_dir: Path, manifest: Dict[str, Any], relative: str) -> Path:
+    """File a pack's ``relative`` path is read from: a fragment or ``files/``."""
+    fragment: Optional[str] = manifest.get("fragments", {}).get(relative)
+    if fragment is not None:
+        return pack_dir.parent.parent / FRAGMENTS_DIR / fragment
+    return pack_dir / FILES_DIR / relative
+
+
+def _stat(path: Path) -> Tuple[int, int]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return (-1, -1)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class TemplatePack:
+    """Index entry of one pack; the template itself is loaded on demand."""
+    
+    __slots__ = ("language", "path", "manifest", "signature", "template")
+    
+    def __init__(self, language: str, path: Path, manifest: Dict[str, Any], signature: Signature):
+        self.language = language
+        self.path = path
+        self.manifest = manifest
+        self.signature = signature
+        self.template: Optional[Template] = None
+    
+    @property
+    def id(self) -> str:
+        return str(self.manifest["id"])
+    
+    @property
+    def file_paths(self) -> List[str]:
+        files: List[str] = self.manifest["files"]
+        return files
+    
+    @property
+    def is_loaded(self) -> bool:
+        return self.template is not None
+    
+    def info(self) -> TemplateInfo:
+        """Catalog entry built from the manifest alone."""
+        manifest = self.manifest
+        return TemplateInfo(
+            id=manifest["id"],
+            name=manifest["name"],
+            description=manifest["description"],
+            language=self.language,
+            type=manifest["type"],
+            tags=manifest.get("tags", []),
+            complexity=manifest.get("complexity", "beginner"),
+            estimated_time=manifest.get("estimated_time", "5-10 minutes")
+        )
+    
+    def _read_file(self, relative: str) -> Tuple[str, Optional[str]]:
+        """Content of a pack file and its blob SHA, when already known."""
+        try:
+            with open(source_path(self.path, self.manifest, relative), encoding="utf-8", newline="") as f:
+                return f.read(), None
+        except OSError as e:
+            raise TemplateError(f"Template '{self.id}' is missing file '{relative}': {str(e)}")
+    
+    def load(self, blobs: BlobStore) -> Template:
+        """Read the pack files into the blob store and build the template, once."""
+        if self.template is None:
+            files: Dict[str, str] = {}
+            for relative in self.file_paths:
+                content, sha = self._read_file(relative)
+                files[relative] = blobs.intern(content, sha)
+            
+            manifest = self.manifest
+            self.template = Template(
+                id=manifest["id"],
+                name=manifest["name"],
+                description=manifest["description"],
+                language=self.language,
+                type=manifest["type"],
+                files=files,
+                variables=manifest.get("variables", {}),
+                dependencies=manifest.get("dependencies", []),
+                setup_instructions=manifest.get("setup_instructions")
+            )
+            logger.debug(f"Loaded template pack {self.id} ({len(files)} files)")
+        return self.template
+
+
+class SnapshotPack(TemplatePack):
+    """Pack whose files are read from a memory-mapped catalog snapshot."""
+    
+    __slots__ = ("snapshot", "file_shas")
+    
+    def __init__(self, language: str, path: Path, entry: Dict[str, Any], snapshot: CatalogSnapshot):
+        # The template digest stands in for the file stat signature
+        super().__init__(language, path, entry["manifest"], (("digest", entry["digest"]),))
+        self.snapshot = snapshot
+        self.file_shas = dict(zip(entry["manifest"]["files"], entry["files"]))
+    
+    def _read_file(self, relative: str) -> Tuple[str, Optional[str]]:
+        sha = self.file_shas[relative]
+        return self.snapshot.read_blob(sha), sha
+
+
+class TemplatePackStore:
+    """
+    Index of the template packs below a root directory.
+    
+    With a ``snapshot`` file (see ``app.services.catalog_snapshot``) the
+    index comes from the snapshot instead of walking the directory, and a
+    rebuilt snapshot is picked up like any changed pack.
+    """
+    
+    def __init__(self, root: Path, blobs: Optional[BlobStore] = None, snapshot: Optional[Path] = None):
+        self.root = Path(root)
+        self.blobs = blobs if blobs is not None else blob_store
+        self.snapshot_path = Path(snapshot) if snapshot else None
+        self.snapshot: Optional[CatalogSnapshot] = None
+        self.languages: Dict[str, LanguageInfo] = {}
+        self.packs: Dict[str, Dict[str, TemplatePack]] = {}
+        self._listeners: List[Callable[[str], None]] = []
+        self.scan()
+    
+    def subscribe(self, listener: Callable[[str], None]) -> None:
+        """Call ``listener(template_id)`` whenever a pack changes or disappears."""
+        self._listeners.append(listener)
+    
+    def _signature(self, pack_dir: Path, manifest: Dict[str, Any]) -> Signature:
+        entries = [(TEMPLATE_MANIFEST, *_stat(pack_dir / TEMPLATE_MANIFEST))]
+        for relative in manifest.get("files", []):
+            entries.append((relative, *_stat(source_path(pack_dir, manifest, relative))))
+        return tuple(entries)
+    
+    def _scan_directory(self) -> Tuple[List[Tuple[int, str, LanguageInfo]], Dict[str, Dict[str, TemplatePack]]]:
+        """Index the pack directories, reading only manifests."""
+        languages: List[Tuple[int, str, LanguageInfo]] = []
+        found: Dict[str, Dict[str, TemplatePack]] = {}
+        
+        if not self.root.is_dir():
+            logger.warning(f"Template directory {self.root} does not exist")
+            return languages, found
+        
+        for language_dir in sorted(self.root.iterdir()):
+            language_manifest = language_dir / LANGUAGE_MANIFEST
+            if not language_manifest.is_file():
+                continue
+            language = language_dir.name
+            data = _read_json(language_manifest)
+            order = data.pop("order", 0)
+            languages.append((order, language, LanguageInfo(id=language, **data)))
+            
+            previous = self.packs.get(language, {})
+            language_packs = found[language] = {}
+            for pack_dir in sorted(language_dir.iterdir()):
+                if not (pack_dir / TEMPLATE_MANIFEST).is_file():
+                    continue
+                try:
+                    manifest = _read_json(pack_dir / TEMPLATE_MANIFEST)
+                    template_id = manifest["id"]
+                    manifest.setdefault("files", [])
+                except (TemplateError, KeyError) as e:
+                    # Keep serving the last good version of a pack being edited
+                    logger.error(f"Skipping template pack {pack_dir}: {str(e)}")
+                    old = next((p for p in previous.values() if p.path == pack_dir), None)
+                    if old is not None:
+                        language_packs[old.id] = old
+                    continue
+                
+                signature = self._signature(pack_dir, manifest)
+                language_packs[template_id] = TemplatePack(language, pack_dir, manifest, signature)
+        
+        return languages, found
+    
+    def _scan_snapshot(
+        self,
+        path: Path
+    ) -> Tuple[List[Tuple[int, str, LanguageInfo]], Dict[str, Dict[str, TemplatePack]]]:
+        """Index the packs of the catalog snapshot at ``path``, reopening it when rebuilt."""
+        current = self.snapshot
+        if current is None or _stat(path) != current.stat:
+            current = CatalogSnapshot(path)
+            logger.info(f"Loaded catalog snapshot {current.path} (version {current.version[:12]})")
+            # Packs still indexed from the previous file keep its mapping alive
+            self.snapshot = current
+        
+        index = current.index
+        languages: List[Tuple[int, str, LanguageInfo]] = []
+        for entry in index["languages"]:
+            data = dict(entry)
+            order = data.pop("order", 0)
+            languages.append((order, data["id"], LanguageInfo(**data)))
+        
+        found: Dict[str, Dict[str, TemplatePack]] = {
+            language: {
+                template_id: SnapshotPack(language, self.root / language / template_id, entry, current)
+                for template_id, entry in entries.items()
+            }
+            for language, entries in index["templates"].items()
+        }
+        return languages, found
+    
+    def scan(self) -> List[str]:
+        """
+        Re-read the pack index.
+        
+        Packs whose manifest and files are unchanged keep their loaded
+        template; changed packs are indexed again and reloaded on next use.
+        
+        Returns:
+            Ids of the packs that changed, appeared or were removed
+        """
+        if self.snapshot_path is not None:
+            languages, found = self._scan_snapshot(self.snapshot_path)
+        else:
+            languages, found = self._scan_directory()
+        
+        packs: Dict[str, Dict[str, TemplatePack]] = {}
+        changed: List[str] = []
+        for language, candidates in found.items():
+            previous = self.packs.get(language, {})
+            language_packs = packs[language] = {}
+            for template_id, pack in candidates.items():
+                old = previous.get(template_id)
+                if old is not None and old.signature == pack.signature and old.path == pack.path:
+                    language_packs[template_id] = old
+                    continue
+                language_packs[template_id] = pack
+                if old is not None or self.packs:
+                    changed.append(template_id)
+            changed.extend(template_id for template_id in previous if template_id not in language_packs)
+        
+        for language, language_packs in self.packs.items():
+            if language not in packs:
+                changed.extend(language_packs)
+        
+        # Free the file contents of packs that were replaced or removed
+        for language, language_packs in self.packs.items():
+            for template_id, pack in language_packs.items():
+                if pack.template is not None and packs.get(language, {}).get(template_id) is not pack:
+                    self.blobs.release(pack.template.files.values())
+        
+        self.languages = {language: info for _, language, info in sorted(languages, key=lambda item: item[0])}
+        self.packs = packs
+        
+        for template_id in changed:
+            for listener in self._listeners:
+                listener(template_id)
+        if changed:
+            logger.info(f"Template packs changed: {', '.join(changed)}")
+        return changed
+    
+    def get_pack(self, language: str, template_id: str) -> Optional[TemplatePack]:
+        """Index entry of a pack, or None when it does not exist."""
+        return self.packs.get(language, {}).get(template_id)
+    
+    def get(self, language: str, template_id: str) -> Optional[Template]:
+        """Template of a pack, loading its files on first use."""
+        pack = self.get_pack(language, template_id)
+        return pack.load(self.blobs) if pack is not None else None
+    
+    def loaded_count(self) -> int:
+        """Number of packs whose files are currently in memory."""
+        return sum(pack.is_loaded for packs in self.packs.values() for pack in packs.values())
+    
+    async def watch(self, stop_event: Optional[asyncio.Event] = None, poll_interval: float = 2.0) -> None:
+        """
+        Rescan the packs whenever files below the root directory (or the
+        snapshot's directory) change.
+        
+        Uses ``watchfiles`` for filesystem notifications and falls back to
+        polling every ``poll_interval`` seconds when it is not installed.
+        
+        Args:
+            stop_event: Event that ends the watch when set
+            poll_interval: Seconds between scans when polling
+        """
+        stop_event = stop_event or asyncio.Event()
+        try:
+            from watchfiles import awatch
+        except ImportError:
+            awatch = None
+        
+        watched = self.snapshot_path.parent if self.snapshot_path is not None else self.root
+        if awatch is not None and watched.is_dir():
+            async for _ in awatch(watched, stop_event=stop_event):
+                self._rescan()
+            return
+        
+        while not stop_event.is_set():
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=poll_interval)
+            except asyncio.TimeoutError:
+                self._rescan()
+    
+    def _rescan(self) -> None:
+        try:
+            self.scan()
+        except Exception as e:
+            logger.error(f"Failed to rescan template packs: {str(e)}")
@@ -0,0 +1,92 @@
+"""
+Time-based cache for expensive read results.
+"""
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    In-process cache whose entries expire ``ttl`` seconds after being stored.
+    
+    ``get_or_load`` coalesces concurrent misses for the same key into a
+    single load, so a burst of requests after expiry runs the query once.
+    
+    Args:
+        ttl: Seconds an entry stays valid; 0 disables caching
+        clock: Monotonic time source, replaceable in tests
+    """
+    
+    def __init__(self, ttl: float, clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._loading: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self.hits = 0
+        self.misses = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Cached value, or None when missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if self._clock() >= expires:
+            del self._entries[key]
+            return None
+        return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        if self.ttl > 0:
+            self._entries[key] = (self._clock() + self.ttl, value)
+    
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop one entry, or every entry when no key is given."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+    
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the cached value for ``key``, loading and storing it on a miss.
+        
+        Args:
+            key: Cache key
+            loader: Coroutine function producing the value
+        
+        Returns:
+            The cached or freshly loaded value
+        """
+        value = self.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+        
+        pending = self._loading.get(key)
+        if pending is not None:
+            self.hits += 1
+            return await asyncio.shield(pending)
+        
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._loading[key] = future
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters get the error; nobody else needs to retrieve it
+            future.exception()
+            raise
+        finally:
+            del self._loading[key]
+        self.set(key, value)
+        future.set_result(value)
+        return value
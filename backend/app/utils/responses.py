@@ -0,0 +1,182 @@
+"""
+Responses serialized straight from models read out of the database.
+
+``trusted_json`` sends a single value without response model validation;
+``read_json`` does so only for models the repositories marked trusted.
+``stream_json`` streams documents from a cursor as a JSON array or as
+NDJSON, so the response never holds more than one chunk of documents.
+"""
+import logging
+from typing import Any, AsyncIterator, Mapping, Optional
+
+from fastapi import Response
+from fastapi.responses import StreamingResponse
+from pydantic_core import to_json
+
+from app.models.base import StoredModel
+
+# format -> media type
+STREAM_FORMATS = {
+    "json": "application/json",
+    "ndjson": "application/x-ndjson",
+}
+
+# Serialized documents are sent once this many bytes are buffered
+STREAM_CHUNK_SIZE = 16 * 1024
+
+logger = logging.getLogger(__name__)
+
+# Marks an empty stream
+_END = object()
+
+
+def trusted_json(content: Any, status_code: int = 200, headers: Optional[Mapping[str, str]] = None) -> Response:
+    """
+    Serialize models into a JSON response.
+    
+    FastAPI validates a returned object against the route's
+    ``response_model`` before serializing it; a ``Response`` is sent as it
+    is. The ``response_model`` declarations stay for the OpenAPI schema.
+    
+    Args:
+        content: Models, or lists and dicts of them
+        status_code: HTTP status code
+        headers: Extra response headers
+    
+    Returns:
+        JSON response
+    """
+    return Response(
+        content=to_json(content),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json"
+    )
+
+
+def is_trusted(content: Any) -> bool:
+    """Whether every model in ``content`` was read from a document this service wrote."""
+    if isinstance(content, StoredModel):
+        return content.trusted
+    if isinstance(content, (list, tuple)):
+        return all(is_trusted(item) for item in content)
+    return False
+
+
+def read_json(
+    content: Any,
+    trusted: Any = None,
+    headers: Optional[Mapping[str, str]] = None
+) -> Any:
+    """
+    Return stored models from a read endpoint.
+    
+    When every model is trusted the response is ``trusted_json``;
+    otherwise ``content`` is returned as it is, for FastAPI to validate
+    against the route's ``response_model``. Routes setting ``headers``
+    must also set them on their ``Response`` parameter for that case.
+    
+    Args:
+        content: Value to send
+        trusted: Models deciding trust when ``content`` wraps them;
+            ``content`` itself by default
+        headers: Extra headers of the trusted response
+    """
+    if is_trusted(content if trusted is None else trusted):
+        return trusted_json(content, headers=headers)
+    return content
+
+
+def negotiate_stream_format(stream_format: Optional[str], accept: Optional[str]) -> str:
+    """
+    Pick the stream format from a ``format`` parameter or the Accept header.
+    
+    Raises:
+        ValueError: If ``stream_format`` is not one of ``STREAM_FORMATS``
+    """
+    if stream_format:
+        if stream_format not in STREAM_FORMATS:
+            raise ValueError(
+                f"Unsupported format '{stream_format}', use one of: {', '.join(STREAM_FORMATS)}"
+            )
+        return stream_format
+    if accept and STREAM_FORMATS["ndjson"] in accept:
+        return "ndjson"
+    return "json"
+
+
+def _encode(item: Any) -> bytes:
+    # ObjectIds of raw documents become their hex string
+    return to_json(item, fallback=str)
+
+
+async def _stream_chunks(
+    first: Any,
+    items: AsyncIterator[Any],
+    stream_format: str,
+    prefix: bytes,
+    suffix: bytes
+) -> AsyncIterator[bytes]:
+    ndjson = stream_format == "ndjson"
+    separator, terminator = (b"", b"\n") if ndjson else (b",", b"")
+    buffer = bytearray() if ndjson else bytearray(prefix)
+    try:
+        if first is not _END:
+            buffer += _encode(first) + terminator
+            # The first document goes out on its own so clients can start rendering
+            yield bytes(buffer)
+            buffer.clear()
+            async for item in items:
+                buffer += separator + _encode(item) + terminator
+                if len(buffer) >= STREAM_CHUNK_SIZE:
+                    yield bytes(buffer)
+                    buffer.clear()
+    except Exception as e:
+        # The status line is already sent; the client sees a truncated body
+        logger.error(f"Error while streaming response: {str(e)}")
+        raise
+    finally:
+        close = getattr(items, "aclose", None)
+        if close is not None:
+            await close()
+    if not ndjson:
+        buffer += suffix
+    if buffer:
+        yield bytes(buffer)
+
+
+async def stream_json(
+    items: AsyncIterator[Any],
+    stream_format: str = "json",
+    prefix: bytes = b"[",
+    suffix: bytes = b"]",
+    headers: Optional[Mapping[str, str]] = None
+) -> StreamingResponse:
+    """
+    Stream models or documents as a chunked JSON array or as NDJSON.
+    
+    The first item is read before the response starts, so a failing query
+    is still reported with an error status instead of a truncated body.
+    Items are serialized as they come off the cursor, without response
+    model validation.
+    
+    Args:
+        items: Async iterator of models or documents, e.g. ``iter_all``
+        stream_format: One of ``STREAM_FORMATS``
+        prefix: Opening of the JSON body, for wrapping the array in an
+            object; not used for NDJSON
+        suffix: Closing of the JSON body
+        headers: Extra response headers
+    
+    Returns:
+        Streaming response
+    """
+    try:
+        first = await items.__anext__()
+    except StopAsyncIteration:
+        first = _END
+    return StreamingResponse(
+        _stream_chunks(first, items, stream_format, prefix, suffix),
+        media_type=STREAM_FORMATS[stream_format],
+        headers=headers
+    )
@@ -0,0 +1,214 @@
+"""
+Background job worker entry point.
+
+Run one or more worker processes next to the API:
+
+    python -m app.worker
+
+Workers claim jobs from the ``jobs`` collection atomically, so any number
+of them can run against the same database.
+"""
+import asyncio
+import os
+import signal
+import socket
+from typing import Any, Callable, Coroutine, Dict, Optional
+import uuid
+
+from app.config.settings import settings
+from app.core.database import database
+from app.core.exceptions import GitHubRequestError, ValidationError
+from app.core.logging import setup_logging, get_logger
+from app.models.job import Job
+from app.models.project import ProjectRequest
+from app.repositories.indexes import ensure_indexes
+from app.repositories.job import JobRepository
+from app.repositories.project import ProjectRepository
+from app.services.github_client import github_client
+from app.services.github_service import GitHubService
+from app.services.project_service import ProjectService
+from app.services.template_service import TemplateService
+
+logger = get_logger(__name__)
+
+JobHandler = Callable[[Job], Coroutine[Any, Any, Dict[str, Any]]]
+
+
+class Worker:
+    """Polls the job queue and runs claimed jobs."""
+    
+    def __init__(
+        self,
+        project_service: ProjectService,
+        job_repository: JobRepository,
+        worker_id: Optional[str] = None
+    ):
+        self.project_service = project_service
+        self.job_repository = job_repository
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self.handlers: Dict[str, JobHandler] = {
+            "generate_project": self._generate_project,
+            "upgrade_project": self._upgrade_project,
+            "upgrade_projects": self._upgrade_projects,
+        }
+        self._stopping = asyncio.Event()
+    
+    async def _generate_project(self, job: Job) -> Dict[str, Any]:
+        """Run a project generation job."""
+        request = ProjectRequest(**job.payload)
+        
+        async def save_progress(progress: Dict[str, Any]) -> None:
+            await self.job_repository.heartbeat(job.id, self.worker_id, progress)
+        
+        # A retry resumes after the steps the failed attempt completed
+        response = await self.project_service.create_project(
+            request,
+            progress=dict(job.progress),
+            on_progress=save_progress
+        )
+        return response.dict()
+    
+    async def _upgrade_project(self, job: Job) -> Dict[str, Any]:
+        """Run an upgrade job for one project."""
+        project_id = job.payload["project_id"]
+        project = await self.project_service.get_project_by_id(project_id)
+        if not project:
+            raise ValidationError(f"Project '{project_id}' not found")
+        return await self.project_service.upgrade_project(project, force=job.payload.get("force", False))
+    
+    async def _upgrade_projects(self, job: Job) -> Dict[str, Any]:
+        """Run an upgrade job across every matching project."""
+        return await self.project_service.upgrade_projects(
+            language=job.payload.get("language"),
+            template_id=job.payload.get("template_id"),
+            force=job.payload.get("force", False),
+            concurrency=settings.upgrade_concurrency
+        )
+    
+    async def run_once(self) -> bool:
+        """
+        Claim and run a single job.
+        
+        Returns:
+            True if a job was processed, False if the queue was empty
+        """
+        job = await self.job_repository.claim_next(
+            self.worker_id,
+            settings.job_lock_timeout,
+            settings.job_max_attempts
+        )
+        if not job:
+            return False
+        
+        logger.info(f"Worker {self.worker_id} running job {job.id} ({job.type}, attempt {job.attempts})")
+        
+        handler = self.handlers.get(job.type)
+        if handler is None:
+            await self.job_repository.mark_failed(job.id, self.worker_id, f"Unknown job type '{job.type}'", retry=False)
+            return True
+        
+        running = asyncio.create_task(handler(job))
+        heartbeat = asyncio.create_task(self._heartbeat(job))
+        try:
+            # The heartbeat only returns once the lock is lost
+            await asyncio.wait({running, heartbeat}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            heartbeat.cancel()
+            if not running.done():
+                running.cancel()
+                await asyncio.gather(running, return_exceptions=True)
+        
+        if running.cancelled():
+            # Another worker owns the job now; stop so it does not run twice
+            logger.warning(f"Worker {self.worker_id} abandoned job {job.id} after losing its lock")
+            return True
+        
+        try:
+            result = running.result()
+        except Exception as e:
+            # These fail the same way on every attempt
+            retry = (
+                not isinstance(e, (ValidationError, GitHubRequestError))
+                and job.attempts < settings.job_max_attempts
+            )
+            delay = settings.job_retry_delay * 2 ** (job.attempts - 1)
+            logger.error(f"Job {job.id} failed (retry={retry}): {str(e)}")
+            await self.job_repository.mark_failed(job.id, self.worker_id, str(e), retry=retry, retry_delay=delay)
+            return True
+        
+        await self.job_repository.mark_succeeded(job.id, self.worker_id, result)
+        logger.info(f"Job {job.id} succeeded")
+        return True
+    
+    async def _heartbeat(self, job: Job) -> None:
+        """Keep renewing a job's lock so it is not reclaimed while it runs."""
+        interval = min(settings.job_heartbeat_interval, settings.job_lock_timeout / 3)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if not await self.job_repository.heartbeat(job.id, self.worker_id):
+                    logger.warning(f"Worker {self.worker_id} lost the lock of job {job.id}")
+                    return
+            except Exception as e:
+                # The next beat tries again; the lock timeout leaves room for a few misses
+                logger.error(f"Failed to renew lock of job {job.id}: {str(e)}")
+    
+    async def run(self) -> None:
+        """Process jobs until stopped, sleeping while the queue is empty."""
+        logger.info(f"Worker {self.worker_id} started")
+        while not self._stopping.is_set():
+            try:
+                processed = await self.run_once()
+            except Exception as e:
+                logger.error(f"Worker loop error: {str(e)}")
+                processed = False
+            
+            if not processed:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=settings.job_poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+        logger.info(f"Worker {self.worker_id} stopped")
+    
+    def stop(self) -> None:
+        """Ask the worker to stop after the current job."""
+        self._stopping.set()
+
+
+async def run_worker() -> None:
+    """Connect to dependencies and run a worker until SIGINT/SIGTERM."""
+    await database.connect()
+    await ensure_indexes()
+    
+    job_repository = JobRepository()
+    template_service = TemplateService()
+    project_service = ProjectService(
+        ProjectRepository(),
+        GitHubService(),
+        template_service,
+        job_repository
+    )
+    worker = Worker(project_service, job_repository)
+    
+    template_watch_stop = asyncio.Event()
+    template_watch = None
+    if settings.templates_hot_reload:
+        template_watch = asyncio.create_task(template_service.store.watch(template_watch_stop))
+    
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+    
+    try:
+        await worker.run()
+    finally:
+        if template_watch is not None:
+            template_watch_stop.set()
+            await template_watch
+        await github_client.close()
+        await database.disconnect()
+
+
+if __name__ == "__main__":
+    setup_logging()
+    asyncio.run(run_worker())
@@ -11,6 +11,8 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=settings.debug,
+        # Templates and the catalog snapshot are reloaded without a restart
+        reload_dirs=["app"],
         log_level=settings.log_level.lower(),
         access_log=True
     )
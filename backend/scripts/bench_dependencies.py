@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-request service construction against shared instances.
+
+Compares the old dependency behaviour (a new ProjectRepository,
+GitHubService and TemplateService on every request) with the
+application-scoped services created in the lifespan, both as bare
+construction cost and through the ASGI app on a catalog endpoint.
+
+    cd backend
+    python scripts/bench_dependencies.py --requests 500
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "scaffold_forge_bench")
+os.environ.setdefault("GITHUB_TOKEN", "bench-token")
+
+import httpx  # noqa: E402
+
+from app.dependencies import get_project_service, get_template_service, init_services  # noqa: E402
+from app.main import app  # noqa: E402
+from app.repositories.project import ProjectRepository  # noqa: E402
+from app.services.github_service import GitHubService  # noqa: E402
+from app.services.project_service import ProjectService  # noqa: E402
+from app.services.template_service import TemplateService  # noqa: E402
+
+
+def build_per_request() -> ProjectService:
+    """What every request used to do."""
+    return ProjectService(ProjectRepository(), GitHubService(), TemplateService())
+
+
+def bench_construction(iterations: int) -> None:
+    """Time service construction versus a lookup of the shared instance."""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        build_per_request()
+    per_request = (time.perf_counter() - started) / iterations
+    
+    class FakeRequest:
+        pass
+    
+    request = FakeRequest()
+    request.app = app
+    started = time.perf_counter()
+    for _ in range(iterations):
+        get_project_service(request)
+    shared = (time.perf_counter() - started) / iterations
+    
+    print(f"construction: per-request {per_request * 1e6:,.0f} us, shared {shared * 1e6:,.2f} us")
+
+
+async def bench_endpoint(requests: int) -> None:
+    """Time a catalog endpoint with per-request and shared dependencies."""
+    transport = httpx.ASGITransport(app=app)
+    
+    async def run() -> float:
+        async with httpx.AsyncClient(transport=transport, base_url="http://localhost") as client:
+            started = time.perf_counter()
+            for _ in range(requests):
+                response = await client.get("/api/templates/java")
+                response.raise_for_status()
+            return (time.perf_counter() - started) / requests
+    
+    # A factory, not the class: FastAPI would read TemplateService's
+    # constructor arguments as request parameters
+    app.dependency_overrides[get_template_service] = lambda: TemplateService()
+    per_request = await run()
+    app.dependency_overrides.clear()
+    shared = await run()
+    
+    print(
+        f"GET /api/templates/java: per-request {per_request * 1e3:.3f} ms, "
+        f"shared {shared * 1e3:.3f} ms ({per_request / shared:.1f}x)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=300)
+    args = parser.parse_args()
+    
+    # The lifespan needs MongoDB; the catalog endpoints only need the services
+    init_services(app)
+    bench_construction(args.requests)
+    asyncio.run(bench_endpoint(args.requests))
+
+
+if __name__ == "__main__":
+    main()
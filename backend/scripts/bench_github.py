@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark the GitHub push path against the local fake GitHub API.
+
+Starts tests.fake_github on a local port, then generates projects from the
+real template catalog through GitHubService and reports wall time and API
+calls per push mode.
+
+    cd backend
+    python scripts/bench_github.py --projects 20 --latency 0.05
+    python scripts/bench_github.py --secondary-limit-every 25
+"""
+import argparse
+import asyncio
+import os
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "scaffold_forge_bench")
+os.environ.setdefault("GITHUB_TOKEN", "bench-token")
+
+import uvicorn  # noqa: E402
+
+from app.services.github_client import GitHubClient  # noqa: E402
+from app.services.github_scheduler import RateLimitScheduler  # noqa: E402
+from app.services.github_service import GitHubService  # noqa: E402
+from app.services.template_service import TemplateService  # noqa: E402
+from tests.fake_github import FakeGitHubConfig, create_app  # noqa: E402
+
+
+def start_fake_server(config: FakeGitHubConfig):
+    """Run the fake API on a free port in a background thread."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    
+    app = create_app(config)
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    return server, app.state.fake, f"http://127.0.0.1:{port}"
+
+
+async def run_mode(mode: str, base_url: str, fake, file_sets, concurrency: int) -> dict:
+    """Generate every project in one push mode and collect timings."""
+    client = GitHubClient(token="bench-token", base_url=base_url, scheduler=RateLimitScheduler(reserve=0))
+    service = GitHubService(client)
+    service.push_mode = mode
+    calls_before = sum(fake.calls.values())
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    
+    async def generate(index: int, files: dict) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            repo = await service.create_repository(f"{mode}-bench-{index}", "Benchmark project")
+            await service.create_files(repo["name"], files)
+            latencies.append(time.perf_counter() - started)
+    
+    started = time.perf_counter()
+    await asyncio.gather(*(generate(i, files) for i, files in enumerate(file_sets)))
+    elapsed = time.perf_counter() - started
+    snapshot = client.scheduler.snapshot()
+    await client.close()
+    
+    latencies.sort()
+    return {
+        "mode": mode,
+        "projects": len(file_sets),
+        "elapsed": elapsed,
+        "p50": latencies[len(latencies) // 2],
+        "p95": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+        "api_calls": sum(fake.calls.values()) - calls_before,
+        "throttled": snapshot["throttled_total"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--projects", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=4, help="Projects generated at once")
+    parser.add_argument("--latency", type=float, default=0.02, help="Fake API latency per request")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--secondary-limit-every", type=int, default=0)
+    parser.add_argument("--modes", default="git_data,contents")
+    args = parser.parse_args()
+    
+    config = FakeGitHubConfig(
+        latency=args.latency,
+        error_rate=args.error_rate,
+        secondary_limit_every=args.secondary_limit_every,
+        retry_after=1
+    )
+    server, fake, base_url = start_fake_server(config)
+    
+    template_service = TemplateService()
+    templates = [
+        template_service.get_template(language, pack_id)
+        for language, packs in template_service.store.packs.items()
+        for pack_id in packs
+    ]
+    file_sets = []
+    for i in range(args.projects):
+        template = templates[i % len(templates)]
+        file_sets.append(template_service.process_template(
+            template,
+            {"project_name": f"bench-{i}", "project_description": "Benchmark project"}
+        ))
+    avg_files = sum(len(files) for files in file_sets) / len(file_sets)
+    print(f"{args.projects} projects, {avg_files:.1f} files on average, {args.latency * 1000:.0f} ms API latency")
+    
+    try:
+        for mode in args.modes.split(","):
+            result = asyncio.run(run_mode(mode, base_url, fake, file_sets, args.concurrency))
+            print(
+                f"{result['mode']:>9}: {result['elapsed']:.2f}s total, "
+                f"p50 {result['p50']:.2f}s, p95 {result['p95']:.2f}s per project, "
+                f"{result['api_calls']} API calls, {result['throttled']} throttled"
+            )
+    finally:
+        server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Benchmark the per-document cost of reading and returning stored documents.
+
+Compares building models with validation (``Model(**document)``, what the
+repositories do) against ``model_construct``, and a list endpoint where
+FastAPI validates the returned models against ``response_model`` against
+the same endpoint returning ``trusted_json``, which bypasses that
+validation. Documents are generated in memory in the shape Motor returns
+them, so no MongoDB is needed.
+
+Measured over eight runs with the pinned fastapi 0.110.1 and pydantic
+2.11.9 (500 documents): ``trusted_json`` was 1.4-1.9x faster per document
+than the validated endpoint, and ``model_construct`` plus ``trusted_json``
+0.9-1.8x. Building a model with ``model_construct`` cost 1.6-2.1x as much
+as the validated build, so repositories keep building models with the
+validator and the read endpoints skip only the response validation, for
+documents the service wrote itself.
+
+    cd backend
+    python scripts/bench_validation.py --documents 500 --rounds 50
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "scaffold_forge_bench")
+os.environ.setdefault("GITHUB_TOKEN", "bench-token")
+
+import httpx  # noqa: E402
+from bson import ObjectId  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+
+from app.models.project import Project  # noqa: E402
+from app.utils.responses import trusted_json  # noqa: E402
+
+
+def make_documents(count: int) -> List[dict]:
+    """Project documents as ``find`` returns them, with ``id`` already set."""
+    created_at = datetime(2024, 1, 1)
+    documents = []
+    for i in range(count):
+        object_id = ObjectId()
+        documents.append({
+            "_id": object_id,
+            "id": str(object_id),
+            "name": f"project-{i}",
+            "description": "Generated by the validation benchmark",
+            "language": "java",
+            "template_id": "java-spring-boot",
+            "github_username": f"user-{i % 20}",
+            "repository_url": f"https://github.com/user-{i % 20}/project-{i}",
+            "status": "created",
+            "created_at": created_at + timedelta(seconds=i),
+            "updated_at": None,
+            "metadata": {"files_created": 42, "github_repo": f"project-{i}", "template_digest": "0" * 40}
+        })
+    return documents
+
+
+def bench_build(documents: List[dict], rounds: int) -> None:
+    """Time building models from documents, validated and constructed."""
+    def run(build) -> float:
+        started = time.perf_counter()
+        for _ in range(rounds):
+            for document in documents:
+                build(**document)
+        return (time.perf_counter() - started) / (rounds * len(documents))
+    
+    validated = run(Project)
+    constructed = run(Project.model_construct)
+    print(
+        f"model build: validated {validated * 1e6:.2f} us/doc, "
+        f"model_construct {constructed * 1e6:.2f} us/doc"
+    )
+
+
+async def bench_response(documents: List[dict], rounds: int) -> None:
+    """Time a list endpoint end to end through the ASGI stack."""
+    app = FastAPI()
+    
+    @app.get("/validated", response_model=List[Project])
+    async def validated():
+        return [Project(**document) for document in documents]
+    
+    @app.get("/trusted", response_model=List[Project])
+    async def trusted():
+        return trusted_json([Project(**document) for document in documents])
+    
+    @app.get("/constructed", response_model=List[Project])
+    async def constructed():
+        return trusted_json([Project.model_construct(**document) for document in documents])
+    
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://localhost") as client:
+        async def run(path: str) -> float:
+            started = time.perf_counter()
+            for _ in range(rounds):
+                response = await client.get(path)
+                response.raise_for_status()
+            return (time.perf_counter() - started) / (rounds * len(documents))
+        
+        first = (await client.get("/validated")).json()
+        for path in ("/trusted", "/constructed"):
+            assert first == (await client.get(path)).json(), f"{path} differs"
+        
+        validated_cost = await run("/validated")
+        trusted_cost = await run("/trusted")
+        constructed_cost = await run("/constructed")
+    
+    print(f"list endpoint ({len(documents)} docs):")
+    print(f"  response_model validation  {validated_cost * 1e6:6.2f} us/doc")
+    print(f"  trusted_json               {trusted_cost * 1e6:6.2f} us/doc ({validated_cost / trusted_cost:.1f}x)")
+    print(f"  model_construct + trusted  {constructed_cost * 1e6:6.2f} us/doc ({validated_cost / constructed_cost:.1f}x)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+    
+    documents = make_documents(args.documents)
+    bench_build(documents, args.rounds)
+    asyncio.run(bench_response(documents, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Compile the template packs into a memory-mapped catalog snapshot.
+
+Workflow files shared by several packs live once under
+templates/_fragments and are mapped into packs by their manifests; edit
+them there. Rebuilds are incremental: only sources whose stat changed
+since the existing snapshot are read again. The change manifest lists the
+templates that were added, changed or removed, for targeted invalidation of
+downstream caches.
+
+Point TEMPLATES_SNAPSHOT at the output to have the API and worker read the
+catalog from it instead of the pack directory.
+
+    cd backend
+    python scripts/build_catalog.py --output catalog.snapshot
+    python scripts/build_catalog.py --changes changes.json
+    python scripts/build_catalog.py --full
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from app.services.catalog_snapshot import build_snapshot  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--root", type=Path, default=BACKEND_DIR / "templates", help="Template pack directory")
+    parser.add_argument("--output", type=Path, default=BACKEND_DIR / "catalog.snapshot", help="Snapshot file to write")
+    parser.add_argument("--changes", type=Path, help="Write the change manifest to this JSON file")
+    parser.add_argument("--full", action="store_true", help="Read every source instead of reusing the existing snapshot")
+    args = parser.parse_args()
+    
+    changes = build_snapshot(args.root, args.output, incremental=not args.full)
+    if args.changes:
+        args.changes.write_text(json.dumps(changes, indent=2) + "\n", encoding="utf-8")
+    
+    print(f"Wrote {args.output} (catalog {changes['catalog_version'][:12]})")
+    for kind in ("added", "changed", "removed"):
+        if changes[kind]:
+            print(f"  {kind}: {', '.join(changes[kind])}")
+    print(f"  {len(changes['unchanged'])} unchanged, {len(changes['sources_read'])} sources read")
+
+
+if __name__ == "__main__":
+    main()
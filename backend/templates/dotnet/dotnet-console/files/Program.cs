@@ -0,0 +1,15 @@
+using System;
+
+namespace {project_name}
+{
+    class Program
+    {
+        static void Main(string[] args)
+        {
+            Console.WriteLine("Hello World from {project_name}!");
+            Console.WriteLine("Generated by Scaffold Forge");
+            Console.WriteLine("Press any key to exit...");
+            Console.ReadKey();
+        }
+    }
+}
\ No newline at end of file
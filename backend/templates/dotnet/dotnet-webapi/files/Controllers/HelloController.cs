@@ -0,0 +1,28 @@
+using Microsoft.AspNetCore.Mvc;
+
+namespace {project_name}.Controllers;
+
+[ApiController]
+[Route("api/[controller]")]
+public class HelloController : ControllerBase
+{
+    [HttpGet]
+    public IActionResult Get()
+    {
+        return Ok(new { 
+            message = "Hello from {project_name}!", 
+            status = "success",
+            timestamp = DateTime.UtcNow
+        });
+    }
+    
+    [HttpGet("health")]
+    public IActionResult Health()
+    {
+        return Ok(new { 
+            status = "UP", 
+            service = "{project_name}",
+            timestamp = DateTime.UtcNow
+        });
+    }
+}
\ No newline at end of file
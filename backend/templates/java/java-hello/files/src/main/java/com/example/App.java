@@ -0,0 +1,8 @@
+package com.example;
+
+public class App {
+    public static void main(String[] args) {
+        System.out.println("Hello World from {project_name}!");
+        System.out.println("Generated by Scaffold Forge");
+    }
+}
\ No newline at end of file
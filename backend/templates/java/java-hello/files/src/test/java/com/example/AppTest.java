@@ -0,0 +1,20 @@
+package com.example;
+
+import org.junit.jupiter.api.Test;
+import static org.junit.jupiter.api.Assertions.*;
+
+public class AppTest {
+    
+    @Test
+    public void testAppMain() {
+        // This is a simple test to ensure the CI workflow works
+        assertTrue(true, "Basic test should pass");
+    }
+    
+    @Test
+    public void testHelloWorld() {
+        String message = "Hello World from {project_name}!";
+        assertNotNull(message);
+        assertTrue(message.contains("Hello World"));
+    }
+}
\ No newline at end of file
@@ -0,0 +1,26 @@
+package com.example.controller;
+
+import org.springframework.web.bind.annotation.*;
+import java.util.Map;
+import java.util.HashMap;
+
+@RestController
+@RequestMapping("/api")
+public class HelloController {
+    
+    @GetMapping("/hello")
+    public Map<String, String> hello() {
+        Map<String, String> response = new HashMap<>();
+        response.put("message", "Hello from {project_name}!");
+        response.put("status", "success");
+        return response;
+    }
+    
+    @GetMapping("/health")
+    public Map<String, String> health() {
+        Map<String, String> response = new HashMap<>();
+        response.put("status", "UP");
+        response.put("service", "{project_name}");
+        return response;
+    }
+}
\ No newline at end of file
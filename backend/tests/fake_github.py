@@ -0,0 +1,413 @@
+"""
+Local stand-in for the GitHub REST API.
+
+Implements the endpoints GitHubService uses (user, repos, contents and the
+git blobs/trees/commits/refs API) in memory, with configurable latency,
+rate-limit headers and error injection. Use it in-process through
+``httpx.ASGITransport`` in tests, or run it as a real HTTP server for
+benchmarks:
+
+    python -m tests.fake_github --port 9000 --latency 0.05
+
+and point the backend at it with ``GITHUB_API_URL=http://127.0.0.1:9000``.
+"""
+import argparse
+import asyncio
+import base64
+import hashlib
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+
+@dataclass
+class FakeGitHubConfig:
+    """Behaviour knobs for the fake API."""
+    
+    login: str = "fake-user"
+    latency: float = 0.0  # seconds added to every request
+    jitter: float = 0.0  # extra random latency, up to this many seconds
+    rate_limit: int = 5000  # requests per window
+    rate_limit_window: int = 3600  # seconds
+    error_rate: float = 0.0  # probability of a 502 response
+    secondary_limit_every: int = 0  # every Nth request gets a 403 with Retry-After
+    retry_after: int = 1
+    seed: Optional[int] = None
+
+
+@dataclass
+class FakeRepository:
+    """In-memory git object store of one repository."""
+    
+    name: str
+    description: str = ""
+    private: bool = False
+    default_branch: str = "main"
+    blobs: Dict[str, str] = field(default_factory=dict)
+    trees: Dict[str, Dict[str, str]] = field(default_factory=dict)  # sha -> {path: blob sha}
+    commits: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    refs: Dict[str, str] = field(default_factory=dict)
+    created_at: str = field(default_factory=lambda: time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()))
+
+
+def _sha(kind: str, data: bytes) -> str:
+    """Hash an object the way git does."""
+    return hashlib.sha1(f"{kind} {len(data)}\0".encode() + data).hexdigest()
+
+
+class FakeGitHub:
+    """State and behaviour of the fake API."""
+    
+    def __init__(self, config: Optional[FakeGitHubConfig] = None):
+        self.config = config or FakeGitHubConfig()
+        self.repos: Dict[str, FakeRepository] = {}
+        self.calls: Counter = Counter()
+        self.remaining = self.config.rate_limit
+        self.window_reset = time.time() + self.config.rate_limit_window
+        self._random = random.Random(self.config.seed)
+        self._count = 0
+    
+    # Git objects
+    
+    def store_blob(self, repo: FakeRepository, content: str) -> str:
+        sha = _sha("blob", content.encode("utf-8"))
+        repo.blobs[sha] = content
+        return sha
+    
+    def store_tree(self, repo: FakeRepository, entries: Dict[str, str]) -> str:
+        data = "\n".join(f"{path} {sha}" for path, sha in sorted(entries.items())).encode()
+        sha = _sha("tree", data)
+        repo.trees[sha] = dict(entries)
+        return sha
+    
+    def store_commit(self, repo: FakeRepository, message: str, tree: str, parents: List[str]) -> str:
+        data = f"{tree} {' '.join(parents)} {message} {time.time()}".encode()
+        sha = _sha("commit", data)
+        repo.commits[sha] = {"message": message, "tree": tree, "parents": parents}
+        return sha
+    
+    def head_tree(self, repo: FakeRepository) -> Dict[str, str]:
+        head = repo.refs.get(f"refs/heads/{repo.default_branch}")
+        return dict(repo.trees[repo.commits[head]["tree"]]) if head else {}
+    
+    def commit_count(self, repo_name: str) -> int:
+        """Number of commits reachable from the default branch."""
+        repo = self.repos[repo_name]
+        sha = repo.refs.get(f"refs/heads/{repo.default_branch}")
+        count = 0
+        while sha:
+            count += 1
+            parents = repo.commits[sha]["parents"]
+            sha = parents[0] if parents else None
+        return count
+    
+    def files(self, repo_name: str) -> Dict[str, str]:
+        """Contents of the default branch."""
+        repo = self.repos[repo_name]
+        return {path: repo.blobs[sha] for path, sha in self.head_tree(repo).items()}
+    
+    # Request plumbing
+    
+    def rate_headers(self) -> Dict[str, str]:
+        return {
+            "X-RateLimit-Limit": str(self.config.rate_limit),
+            "X-RateLimit-Remaining": str(max(self.remaining, 0)),
+            "X-RateLimit-Reset": str(int(self.window_reset)),
+            "X-RateLimit-Resource": "core"
+        }
+    
+    def admit(self) -> Optional[JSONResponse]:
+        """Apply quota and error injection; returns an error response or None."""
+        now = time.time()
+        if now >= self.window_reset:
+            self.remaining = self.config.rate_limit
+            self.window_reset = now + self.config.rate_limit_window
+        
+        self._count += 1
+        every = self.config.secondary_limit_every
+        if every and self._count % every == 0:
+            return JSONResponse(
+                {"message": "You have exceeded a secondary rate limit."},
+                status_code=403,
+                headers={"Retry-After": str(self.config.retry_after)}
+            )
+        if self.remaining <= 0:
+            return JSONResponse({"message": "API rate limit exceeded"}, status_code=403)
+        self.remaining -= 1
+        
+        if self.config.error_rate and self._random.random() < self.config.error_rate:
+            return JSONResponse({"message": "Server Error (injected)"}, status_code=502)
+        return None
+
+
+def _repo_json(fake: FakeGitHub, repo: FakeRepository) -> Dict[str, Any]:
+    owner = fake.config.login
+    return {
+        "name": repo.name,
+        "full_name": f"{owner}/{repo.name}",
+        "html_url": f"https://github.com/{owner}/{repo.name}",
+        "clone_url": f"https://github.com/{owner}/{repo.name}.git",
+        "ssh_url": f"git@github.com:{owner}/{repo.name}.git",
+        "description": repo.description,
+        "private": repo.private,
+        "default_branch": repo.default_branch,
+        "created_at": repo.created_at,
+        "updated_at": repo.created_at
+    }
+
+
+def _route_key(path: str) -> str:
+    """Collapse a request path to the endpoint it hits, for call statistics."""
+    parts = path.strip("/").split("/")
+    if parts[0] != "repos":
+        return path
+    if len(parts) <= 3:
+        return "repo"
+    if parts[3] == "git":
+        return "/".join(parts[3:5])
+    return parts[3]
+
+
+def _error(status: int, message: str) -> JSONResponse:
+    return JSONResponse({"message": message}, status_code=status)
+
+
+def create_app(config: Optional[FakeGitHubConfig] = None) -> FastAPI:
+    """Create the fake GitHub API application; state lives on ``app.state.fake``."""
+    fake = FakeGitHub(config)
+    app = FastAPI(title="Fake GitHub API")
+    app.state.fake = fake
+    
+    @app.middleware("http")
+    async def simulate(request: Request, call_next):
+        cfg = fake.config
+        delay = cfg.latency + (fake._random.random() * cfg.jitter if cfg.jitter else 0)
+        if delay:
+            await asyncio.sleep(delay)
+        
+        fake.calls[f"{request.method} {_route_key(request.url.path)}"] += 1
+        if request.url.path.startswith("/_fake") or request.url.path == "/rate_limit":
+            response = await call_next(request)
+        else:
+            response = fake.admit() or await call_next(request)
+        response.headers.update(fake.rate_headers())
+        return response
+    
+    def get_repo(owner: str, name: str) -> Optional[FakeRepository]:
+        if owner != fake.config.login:
+            return None
+        return fake.repos.get(name)
+    
+    @app.get("/_fake/stats")
+    async def stats():
+        return {"calls": dict(fake.calls), "total": sum(fake.calls.values()), "repos": len(fake.repos)}
+    
+    @app.get("/rate_limit")
+    async def rate_limit():
+        core = {
+            "limit": fake.config.rate_limit,
+            "remaining": fake.remaining,
+            "reset": int(fake.window_reset)
+        }
+        return {"resources": {"core": core}, "rate": core}
+    
+    @app.get("/user")
+    async def user():
+        return {"login": fake.config.login, "id": 1, "type": "User"}
+    
+    @app.post("/user/repos", status_code=201)
+    async def create_repo(request: Request):
+        body = await request.json()
+        name = body["name"]
+        if name in fake.repos:
+            return _error(422, "Repository creation failed: name already exists on this account")
+        repo = FakeRepository(name=name, description=body.get("description") or "", private=body.get("private", False))
+        fake.repos[name] = repo
+        if body.get("auto_init"):
+            blob = fake.store_blob(repo, f"# {name}\n")
+            tree = fake.store_tree(repo, {"README.md": blob})
+            repo.refs[f"refs/heads/{repo.default_branch}"] = fake.store_commit(repo, "Initial commit", tree, [])
+        return _repo_json(fake, repo)
+    
+    @app.get("/repos/{owner}/{name}")
+    async def read_repo(owner: str, name: str):
+        repo = get_repo(owner, name)
+        return _repo_json(fake, repo) if repo else _error(404, "Not Found")
+    
+    @app.delete("/repos/{owner}/{name}", status_code=204)
+    async def delete_repo(owner: str, name: str):
+        if not get_repo(owner, name):
+            return _error(404, "Not Found")
+        del fake.repos[name]
+    
+    @app.put("/repos/{owner}/{name}/contents/{path:path}", status_code=201)
+    async def put_contents(owner: str, name: str, path: str, request: Request):
+        repo = get_repo(owner, name)
+        if not repo:
+            return _error(404, "Not Found")
+        body = await request.json()
+        entries = fake.head_tree(repo)
+        if path in entries and "sha" not in body:
+            return _error(422, '"sha" wasn\'t supplied.')
+        entries[path] = fake.store_blob(repo, base64.b64decode(body["content"]).decode("utf-8"))
+        ref = f"refs/heads/{body.get('branch') or repo.default_branch}"
+        parents = [repo.refs[ref]] if ref in repo.refs else []
+        repo.refs[ref] = fake.store_commit(repo, body["message"], fake.store_tree(repo, entries), parents)
+        return {"content": {"path": path, "sha": entries[path]}, "commit": {"sha": repo.refs[ref]}}
+    
+    @app.post("/repos/{owner}/{name}/git/blobs", status_code=201)
+    async def create_blob(owner: str, name: str, request: Request):
+        repo = get_repo(owner, name)
+        if not repo:
+            return _error(404, "Not Found")
+        if not repo.refs:
+            return _error(409, "Git Repository is empty.")
+        body = await request.json()
+        content = body["content"]
+        if body.get("encoding") == "base64":
+            content = base64.b64decode(content).decode("utf-8")
+        return {"sha": fake.store_blob(repo, content)}
+    
+    @app.get("/repos/{owner}/{name}/git/blobs/{sha}")
+    async def read_blob(owner: str, name: str, sha: str):
+        repo = get_repo(owner, name)
+        if not repo or sha not in repo.blobs:
+            return _error(404, "Not Found")
+        content = repo.blobs[sha]
+        return {"sha": sha, "encoding": "base64", "content": base64.b64encode(content.encode()).decode(), "size": len(content.encode())}
+    
+    @app.post("/repos/{owner}/{name}/git/trees", status_code=201)
+    async def create_tree(owner: str, name: str, request: Request):
+        repo = get_repo(owner, name)
+        if not repo:
+            return _error(404, "Not Found")
+        if not repo.refs:
+            return _error(409, "Git Repository is empty.")
+        body = await request.json()
+        entries = dict(repo.trees.get(body.get("base_tree"), {})) if body.get("base_tree") else {}
+        for item in body["tree"]:
+            if "content" in item:
+                entries[item["path"]] = fake.store_blob(repo, item["content"])
+            elif item.get("sha") is None:
+                entries.pop(item["path"], None)
+            elif item["sha"] not in repo.blobs:
+                return _error(422, f"GitRPC::BadObjectState {item['sha']}")
+            else:
+                entries[item["path"]] = item["sha"]
+        sha = fake.store_tree(repo, entries)
+        return {"sha": sha, "tree": [{"path": p, "type": "blob", "mode": "100644", "sha": s} for p, s in sorted(entries.items())]}
+    
+    @app.get("/repos/{owner}/{name}/git/trees/{sha}")
+    async def read_tree(owner: str, name: str, sha: str):
+        # Trees are stored flat, so every listing is effectively recursive
+        repo = get_repo(owner, name)
+        if not repo:
+            return _error(404, "Not Found")
+        if sha in repo.commits:
+            sha = repo.commits[sha]["tree"]
+        elif f"refs/heads/{sha}" in repo.refs:
+            sha = repo.commits[repo.refs[f"refs/heads/{sha}"]]["tree"]
+        if sha not in repo.trees:
+            return _error(404, "Not Found")
+        tree = [{"path": p, "type": "blob", "mode": "100644", "sha": s} for p, s in sorted(repo.trees[sha].items())]
+        return {"sha": sha, "tree": tree, "truncated": False}
+    
+    @app.post("/repos/{owner}/{name}/git/commits", status_code=201)
+    async def create_commit(owner: str, name: str, request: Request):
+        repo = get_repo(owner, name)
+        if not repo:
+            return _error(404, "Not Found")
+        body = await request.json()
+        if body["tree"] not in repo.trees or any(p not in repo.commits for p in body.get("parents", [])):
+            return _error(422, "Tree or parent SHA does not exist")
+        sha = fake.store_commit(repo, body["message"], body["tree"], body.get("parents", []))
+        return {"sha": sha, "tree": {"sha": body["tree"]}, "message": body["message"]}
+    
+    @app.get("/repos/{owner}/{name}/git/commits/{sha}")
+    async def read_commit(owner: str, name: str, sha: str):
+        repo = get_repo(owner, name)
+        if not repo or sha not in repo.commits:
+            return _error(404, "Not Found")
+        commit = repo.commits[sha]
+        return {"sha": sha, "tree": {"sha": commit["tree"]}, "message": commit["message"],
+                "parents": [{"sha": p} for p in commit["parents"]]}
+    
+    @app.get("/repos/{owner}/{name}/git/ref/{ref:path}")
+    async def read_ref(owner: str, name: str, ref: str):
+        repo = get_repo(owner, name)
+        if not repo:
+            return _error(404, "Not Found")
+        if not repo.refs:
+            return _error(409, "Git Repository is empty.")
+        full = f"refs/{ref}"
+        if full not in repo.refs:
+            return _error(404, "Not Found")
+        return {"ref": full, "object": {"sha": repo.refs[full], "type": "commit"}}
+    
+    @app.post("/repos/{owner}/{name}/git/refs", status_code=201)
+    async def create_ref(owner: str, name: str, request: Request):
+        repo = get_repo(owner, name)
+        if not repo:
+            return _error(404, "Not Found")
+        body = await request.json()
+        if body["ref"] in repo.refs:
+            return _error(422, "Reference already exists")
+        repo.refs[body["ref"]] = body["sha"]
+        return {"ref": body["ref"], "object": {"sha": body["sha"], "type": "commit"}}
+    
+    @app.patch("/repos/{owner}/{name}/git/refs/{ref:path}")
+    async def update_ref(owner: str, name: str, ref: str, request: Request):
+        repo = get_repo(owner, name)
+        full = f"refs/{ref}"
+        if not repo or full not in repo.refs:
+            return _error(404, "Not Found")
+        body = await request.json()
+        new_sha = body["sha"]
+        if not body.get("force"):
+            # Fast-forward only: the current head must be an ancestor
+            sha, ancestors = new_sha, set()
+            while sha:
+                ancestors.add(sha)
+                parents = repo.commits.get(sha, {}).get("parents", [])
+                sha = parents[0] if parents else None
+            if repo.refs[full] not in ancestors:
+                return _error(422, "Update is not a fast forward")
+        repo.refs[full] = new_sha
+        return {"ref": full, "object": {"sha": new_sha, "type": "commit"}}
+    
+    return app
+
+
+def main() -> None:
+    """Run the fake API as an HTTP server."""
+    import uvicorn
+    
+    parser = argparse.ArgumentParser(description="Run a local fake GitHub API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency in seconds")
+    parser.add_argument("--rate-limit", type=int, default=5000, help="Requests per window")
+    parser.add_argument("--rate-limit-window", type=int, default=3600, help="Window length in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probability of an injected 502")
+    parser.add_argument("--secondary-limit-every", type=int, default=0, help="Every Nth request is throttled")
+    args = parser.parse_args()
+    
+    config = FakeGitHubConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        rate_limit=args.rate_limit,
+        rate_limit_window=args.rate_limit_window,
+        error_rate=args.error_rate,
+        secondary_limit_every=args.secondary_limit_every
+    )
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+In-memory stand-ins for Motor collections and cursors.
+
+Repositories under test get one through ``repository._collection``. The
+fakes hold canned documents and record how they were queried, so tests
+can assert on projections, sorts, pipelines and writes without MongoDB.
+Query filters are not evaluated, except by ``find_one``.
+"""
+from typing import Any, Dict, Iterable, List, Optional
+
+from pymongo.errors import DuplicateKeyError
+from pymongo.results import InsertManyResult
+
+
+class FakeCursor:
+    """Cursor over canned documents that records how it was shaped."""
+    
+    def __init__(self, documents: List[Dict[str, Any]]):
+        self.documents = documents
+        self.sorted_by = None
+        self.batch = None
+        self.closed = False
+    
+    def sort(self, sort):
+        self.sorted_by = sort
+        return self
+    
+    def skip(self, skip):
+        self.documents = self.documents[skip:]
+        return self
+    
+    def limit(self, limit):
+        self.documents = self.documents[:limit]
+        return self
+    
+    def batch_size(self, size):
+        self.batch = size
+        return self
+    
+    async def to_list(self, length):
+        return self.documents if length is None else self.documents[:length]
+    
+    def __aiter__(self):
+        return self._iterate()
+    
+    async def _iterate(self):
+        for document in self.documents:
+            yield document
+    
+    async def close(self):
+        self.closed = True
+
+
+class FakeCollection:
+    """
+    Collection over canned documents.
+    
+    Args:
+        documents: Documents returned by ``find``, copied on every query
+        aggregate_result: Documents returned by ``aggregate``
+        database: Object returned as ``collection.database``
+        index_information: Returned by ``index_information``
+        insert_error: Raised by ``insert_many`` instead of storing
+    """
+    
+    def __init__(
+        self,
+        documents: Optional[Iterable[Dict[str, Any]]] = None,
+        aggregate_result: Optional[List[Dict[str, Any]]] = None,
+        database: Any = None,
+        index_information: Optional[Dict[str, Any]] = None,
+        insert_error: Optional[Exception] = None
+    ):
+        self.documents = list(documents or [])
+        self.aggregate_result = aggregate_result or []
+        self.database = database
+        self._index_information = index_information or {}
+        self.insert_error = insert_error
+        self.projections = []
+        self.cursors = []
+        self.pipelines = []
+        self.operations = []
+    
+    def with_options(self, write_concern=None):
+        return self
+    
+    def find(self, query=None, projection=None):
+        self.projections.append(projection)
+        documents = [dict(document) for document in self.documents]
+        if projection:
+            documents = [{k: v for k, v in document.items() if k in projection} for document in documents]
+        self.cursors.append(FakeCursor(documents))
+        return self.cursors[-1]
+    
+    async def find_one(self, query):
+        for document in self.documents:
+            if all(document.get(key) == value for key, value in query.items()):
+                return dict(document)
+        return None
+    
+    def aggregate(self, pipeline):
+        self.pipelines.append(pipeline)
+        return FakeCursor(list(self.aggregate_result))
+    
+    async def insert_many(self, documents, ordered=True):
+        if self.insert_error is not None:
+            raise self.insert_error
+        self.documents.extend(documents)
+        return InsertManyResult([document.get("_id") for document in documents], True)
+    
+    async def insert_one(self, document):
+        if any(stored.get("_id") == document.get("_id") for stored in self.documents):
+            raise DuplicateKeyError(f"duplicate key: {document.get('_id')}")
+        self.documents.append(dict(document))
+    
+    async def delete_one(self, query):
+        for index, document in enumerate(self.documents):
+            if all(document.get(key) == value for key, value in query.items()):
+                del self.documents[index]
+                return
+    
+    async def bulk_write(self, operations, ordered=True):
+        self.operations.extend(operations)
+    
+    async def estimated_document_count(self):
+        return len(self.documents)
+    
+    async def index_information(self):
+        return self._index_information
+
+
+class FakeDatabase:
+    """Database holding fake collections; records creation and commands."""
+    
+    def __init__(
+        self,
+        collections: Optional[Dict[str, FakeCollection]] = None,
+        collection_infos: Iterable[Dict[str, Any]] = ()
+    ):
+        self.collections = collections or {}
+        self.collection_infos = list(collection_infos)
+        self.created = []
+        self.commands = []
+    
+    def __getitem__(self, name):
+        return self.collections[name]
+    
+    async def list_collections(self, filter=None):
+        name = (filter or {}).get("name")
+        return FakeCursor([info for info in self.collection_infos if name is None or info["name"] == name])
+    
+    async def create_collection(self, name, **options):
+        self.created.append((name, options))
+    
+    async def command(self, name, value, **kwargs):
+        self.commands.append((name, value, kwargs))
@@ -0,0 +1,158 @@
+"""
+GitHubService tests against the local fake GitHub API.
+"""
+import httpx
+import pytest
+
+from app.services.github_client import GitHubClient
+from app.services.github_scheduler import RateLimitScheduler
+from app.services.github_service import GitHubService
+from tests.fake_github import FakeGitHubConfig, create_app
+
+FILES = {
+    "README.md": "# demo\n",
+    "pom.xml": "<project/>\n",
+    "src/main/java/com/example/App.java": "class App {}\n",
+    ".github/workflows/ci.yml": "name: CI\n",
+}
+
+
+def make_service(config=None, push_mode="git_data"):
+    """Build a GitHubService wired to an in-process fake API."""
+    app = create_app(config)
+    client = GitHubClient(
+        token="test-token",
+        base_url="http://fake-github",
+        transport=httpx.ASGITransport(app=app),
+        scheduler=RateLimitScheduler(max_concurrency=4, reserve=0)
+    )
+    service = GitHubService(client)
+    service.push_mode = push_mode
+    return service, app.state.fake
+
+
+@pytest.mark.integration
+class TestGitHubServiceAgainstFake:
+    """Exercise the GitHub push paths end to end."""
+    
+    @pytest.mark.asyncio
+    async def test_single_commit_push(self):
+        """Test that git_data mode pushes every file in one commit."""
+        service, fake = make_service()
+        repo = await service.create_repository("demo", "Demo project")
+        await service.create_files(repo["name"], FILES, "Initial commit: demo")
+        
+        assert fake.files("demo") == FILES
+        # GitHub's auto-init commit plus ours
+        assert fake.commit_count("demo") == 2
+        # Small unique files travel inline in the tree request
+        assert fake.calls["POST git/blobs"] == 0
+        assert fake.calls["POST git/trees"] == 1
+        assert fake.calls["POST git/commits"] == 1
+        assert fake.calls["PATCH git/refs"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_blobs_are_uploaded_once(self):
+        """Test that shared and large contents get one blob upload each."""
+        service, fake = make_service()
+        service.inline_blob_limit = 100
+        files = {
+            "a/ci.yml": "name: CI\n",
+            "b/ci.yml": "name: CI\n",
+            "big.txt": "x" * 500,
+            "small.txt": "small\n",
+        }
+        repo = await service.create_repository("demo", "Demo project")
+        await service.create_files(repo["name"], files)
+        
+        assert fake.files("demo") == files
+        assert fake.calls["POST git/blobs"] == 2
+    
+    @pytest.mark.asyncio
+    async def test_known_blobs_are_reused(self):
+        """Test that a second push references blobs the repository already has."""
+        service, fake = make_service()
+        service.inline_blob_limit = 0
+        repo = await service.create_repository("demo", "Demo project")
+        await service.create_files(repo["name"], FILES)
+        uploads = fake.calls["POST git/blobs"]
+        
+        changed = {**FILES, "README.md": "# demo v2\n"}
+        await service.create_files(repo["name"], changed, "Update")
+        
+        assert fake.files("demo") == changed
+        assert fake.calls["POST git/blobs"] == uploads + 1
+    
+    @pytest.mark.asyncio
+    async def test_contents_push(self):
+        """Test that contents mode makes one commit per file."""
+        service, fake = make_service(push_mode="contents")
+        repo = await service.create_repository("demo", "Demo project")
+        await service.create_files(repo["name"], FILES)
+        
+        assert fake.files("demo") == FILES
+        assert fake.commit_count("demo") == len(FILES)
+    
+    @pytest.mark.asyncio
+    async def test_empty_repository_falls_back_to_contents(self):
+        """Test the fallback when the Git Data API rejects an empty repository."""
+        service, fake = make_service(push_mode="contents")
+        repo = await service.create_repository("demo", "Demo project")
+        service.push_mode = "git_data"
+        await service.create_files(repo["name"], FILES)
+        
+        assert fake.files("demo") == FILES
+    
+    @pytest.mark.asyncio
+    async def test_secondary_rate_limit_is_retried(self):
+        """Test that throttled calls are retried and counted."""
+        config = FakeGitHubConfig(secondary_limit_every=5, retry_after=0)
+        service, fake = make_service(config)
+        repo = await service.create_repository("demo", "Demo project")
+        await service.create_files(repo["name"], FILES)
+        
+        assert fake.files("demo") == FILES
+        snapshot = service.client.scheduler.snapshot()
+        assert snapshot["throttled_total"] >= 1
+        assert snapshot["remaining"] is not None
+    
+    @pytest.mark.asyncio
+    async def test_existing_repository_is_rejected(self):
+        """Test that creating a repository twice fails."""
+        from app.core.exceptions import GitHubError
+        
+        service, _ = make_service()
+        await service.create_repository("demo", "Demo project")
+        with pytest.raises(GitHubError):
+            await service.create_repository("demo", "Demo project")
+    
+    @pytest.mark.asyncio
+    async def test_upgrade_pushes_only_changed_files(self):
+        """Test that an upgrade commits just the files whose blob differs."""
+        service, fake = make_service()
+        repo = await service.create_repository("demo", "Demo project")
+        await service.create_files(repo["name"], FILES)
+        
+        upgraded = {**FILES, ".github/workflows/ci.yml": "name: CI v2\n", "SECURITY.md": "# Security\n"}
+        result = await service.upgrade_files(repo["name"], upgraded, "Upgrade")
+        
+        assert result["changed_files"] == [".github/workflows/ci.yml", "SECURITY.md"]
+        assert result["unchanged_files"] == len(FILES) - 1
+        files = fake.files("demo")
+        assert {path: files[path] for path in upgraded} == upgraded
+        # The auto-init README and every other file stay in the base tree
+        assert fake.commit_count("demo") == 3
+        assert fake.calls["POST git/trees"] == 2
+    
+    @pytest.mark.asyncio
+    async def test_upgrade_up_to_date_repository(self):
+        """Test that nothing is committed when every file already matches."""
+        service, fake = make_service()
+        repo = await service.create_repository("demo", "Demo project")
+        await service.create_files(repo["name"], FILES)
+        
+        result = await service.upgrade_files(repo["name"], FILES, "Upgrade")
+        
+        assert result["commit"] is None
+        assert result["changed_files"] == []
+        assert fake.commit_count("demo") == 2
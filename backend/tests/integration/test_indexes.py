@@ -0,0 +1,261 @@
+"""
+Check that every repository query is served by an index.
+
+Runs the repository methods against a real MongoDB with command monitoring,
+then explains each recorded query and fails on collection scans. Queries
+on the time-series status check collection run against its buckets and
+also fail on blocking sorts. Skipped when no server is reachable at
+MONGO_URL.
+"""
+import os
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import monitoring
+
+from app.config.settings import settings
+from app.core.database import database
+from app.models.job import Job
+from app.models.project import Project
+from app.models.status import StatusCheck
+from app.repositories.base import KEYSET_SORT
+from app.repositories.indexes import ensure_indexes
+from app.repositories.job import JobRepository
+from app.repositories.project import ProjectRepository
+from app.repositories.status import StatusCheckRepository
+
+EXPLAINABLE = {"find", "aggregate", "count", "distinct", "update", "delete", "findAndModify"}
+# Driver fields that explain does not accept
+DRIVER_FIELDS = {"lsid", "$db", "$clusterTime", "txnNumber", "$readPreference", "cursor", "writeConcern"}
+
+
+class QueryRecorder(monitoring.CommandListener):
+    """Collect the query commands sent to the test database."""
+    
+    def __init__(self, db_name):
+        self.db_name = db_name
+        self.commands = []
+    
+    def started(self, event):
+        if event.database_name == self.db_name and event.command_name in EXPLAINABLE:
+            self.commands.append({k: v for k, v in event.command.items() if k not in DRIVER_FIELDS})
+    
+    def succeeded(self, event):
+        pass
+    
+    def failed(self, event):
+        pass
+
+
+def needs_index(command):
+    """Whether a query could use an index at all (whole-collection reads cannot)."""
+    name = next(iter(command))
+    if name == "find":
+        return bool(command.get("filter")) or bool(command.get("sort"))
+    if name == "aggregate":
+        return bool(command["pipeline"]) and "$match" in command["pipeline"][0] and command["pipeline"][0]["$match"]
+    if name == "update":
+        return bool(command["updates"][0]["q"])
+    if name == "delete":
+        return bool(command["deletes"][0]["q"])
+    if name == "distinct":
+        return False
+    return bool(command.get("query"))
+
+
+def stages(plan):
+    """Every stage name in a query plan tree."""
+    yield plan.get("stage")
+    for key in ("inputStage", "queryPlan"):
+        if key in plan:
+            yield from stages(plan[key])
+    for child in plan.get("inputStages", []):
+        yield from stages(child)
+
+
+def blocking_sorts(explain):
+    """
+    Sorts that read every matching document first.
+    
+    Time-series queries are rewritten into a pipeline over the bucket
+    collection: a sort served by the time index shows up as
+    ``$_internalBoundedSort``, any other as ``$sort`` (or a SORT plan stage
+    when the whole pipeline runs in the slot-based engine).
+    """
+    pipeline = [next(iter(stage)) for stage in explain.get("stages", [])]
+    found = [name for name in pipeline if name == "$sort"]
+    if "queryPlanner" in explain:
+        found += [stage for stage in stages(explain["queryPlanner"]["winningPlan"]) if stage == "SORT"]
+    return found
+
+
+def winning_plan(explain):
+    if "queryPlanner" in explain:
+        return explain["queryPlanner"]["winningPlan"]
+    # Aggregations report the plan of their first stage
+    return explain["stages"][0]["$cursor"]["queryPlanner"]["winningPlan"]
+
+
+@pytest_asyncio.fixture
+async def recorded_db():
+    """Point the global database at a throwaway database with a query recorder."""
+    url = os.environ.get("MONGO_URL", "mongodb://localhost:27017")
+    db_name = f"scaffold_forge_indexes_{uuid.uuid4().hex[:8]}"
+    recorder = QueryRecorder(db_name)
+    client = AsyncIOMotorClient(url, serverSelectionTimeoutMS=500, event_listeners=[recorder])
+    try:
+        await client.admin.command("ping")
+    except Exception:
+        client.close()
+        pytest.skip("MongoDB is not available")
+    
+    previous = database.client, database.database
+    database.client, database.database = client, client[db_name]
+    try:
+        await ensure_indexes()
+        yield client[db_name], recorder
+    finally:
+        database.client, database.database = previous
+        await client.drop_database(db_name)
+        client.close()
+
+
+@pytest.mark.integration
+class TestRepositoryIndexes:
+    """Every query the repositories issue must use an index."""
+    
+    @pytest.mark.asyncio
+    async def test_queries_use_indexes(self, recorded_db):
+        db, recorder = recorded_db
+        projects, jobs, checks = ProjectRepository(), JobRepository(), StatusCheckRepository()
+        
+        for i in range(20):
+            await projects.create(Project(
+                name=f"project-{i}", description="d", language="java" if i % 2 else "dotnet",
+                template_id="java-hello", github_username=f"user-{i % 3}", repository_url="u"
+            ))
+        project = await projects.get_by_name("project-3")
+        job = await jobs.create(Job(payload={}))
+        created_at = datetime.utcnow().replace(microsecond=0)
+        await checks.insert_many([
+            {**StatusCheck(client_name=f"client-{i % 3}").dict(), "created_at": created_at - timedelta(seconds=i // 2)}
+            for i in range(20)
+        ])
+        recorder.commands.clear()
+        
+        await projects.get_by_id(project.id)
+        await projects.get_by_name("project-3")
+        await projects.get_by_github_username("user-1")
+        await projects.get_by_language("java")
+        await projects.get_recent_projects(5)
+        await projects.get_all(filter_dict={"language": "java", "github_username": "user-1"})
+        _, cursor = await projects.get_page(limit=5)
+        await projects.get_page(limit=5, after=cursor)
+        _, cursor = await projects.get_page(limit=3, filter_dict={"language": "java"})
+        await projects.get_page(limit=3, after=cursor, filter_dict={"language": "java"})
+        await projects.count({"language": "java"})
+        await projects.get_project_stats()
+        await projects.bump_stats_version()
+        await projects.get_stats_version()
+        await projects.update_status(project.id, "ready")
+        async for _ in projects.iter_all({"language": "java", "template_id": "java-hello"}):
+            pass
+        async for _ in projects.iter_all({"github_username": "user-1"}, sort=KEYSET_SORT, summary=True):
+            pass
+        
+        await jobs.get_job(job.id)
+        claimed = await jobs.claim_next("worker", 60, 3)
+        await jobs.mark_succeeded(claimed.id, "worker", {})
+        
+        await projects.delete(project.id)
+        
+        _, cursor = await checks.get_page(limit=5, summary=True)
+        await checks.get_page(limit=5, after=cursor, summary=True)
+        await checks.get_recent_checks(5)
+        await checks.get_by_client("client-1")
+        await checks.get_checks_since(created_at - timedelta(seconds=2))
+        async for _ in checks.iter_all({"client_name": "client-0"}, sort=checks.keyset_sort, summary=True):
+            pass
+        
+        checked = time_series = 0
+        for command in recorder.commands:
+            if not needs_index(command):
+                continue
+            explain = await db.command({"explain": command, "verbosity": "queryPlanner"})
+            plan_stages = set(stages(winning_plan(explain)))
+            assert "COLLSCAN" not in plan_stages, f"Collection scan for {command}"
+            if command.get("find") == checks.collection_name:
+                assert not blocking_sorts(explain), f"Blocking sort for {command}"
+                time_series += 1
+            checked += 1
+        assert checked >= 10
+        assert time_series >= 5
+    
+    @pytest.mark.asyncio
+    async def test_status_checks_expire(self, recorded_db):
+        """Test that status checks live in a time-series collection with a TTL."""
+        db, _ = recorded_db
+        cursor = await db.list_collections(filter={"name": "status_checks"})
+        info = (await cursor.to_list(1))[0]
+        
+        assert info["type"] == "timeseries"
+        assert info["options"]["timeseries"]["timeField"] == "created_at"
+        assert info["options"]["expireAfterSeconds"] == settings.status_retention_days * 24 * 60 * 60
+        
+        checks = StatusCheckRepository()
+        checks.retention = 3600
+        await checks.ensure_collection()
+        cursor = await db.list_collections(filter={"name": "status_checks"})
+        assert (await cursor.to_list(1))[0]["options"]["expireAfterSeconds"] == 3600
+    
+    @pytest.mark.asyncio
+    async def test_keyset_pages_cover_every_document_once(self, recorded_db):
+        """Test that walking the cursors returns each document once, newest first."""
+        projects = ProjectRepository()
+        created_at = datetime.utcnow().replace(microsecond=0)
+        for i in range(11):
+            # Pairs share a timestamp so _id has to break the tie
+            await projects.create(Project(
+                name=f"project-{i}", description="d", language="java", template_id="java-hello",
+                github_username="user", repository_url="u", created_at=created_at - timedelta(seconds=i // 2)
+            ))
+        
+        seen, cursor = [], None
+        while True:
+            page, cursor = await projects.get_page(limit=4, after=cursor)
+            seen.extend(project.name for project in page)
+            if cursor is None:
+                break
+        
+        assert sorted(seen) == sorted(f"project-{i}" for i in range(11))
+        assert len(seen) == len(set(seen))
+        assert [int(name.split("-")[1]) // 2 for name in seen] == sorted(int(name.split("-")[1]) // 2 for name in seen)
+    
+    @pytest.mark.asyncio
+    async def test_status_check_queries_on_time_series(self, recorded_db):
+        """Test that keyset pages and client queries work on the time-series collection."""
+        checks = StatusCheckRepository()
+        created_at = datetime.utcnow().replace(microsecond=0)
+        documents = [
+            # Pairs share a timestamp so _id has to break the tie
+            {**StatusCheck(client_name=f"client-{i % 3}").dict(), "created_at": created_at - timedelta(seconds=i // 2)}
+            for i in range(11)
+        ]
+        await checks.insert_many(documents)
+        
+        seen, cursor = [], None
+        while True:
+            page, cursor = await checks.get_page(limit=4, after=cursor, summary=True)
+            seen.extend(page)
+            if cursor is None:
+                break
+        assert sorted(check.id for check in seen) == sorted(str(document["_id"]) for document in documents)
+        assert [check.created_at for check in seen] == sorted((d["created_at"] for d in documents), reverse=True)
+        
+        assert len(await checks.get_by_client("client-1")) == 4
+        assert len(await checks.get_checks_since(created_at - timedelta(seconds=2))) == 6
+        exported = [check async for check in checks.iter_all({"client_name": "client-0"}, sort=checks.keyset_sort)]
+        assert len(exported) == 4
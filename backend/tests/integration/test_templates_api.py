@@ -0,0 +1,149 @@
+"""
+Template API tests through the ASGI application.
+"""
+import io
+import zipfile
+
+import httpx
+import pytest
+
+from app.dependencies import init_services
+from app.main import app
+
+
+@pytest.fixture
+def api():
+    """HTTP client for the app with services built, without MongoDB."""
+    init_services(app)
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://localhost")
+
+
+@pytest.mark.integration
+class TestTemplateArchive:
+    """Test the archive download endpoint."""
+    
+    @pytest.mark.asyncio
+    async def test_zip_download(self, api):
+        """Test that the archive contains the rendered project."""
+        async with api:
+            response = await api.get("/api/templates/java/java-hello/archive", params={"project_name": "demo"})
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/zip"
+        assert 'filename="demo.zip"' in response.headers["content-disposition"]
+        with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+            assert "demo/pom.xml" in archive.namelist()
+            assert "demo" in archive.read("demo/pom.xml").decode()
+    
+    @pytest.mark.asyncio
+    async def test_tar_gz_download(self, api):
+        """Test that tar.gz is available through the format parameter."""
+        async with api:
+            response = await api.get(
+                "/api/templates/dotnet/dotnet-console/archive",
+                params={"project_name": "demo", "format": "tar.gz"}
+            )
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/gzip"
+        assert response.content[:2] == b"\x1f\x8b"
+    
+    @pytest.mark.asyncio
+    async def test_filename_header_is_escaped(self, api):
+        """Test that whitespace in the project name cannot break the header."""
+        async with api:
+            response = await api.get(
+                "/api/templates/java/java-hello/archive",
+                params={"project_name": "my demo\r\nX-Injected 1"}
+            )
+        
+        assert response.status_code == 200
+        disposition = response.headers["content-disposition"]
+        assert 'filename="my_demo__X-Injected_1.zip"' in disposition
+        assert "filename*=UTF-8''my%20demo%0D%0AX-Injected%201.zip" in disposition
+    
+    @pytest.mark.asyncio
+    async def test_invalid_requests(self, api):
+        """Test that bad formats, names and templates are 400s."""
+        async with api:
+            bad_format = await api.get("/api/templates/java/java-hello/archive", params={"format": "rar"})
+            bad_name = await api.get("/api/templates/java/java-hello/archive", params={"project_name": "../x"})
+            missing = await api.get("/api/templates/java/missing/archive")
+        
+        assert bad_format.status_code == 400
+        assert bad_name.status_code == 400
+        assert missing.status_code == 400
+
+
+@pytest.mark.integration
+class TestTemplatePreview:
+    """Test the paginated preview and per-file rendering."""
+    
+    @pytest.mark.asyncio
+    async def test_listing_sizes_match_rendered_files(self, api):
+        """Test that listed sizes equal the rendered file sizes."""
+        params = {"project_name": "démo", "project_description": "Ünïcode"}
+        async with api:
+            listing = await api.get("/api/templates/java/java-springboot/preview", params=params)
+            body = listing.json()
+            for entry in body["files"]:
+                file = await api.get(f"/api/templates/java/java-springboot/preview/{entry['path']}", params=params)
+                assert file.status_code == 200
+                assert len(file.content) == entry["size"]
+        
+        assert listing.status_code == 200
+        assert body["total_files"] == len(body["files"])
+        assert body["total_size"] == sum(entry["size"] for entry in body["files"])
+    
+    @pytest.mark.asyncio
+    async def test_listing_pagination(self, api):
+        """Test that offset and limit page through the file list."""
+        async with api:
+            first = (await api.get("/api/templates/java/java-hello/preview", params={"limit": 2})).json()
+            second = (await api.get("/api/templates/java/java-hello/preview", params={"offset": 2, "limit": 2})).json()
+        
+        assert len(first["files"]) == 2
+        assert first["files"] != second["files"]
+        assert first["total_files"] == second["total_files"]
+    
+    @pytest.mark.asyncio
+    async def test_if_none_match(self, api):
+        """Test that an unchanged listing or file answers 304."""
+        url = "/api/templates/dotnet/dotnet-console/preview"
+        async with api:
+            listing = await api.get(url)
+            cached = await api.get(url, headers={"If-None-Match": listing.headers["etag"]})
+            file = await api.get(f"{url}/Program.cs")
+            cached_file = await api.get(f"{url}/Program.cs", headers={"If-None-Match": f"W/{file.headers['etag']}"})
+            other = await api.get(f"{url}/Program.cs", params={"project_name": "other"},
+                                  headers={"If-None-Match": file.headers["etag"]})
+        
+        assert cached.status_code == 304
+        assert cached_file.status_code == 304
+        assert other.status_code == 200
+    
+    @pytest.mark.asyncio
+    async def test_byte_ranges(self, api):
+        """Test partial content for explicit, open and suffix ranges."""
+        url = "/api/templates/dotnet/dotnet-console/preview/Program.cs"
+        async with api:
+            full = (await api.get(url)).content
+            head = await api.get(url, headers={"Range": "bytes=0-9"})
+            tail = await api.get(url, headers={"Range": "bytes=-5"})
+            rest = await api.get(url, headers={"Range": "bytes=10-"})
+            invalid = await api.get(url, headers={"Range": f"bytes={len(full)}-"})
+        
+        assert head.status_code == 206
+        assert head.content == full[:10]
+        assert head.headers["content-range"] == f"bytes 0-9/{len(full)}"
+        assert tail.content == full[-5:]
+        assert rest.content == full[10:]
+        assert invalid.status_code == 416
+    
+    @pytest.mark.asyncio
+    async def test_unknown_file(self, api):
+        """Test that a path outside the template is a 404."""
+        async with api:
+            response = await api.get("/api/templates/java/java-hello/preview/missing.txt")
+        
+        assert response.status_code == 404
@@ -0,0 +1,67 @@
+"""
+Unit tests for streaming project archives.
+"""
+import io
+import random
+import tarfile
+import zipfile
+
+import pytest
+
+from app.services.archive import CHUNK_SIZE, stream_archive
+
+FILES = {
+    "README.md": "# demo\n",
+    "src/main/java/com/example/App.java": "class App {}\n",
+    "docs/ünicode.md": "olá\n",
+}
+
+
+class TestStreamArchive:
+    """Test that streamed archives are complete and valid."""
+    
+    def test_zip_round_trip(self):
+        """Test that the streamed ZIP holds every file under the root."""
+        data = b"".join(stream_archive(iter(FILES.items()), "demo", "zip"))
+        
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            assert archive.testzip() is None
+            assert {name: archive.read(name).decode() for name in archive.namelist()} == {
+                f"demo/{path}": content for path, content in FILES.items()
+            }
+    
+    def test_tar_gz_round_trip(self):
+        """Test that the streamed tar.gz holds every file under the root."""
+        data = b"".join(stream_archive(iter(FILES.items()), "demo", "tar.gz"))
+        
+        with tarfile.open(fileobj=io.BytesIO(data), mode="r:gz") as archive:
+            contents = {m.name: archive.extractfile(m).read().decode() for m in archive.getmembers()}
+        assert contents == {f"demo/{path}": content for path, content in FILES.items()}
+    
+    def test_files_are_consumed_lazily(self):
+        """Test that output starts before all files have been produced."""
+        produced = []
+        
+        def files():
+            for index in range(3):
+                produced.append(index)
+                yield f"file{index}.txt", "x" * 10
+        
+        stream = stream_archive(files(), "", "zip")
+        next(stream)
+        assert len(produced) < 3
+    
+    def test_large_file_is_chunked(self):
+        """Test that a big file is emitted in several chunks."""
+        rng = random.Random(0)
+        content = "".join(rng.choice("abcdefghij") for _ in range(CHUNK_SIZE * 4))
+        chunks = list(stream_archive(iter([("big.txt", content)]), "", "zip"))
+        
+        assert len([chunk for chunk in chunks if chunk]) > 2
+        with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as archive:
+            assert archive.read("big.txt").decode() == content
+    
+    def test_unknown_format(self):
+        """Test that unsupported formats are rejected."""
+        with pytest.raises(ValueError):
+            stream_archive(iter(()), "", "rar")
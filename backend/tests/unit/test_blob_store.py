@@ -0,0 +1,72 @@
+"""
+Unit tests for the content-addressed template blob store.
+"""
+from app.services.blob_store import BlobStore, git_blob_sha
+from app.services.template_packs import TemplatePackStore
+from app.services.template_service import TemplateService
+
+
+class TestBlobStore:
+    """Test deduplication and SHA lookups."""
+    
+    def test_git_blob_sha(self):
+        """Test that SHAs match `git hash-object`."""
+        assert git_blob_sha("hello\n") == "ce013625030ba8dba906f756967f9e9ca394464a"
+        assert git_blob_sha("") == "e69de29bb2d1d6434b8b29ae775ad8c2e48c5391"
+    
+    def test_intern_deduplicates(self):
+        """Test that equal contents share one string."""
+        store = BlobStore()
+        first = store.intern("".join(["same ", "content"]))
+        second = store.intern("".join(["same ", "content"]))
+        
+        assert first is second
+        assert len(store) == 1
+        assert store.get(git_blob_sha("same content")) is first
+    
+    def test_sha_uses_precomputed_value(self):
+        """Test that stored contents are not hashed again."""
+        store = BlobStore()
+        content = store.intern("static file\n")
+        hashed = store.hashed
+        
+        assert store.sha(content) == git_blob_sha("static file\n")
+        assert store.hashed == hashed
+        assert store.sha("rendered file\n") == git_blob_sha("rendered file\n")
+        assert store.hashed == hashed + 1
+    
+    def test_release_frees_unused_blobs(self):
+        """Test that a blob stays until its last reference is released."""
+        store = BlobStore()
+        content = store.intern("shared\n")
+        store.intern("shared\n")
+        
+        store.release([content])
+        assert len(store) == 1
+        store.release([content])
+        assert len(store) == 0
+
+
+class TestTemplateBlobs:
+    """Test the blob store behind template packs."""
+    
+    def test_shared_workflows_are_stored_once(self):
+        """Test that identical files of different packs are one object."""
+        service = TemplateService(TemplatePackStore(TemplateService().store.root, BlobStore()))
+        hello = service.get_template("java", "java-hello")
+        springboot = service.get_template("java", "java-springboot")
+        
+        path = ".github/workflows/release.yml"
+        assert hello.files[path] == springboot.files[path]
+        assert hello.files[path] is springboot.files[path]
+    
+    def test_rendered_static_files_keep_precomputed_sha(self):
+        """Test that static files come out of rendering by reference."""
+        blobs = BlobStore()
+        service = TemplateService(TemplatePackStore(TemplateService().store.root, blobs))
+        template = service.get_template("java", "java-hello")
+        files = service.process_template(template, {"project_name": "demo", "project_description": "d"})
+        
+        hashed = blobs.hashed
+        blobs.sha(files[".github/workflows/dependabot.yml"])
+        assert blobs.hashed == hashed
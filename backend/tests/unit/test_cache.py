@@ -0,0 +1,78 @@
+"""
+Unit tests for the TTL cache.
+"""
+import asyncio
+
+import pytest
+
+from app.utils.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache:
+    """Test expiry and load coalescing."""
+    
+    def test_entries_expire(self):
+        """Test that entries are dropped once their TTL has passed."""
+        clock = FakeClock()
+        cache = TTLCache(ttl=10, clock=clock)
+        cache.set("k", {"total": 1})
+        
+        clock.now = 9.9
+        assert cache.get("k") == {"total": 1}
+        clock.now = 10
+        assert cache.get("k") is None
+        assert len(cache) == 0
+    
+    def test_zero_ttl_disables_caching(self):
+        """Test that a TTL of zero never stores anything."""
+        cache = TTLCache(ttl=0)
+        cache.set("k", 1)
+        assert cache.get("k") is None
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_load_once(self):
+        """Test that simultaneous misses share one load."""
+        cache = TTLCache(ttl=60)
+        calls = 0
+        
+        async def load():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"total": calls}
+        
+        results = await asyncio.gather(*(cache.get_or_load("stats", load) for _ in range(5)))
+        assert results == [{"total": 1}] * 5
+        assert await cache.get_or_load("stats", load) == {"total": 1}
+        assert calls == 1
+        assert cache.misses == 1
+        
+        cache.invalidate()
+        assert await cache.get_or_load("stats", load) == {"total": 2}
+    
+    @pytest.mark.asyncio
+    async def test_failed_load_is_not_cached(self):
+        """Test that a failing loader raises for every waiter and is retried next time."""
+        cache = TTLCache(ttl=60)
+        
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("db down")
+        
+        results = await asyncio.gather(
+            cache.get_or_load("stats", fail), cache.get_or_load("stats", fail), return_exceptions=True
+        )
+        assert all(isinstance(result, RuntimeError) for result in results)
+        
+        async def load():
+            return {"total": 3}
+        
+        assert await cache.get_or_load("stats", load) == {"total": 3}
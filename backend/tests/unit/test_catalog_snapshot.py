@@ -0,0 +1,114 @@
+"""
+Unit tests for the precompiled template catalog snapshot.
+"""
+import json
+from pathlib import Path
+
+import pytest
+
+from app.core.exceptions import TemplateError
+from app.services.blob_store import BlobStore, git_blob_sha
+from app.services.catalog_snapshot import CatalogSnapshot, build_snapshot
+from app.services.template_engine import CompiledTemplate
+from app.services.template_packs import TemplatePackStore
+from tests.unit.test_template_packs import write_pack
+
+TEMPLATES_DIR = Path(__file__).resolve().parents[2] / "templates"
+
+
+class TestCatalogSnapshot:
+    """Test building, reading and reloading snapshots."""
+    
+    def test_round_trip_matches_pack_directory(self, tmp_path):
+        """Test that the snapshot serves the same catalog as the directory."""
+        output = tmp_path / "catalog.snapshot"
+        summary = build_snapshot(TEMPLATES_DIR, output)
+        assert summary["blobs"] < summary["files"]
+        
+        directory = TemplatePackStore(TEMPLATES_DIR, BlobStore())
+        snapshot = TemplatePackStore(TEMPLATES_DIR, BlobStore(), snapshot=output)
+        
+        assert list(snapshot.languages) == list(directory.languages)
+        assert snapshot.languages == directory.languages
+        variables = {"project_name": "demo", "project_description": "Demo"}
+        for language, packs in directory.packs.items():
+            assert list(snapshot.packs[language]) == list(packs)
+            for template_id in packs:
+                expected = directory.get(language, template_id)
+                actual = snapshot.get(language, template_id)
+                assert actual == expected
+                assert CompiledTemplate(actual.files).render(variables) == \
+                    CompiledTemplate(expected.files).render(variables)
+    
+    def test_loads_lazily_without_hashing(self, tmp_path):
+        """Test that contents are read on first use with precomputed SHAs."""
+        write_pack(tmp_path / "packs", "python", "py-hello", {"main.py": "print('{project_name}')"})
+        output = tmp_path / "catalog.snapshot"
+        build_snapshot(tmp_path / "packs", output)
+        
+        blobs = BlobStore()
+        store = TemplatePackStore(tmp_path / "packs", blobs, snapshot=output)
+        assert store.loaded_count() == 0
+        
+        template = store.get("python", "py-hello")
+        assert template.files == {"main.py": "print('{project_name}')"}
+        assert blobs.hashed == 0
+        assert blobs.sha(template.files["main.py"]) == git_blob_sha("print('{project_name}')")
+    
+    def test_rebuilt_snapshot_is_rescanned(self, tmp_path):
+        """Test that a rescan picks up a rebuilt snapshot and reports changes."""
+        packs = tmp_path / "packs"
+        write_pack(packs, "python", "py-hello", {"main.py": "v1"})
+        write_pack(packs, "python", "py-other", {"main.py": "other"})
+        output = tmp_path / "catalog.snapshot"
+        build_snapshot(packs, output)
+        
+        store = TemplatePackStore(packs, BlobStore(), snapshot=output)
+        other = store.get("python", "py-other")
+        assert store.scan() == []
+        
+        write_pack(packs, "python", "py-hello", {"main.py": "v2"})
+        build_snapshot(packs, output)
+        assert store.scan() == ["py-hello"]
+        assert store.get("python", "py-hello").files == {"main.py": "v2"}
+        assert store.get("python", "py-other") is other
+    
+    def test_invalid_file_raises(self, tmp_path):
+        """Test that a file that is not a snapshot is rejected."""
+        path = tmp_path / "catalog.snapshot"
+        path.write_bytes(b"not a snapshot at all")
+        with pytest.raises(TemplateError):
+            CatalogSnapshot(path)
+    
+    def test_incremental_build_reads_only_changed_sources(self, tmp_path):
+        """Test that a rebuild re-reads changed fragments and reports affected templates."""
+        packs = tmp_path / "packs"
+        fragment = packs / "_fragments" / "ci.yml"
+        fragment.parent.mkdir(parents=True)
+        fragment.write_text("name: CI\n")
+        for template_id in ("py-hello", "py-web"):
+            pack_dir = write_pack(packs, "python", template_id, {"main.py": template_id})
+            manifest = json.loads((pack_dir / "template.json").read_text())
+            manifest["files"].append(".github/workflows/ci.yml")
+            manifest["fragments"] = {".github/workflows/ci.yml": "ci.yml"}
+            (pack_dir / "template.json").write_text(json.dumps(manifest))
+        write_pack(packs, "go", "go-hello", {"main.go": "package main"})
+        output = tmp_path / "catalog.snapshot"
+        
+        first = build_snapshot(packs, output)
+        assert first["added"] == ["go-hello", "py-hello", "py-web"]
+        assert first["blobs"] == 4
+        
+        unchanged = build_snapshot(packs, output)
+        assert unchanged["sources_read"] == []
+        assert unchanged["catalog_version"] == first["catalog_version"]
+        
+        fragment.write_text("name: CI v2\n")
+        changes = build_snapshot(packs, output)
+        assert changes["sources_read"] == ["_fragments/ci.yml"]
+        assert changes["changed"] == ["py-hello", "py-web"]
+        assert changes["unchanged"] == ["go-hello"]
+        
+        store = TemplatePackStore(packs, BlobStore(), snapshot=output)
+        assert store.get("python", "py-web").files[".github/workflows/ci.yml"] == "name: CI v2\n"
+        assert store.get("go", "go-hello").files == {"main.go": "package main"}
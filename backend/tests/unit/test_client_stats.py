@@ -0,0 +1,117 @@
+"""
+Unit tests for the incrementally maintained client statistics.
+"""
+from datetime import datetime
+
+import pytest
+from pymongo.errors import OperationFailure
+
+from app.core.exceptions import DatabaseError
+from app.repositories.client_stats import ClientStatsRepository
+from tests.fakes import FakeCollection, FakeDatabase
+
+
+def at(second):
+    return datetime(2024, 1, 1, 0, 0, second)
+
+
+def repository_for(documents=None, source_documents=None, database=None):
+    database = database or FakeDatabase({
+        "status_checks": FakeCollection(source_documents),
+        "backfills": FakeCollection()
+    })
+    repository = ClientStatsRepository()
+    repository._collection = FakeCollection(documents, database=database)
+    return repository, database["status_checks"]
+
+
+class FailingCursor:
+    async def to_list(self, length):
+        raise OperationFailure("$merge failed")
+
+
+class TestClientStats:
+    """Test folding checks in and reading the summary."""
+    
+    @pytest.mark.asyncio
+    async def test_record_groups_batch_per_client(self):
+        """Test that a batch becomes one upsert per client."""
+        repository, _ = repository_for()
+        checks = [
+            {"client_name": "a", "created_at": at(3)},
+            {"client_name": "b", "created_at": at(1)},
+            {"client_name": "a", "created_at": at(2)},
+            {"client_name": "a", "created_at": at(5)}
+        ]
+        assert await repository.record(checks) == 2
+        assert await repository.record([]) == 0
+        
+        updates = {operation._filter["_id"]: operation._doc for operation in repository.collection.operations}
+        assert updates["a"] == {
+            "$inc": {"check_count": 3},
+            "$min": {"first_check": at(2)},
+            "$max": {"last_check": at(5)}
+        }
+        assert updates["b"]["$inc"] == {"check_count": 1}
+        assert all(operation._upsert for operation in repository.collection.operations)
+    
+    @pytest.mark.asyncio
+    async def test_get_client_stats_reads_summary(self):
+        """Test that statistics come from the summary, busiest first."""
+        repository, source = repository_for([
+            {"_id": "a", "check_count": 3, "first_check": at(2), "last_check": at(5)}
+        ])
+        stats = await repository.get_client_stats()
+        
+        assert stats == {
+            "total_clients": 1,
+            "clients": [{"client_name": "a", "check_count": 3, "first_check": at(2), "last_check": at(5)}]
+        }
+        assert repository.collection.cursors[-1].sorted_by[0] == ("check_count", -1)
+        assert source.pipelines == []
+    
+    @pytest.mark.asyncio
+    async def test_backfills_empty_summary(self):
+        """Test that an empty summary is built once from the stored checks."""
+        repository, source = repository_for(source_documents=[{"client_name": "a", "created_at": at(1)}])
+        await repository.ensure_collection()
+        merge = source.pipelines[0][-1]["$merge"]
+        assert merge["into"] == "status_client_stats"
+        assert merge["whenNotMatched"] == "insert"
+        merged = merge["whenMatched"][0]["$set"]
+        assert merged["check_count"]["$add"][1] == "$$new.check_count"
+        assert merged["first_check"] == {"$min": ["$first_check", "$$new.first_check"]}
+        assert merged["last_check"] == {"$max": ["$last_check", "$$new.last_check"]}
+        assert source.pipelines[0][0]["$match"]["created_at"]["$lt"] <= datetime.utcnow()
+        
+        repository, source = repository_for([{"_id": "a", "check_count": 1}], [{"client_name": "a"}])
+        await repository.ensure_collection()
+        assert source.pipelines == []
+    
+    @pytest.mark.asyncio
+    async def test_backfill_runs_once_across_processes(self):
+        """Test that only the first process to find the summary empty backfills it."""
+        database = FakeDatabase({
+            "status_checks": FakeCollection([{"client_name": "a", "created_at": at(1)}]),
+            "backfills": FakeCollection()
+        })
+        first, source = repository_for(database=database)
+        second, _ = repository_for(database=database)
+        
+        await first.ensure_collection()
+        # The summary still looks empty, as it does while the merge runs
+        await second.ensure_collection()
+        await first.ensure_collection()
+        
+        assert len(source.pipelines) == 1
+        assert database["backfills"].documents[0]["_id"] == "status_client_stats"
+    
+    @pytest.mark.asyncio
+    async def test_failed_backfill_is_released(self):
+        """Test that a failed backfill lets the next startup try again."""
+        repository, source = repository_for(source_documents=[{"client_name": "a", "created_at": at(1)}])
+        source.aggregate = lambda pipeline: FailingCursor()
+        
+        with pytest.raises(DatabaseError):
+            await repository.ensure_collection()
+        assert repository.collection.database["backfills"].documents == []
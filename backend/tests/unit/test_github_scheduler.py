@@ -0,0 +1,117 @@
+"""
+Unit tests for the GitHub rate-limit scheduler.
+"""
+import time
+from email.utils import formatdate
+
+import httpx
+import pytest
+
+from app.services.github_scheduler import SECONDARY_LIMIT_BACKOFF, RateLimitScheduler, parse_retry_after
+
+
+def make_response(status_code=200, **headers):
+    """Build a response carrying rate-limit headers."""
+    return httpx.Response(status_code, headers={k.replace("_", "-"): str(v) for k, v in headers.items()})
+
+
+class TestRateLimitScheduler:
+    """Test quota tracking and throttling."""
+    
+    def test_reads_rate_limit_headers(self):
+        """Test that the budget follows the response headers."""
+        scheduler = RateLimitScheduler(max_concurrency=4, reserve=0)
+        reset = int(time.time()) + 600
+        scheduler.observe(make_response(
+            x_ratelimit_limit=5000,
+            x_ratelimit_remaining=4321,
+            x_ratelimit_reset=reset,
+            x_ratelimit_resource="core"
+        ))
+        
+        snapshot = scheduler.snapshot()
+        assert snapshot["limit"] == 5000
+        assert snapshot["remaining"] == 4321
+        assert snapshot["resource"] == "core"
+        assert snapshot["concurrency"] == 4
+    
+    def test_retry_after_halves_concurrency_and_pauses(self):
+        """Test that a secondary rate limit backs off."""
+        scheduler = RateLimitScheduler(max_concurrency=8, reserve=0)
+        scheduler.observe(make_response(403, retry_after=30))
+        
+        snapshot = scheduler.snapshot()
+        assert snapshot["concurrency"] == 4
+        assert 29 <= snapshot["paused_for"] <= 30
+        assert snapshot["throttled_total"] == 1
+        assert scheduler._delay(time.time())[0] > 0
+    
+    def test_retry_after_http_date(self):
+        """Test that a Retry-After HTTP-date pauses until that time."""
+        scheduler = RateLimitScheduler(max_concurrency=8, reserve=0)
+        scheduler.observe(make_response(429, retry_after=formatdate(time.time() + 30, usegmt=True)))
+        
+        assert 28 <= scheduler.snapshot()["paused_for"] <= 30
+        assert scheduler.snapshot()["concurrency"] == 4
+    
+    def test_parse_retry_after(self):
+        """Test both Retry-After forms and values that are neither."""
+        now = 1_700_000_000.0
+        assert parse_retry_after("12", now) == 12.0
+        assert parse_retry_after("Tue, 14 Nov 2023 22:13:40 GMT", now) == 20.0
+        assert parse_retry_after("Tue, 14 Nov 2023 22:13:00 GMT", now) == 0.0
+        assert parse_retry_after("soon", now) is None
+    
+    def test_unparseable_retry_after_uses_default_backoff(self):
+        """Test that a malformed Retry-After still backs off."""
+        scheduler = RateLimitScheduler(max_concurrency=8, reserve=0)
+        scheduler.observe(make_response(403, retry_after="soon"))
+        assert SECONDARY_LIMIT_BACKOFF - 2 <= scheduler.snapshot()["paused_for"] <= SECONDARY_LIMIT_BACKOFF
+    
+    def test_successes_grow_concurrency(self):
+        """Test additive increase after a run of successes."""
+        scheduler = RateLimitScheduler(max_concurrency=4, reserve=0, increase_after=2)
+        scheduler.concurrency = 1
+        for _ in range(4):
+            scheduler.observe(make_response())
+        assert scheduler.concurrency == 3
+    
+    def test_exhausted_quota_waits_for_reset(self):
+        """Test that calls are held while the quota is at the reserve."""
+        scheduler = RateLimitScheduler(max_concurrency=4, reserve=10)
+        now = time.time()
+        scheduler.observe(make_response(
+            x_ratelimit_limit=5000,
+            x_ratelimit_remaining=10,
+            x_ratelimit_reset=int(now) + 120
+        ))
+        
+        delay, _ = scheduler._delay(now)
+        assert delay > 100
+    
+    def test_low_quota_is_paced(self):
+        """Test that the remaining quota is spread over the window."""
+        scheduler = RateLimitScheduler(max_concurrency=4, reserve=0)
+        now = time.time()
+        scheduler.observe(make_response(
+            x_ratelimit_limit=5000,
+            x_ratelimit_remaining=100,
+            x_ratelimit_reset=int(now) + 100
+        ))
+        
+        _, interval = scheduler._delay(now)
+        assert 0.9 <= interval <= 1.0
+    
+    @pytest.mark.asyncio
+    async def test_call_retries_throttled_response(self):
+        """Test that throttled calls are retried after the pause."""
+        scheduler = RateLimitScheduler(max_concurrency=2, reserve=0)
+        responses = [make_response(429, retry_after=0), make_response(200)]
+        
+        async def send():
+            return responses.pop(0)
+        
+        response = await scheduler.call(send, max_retries=2)
+        assert response.status_code == 200
+        assert scheduler.snapshot()["requests_total"] == 2
+        assert scheduler.active == 0
@@ -0,0 +1,121 @@
+"""
+Unit tests for keyset pagination cursors.
+"""
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+
+from app.core.exceptions import ValidationError
+from app.models.project import ProjectSummary
+from app.repositories.base import decode_cursor, encode_cursor
+from app.repositories.project import ProjectRepository
+from app.repositories.status import StatusCheckRepository
+from tests.fakes import FakeCollection
+
+
+class TestKeysetCursor:
+    """Test cursor encoding and the filters built from it."""
+    
+    def test_round_trip(self):
+        """Test that a cursor selects documents strictly after its position."""
+        object_id = ObjectId()
+        created_at = datetime(2024, 5, 1, 12, 30, 0, 123000)
+        token = encode_cursor({"_id": object_id, "created_at": created_at})
+        
+        assert "=" not in token
+        assert decode_cursor(token) == {"$or": [
+            {"created_at": {"$lt": created_at}},
+            {"created_at": created_at, "_id": {"$lt": object_id}},
+            {"created_at": None}
+        ]}
+    
+    def test_document_without_created_at(self):
+        """Test that legacy documents without created_at page by _id."""
+        object_id = ObjectId()
+        token = encode_cursor({"_id": object_id})
+        assert decode_cursor(token) == {"created_at": None, "_id": {"$lt": object_id}}
+    
+    @pytest.mark.parametrize("token", ["", "not-a-cursor", "WyJ4IiwgInkiXQ", "bnVsbA"])
+    def test_invalid_cursor(self, token):
+        """Test that tampered or foreign tokens are rejected."""
+        with pytest.raises(ValidationError):
+            decode_cursor(token)
+
+
+class TestStatusCheckCursor:
+    """Test the time-only cursor of the time-series status checks."""
+    
+    @staticmethod
+    def repository_for(documents):
+        repository = StatusCheckRepository()
+        repository._collection = FakeCollection(documents)
+        return repository
+    
+    @pytest.mark.asyncio
+    async def test_page_ends_before_checks_sharing_the_next_timestamp(self):
+        """Test that ties at the page boundary move to the next page and the cursor holds no ids."""
+        created_at = datetime(2024, 5, 1, 12, 30, 0, 123000)
+        documents = [
+            {"_id": ObjectId(), "client_name": "a", "created_at": datetime(2024, 5, 1, 12, 30, 1)},
+            {"_id": ObjectId(), "client_name": "a", "created_at": created_at},
+            {"_id": ObjectId(), "client_name": "a", "created_at": created_at}
+        ]
+        repository = self.repository_for(documents)
+        
+        page, token = await repository.get_page(limit=2, summary=True)
+        
+        assert [check.id for check in page] == [str(documents[0]["_id"])]
+        assert repository.cursor_filter(token) == {"created_at": {"$lt": datetime(2024, 5, 1, 12, 30, 1)}}
+    
+    @pytest.mark.asyncio
+    async def test_page_of_ties_returns_all_of_them(self):
+        """Test that checks sharing one timestamp beyond a whole page are returned together."""
+        created_at = datetime(2024, 5, 1, 12, 30)
+        documents = [{"_id": ObjectId(), "client_name": "a", "created_at": created_at} for _ in range(5)]
+        repository = self.repository_for(documents)
+        
+        page, token = await repository.get_page(limit=2, summary=True)
+        
+        # The fake does not evaluate the query for the remaining ties
+        assert len(page) == 2 + len(documents)
+        assert repository.collection.cursors[-1].sorted_by is None
+        assert len(token) < 64
+        assert repository.cursor_filter(token) == {"created_at": {"$lt": created_at}}
+    
+    @pytest.mark.parametrize("token", ["", "not-a-cursor", "WyJ4IiwgInkiXQ", "bnVsbA"])
+    def test_invalid_cursor(self, token):
+        """Test that tampered or foreign tokens are rejected."""
+        with pytest.raises(ValidationError):
+            StatusCheckRepository().cursor_filter(token)
+
+
+class TestSummaryPages:
+    """Test that list pages read and return slim models."""
+    
+    @pytest.mark.asyncio
+    async def test_project_summaries_use_projection(self):
+        """Test that summary pages project away metadata and return summaries."""
+        documents = [
+            {
+                "_id": ObjectId(), "id": f"uuid-{i}", "name": f"p{i}", "description": "d", "language": "java",
+                "template_id": "java-hello", "github_username": "u", "repository_url": "url",
+                "status": "created", "created_at": datetime(2024, 1, 1, 0, 0, i),
+                "metadata": {"files_created": 9, "github_repo": f"p{i}"}
+            }
+            for i in range(3)
+        ]
+        repository = ProjectRepository()
+        repository._collection = FakeCollection(documents)
+        
+        page, cursor = await repository.get_page(limit=2, summary=True)
+        
+        projection = repository._collection.projections[0]
+        assert "metadata" not in projection and projection["created_at"] == 1
+        assert all(isinstance(project, ProjectSummary) for project in page)
+        assert page[0].id == str(documents[0]["_id"])
+        assert cursor is not None
+        
+        full, _ = await repository.get_page(limit=2)
+        assert repository._collection.projections[1] is None
+        assert full[0].metadata["github_repo"] == "p0"
@@ -0,0 +1,111 @@
+"""
+Unit tests for the project statistics aggregation.
+"""
+import pytest
+
+from app.repositories.project import ProjectRepository
+from app.services.project_service import ProjectService
+from app.utils.cache import TTLCache
+from tests.fakes import FakeCollection
+
+
+class TestProjectStats:
+    """Test the single-aggregation statistics."""
+    
+    @pytest.mark.asyncio
+    async def test_stats_come_from_one_facet_aggregation(self):
+        """Test that all breakdowns are read from one $facet round trip."""
+        repository = ProjectRepository()
+        repository._collection = FakeCollection(aggregate_result=[{
+            "total": [{"count": 5}],
+            "languages": [{"_id": "java", "count": 3}, {"_id": "dotnet", "count": 2}],
+            "templates": [{"_id": "java-hello", "count": 3}, {"_id": "dotnet-console", "count": 2}],
+            "users": [{"_id": "alice", "count": 4}, {"_id": "bob", "count": 1}],
+            "user_count": [{"count": 2}]
+        }])
+        
+        stats = await repository.get_project_stats()
+        
+        assert len(repository._collection.pipelines) == 1
+        assert "$facet" in repository._collection.pipelines[0][0]
+        assert stats == {
+            "total_projects": 5,
+            "languages": 2,
+            "language_breakdown": {"java": 3, "dotnet": 2},
+            "template_breakdown": {"java-hello": 3, "dotnet-console": 2},
+            "users": 2,
+            "user_breakdown": {"alice": 4, "bob": 1}
+        }
+    
+    @pytest.mark.asyncio
+    async def test_empty_collection(self):
+        """Test that empty facets report zero counts."""
+        repository = ProjectRepository()
+        repository._collection = FakeCollection(aggregate_result=[{
+            "total": [], "languages": [], "templates": [], "users": [], "user_count": []
+        }])
+        
+        stats = await repository.get_project_stats()
+        assert stats["total_projects"] == 0
+        assert stats["language_breakdown"] == {}
+
+
+class SharedStatsRepository:
+    """Project repository whose data and stats version every service shares."""
+    
+    def __init__(self):
+        self.total = 1
+        self.version = 0
+        self.version_reads = 0
+        self.aggregations = 0
+    
+    async def get_stats_version(self):
+        self.version_reads += 1
+        return self.version
+    
+    async def bump_stats_version(self):
+        self.version += 1
+    
+    async def get_project_stats(self):
+        self.aggregations += 1
+        return {"total_projects": self.total}
+
+
+class TestProjectStatsCache:
+    """Test that cached statistics follow writes made by other processes."""
+    
+    @pytest.mark.asyncio
+    async def test_write_in_another_process_invalidates_the_cache(self):
+        """Test that a project created by the worker is seen by the API's cache once the version expires."""
+        repository = SharedStatsRepository()
+        now = [0.0]
+        api = ProjectService(repository, None, None, job_repository=object())
+        api.stats_versions = TTLCache(5, clock=lambda: now[0])
+        worker = ProjectService(repository, None, None, job_repository=object())
+        
+        assert (await api.get_project_statistics())["total_projects"] == 1
+        assert (await api.get_project_statistics())["total_projects"] == 1
+        assert repository.aggregations == 1
+        assert repository.version_reads == 1
+        
+        repository.total = 2
+        await worker._invalidate_stats()
+        assert (await api.get_project_statistics())["total_projects"] == 1
+        
+        now[0] = 5
+        assert (await api.get_project_statistics())["total_projects"] == 2
+        assert repository.aggregations == 2
+        assert repository.version_reads == 2
+    
+    @pytest.mark.asyncio
+    async def test_own_writes_invalidate_the_cache_at_once(self):
+        """Test that a process sees the projects it created without waiting for the version to expire."""
+        repository = SharedStatsRepository()
+        api = ProjectService(repository, None, None, job_repository=object())
+        api.stats_versions = TTLCache(5, clock=lambda: 0.0)
+        
+        assert (await api.get_project_statistics())["total_projects"] == 1
+        repository.total = 2
+        await api._invalidate_stats()
+        
+        assert (await api.get_project_statistics())["total_projects"] == 2
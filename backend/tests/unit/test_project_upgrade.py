@@ -0,0 +1,135 @@
+"""
+Unit tests for upgrading generated projects to their current template.
+"""
+import asyncio
+
+import pytest
+
+from app.core.exceptions import GitHubError
+from app.models.project import Project
+from app.services.project_service import ProjectService
+from app.services.template_service import TemplateService
+
+
+class FakeProjectRepository:
+    """In-memory stand-in for ProjectRepository."""
+    
+    def __init__(self, projects):
+        self.projects = {project.id: project for project in projects}
+        self.updates = {}
+        self.pages = 0
+    
+    async def get_page(self, limit=50, after=None, filter_dict=None):
+        self.pages += 1
+        matching = [
+            project for project in self.projects.values()
+            if all(getattr(project, key) == value for key, value in (filter_dict or {}).items())
+        ]
+        start = int(after or 0)
+        end = start + limit
+        return matching[start:end], str(end) if end < len(matching) else None
+    
+    async def update(self, project_id, update_data):
+        self.updates[project_id] = update_data
+        return self.projects[project_id]
+
+
+class FakeGitHubService:
+    """Records upgrades and tracks how many run at once."""
+    
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.upgraded = []
+        self.running = 0
+        self.max_running = 0
+    
+    async def upgrade_files(self, repo_name, files, commit_message):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(0.01)
+            if repo_name in self.failing:
+                raise GitHubError(f"cannot push {repo_name}")
+            self.upgraded.append(repo_name)
+            return {"commit": "abc", "changed_files": sorted(files), "unchanged_files": 0}
+        finally:
+            self.running -= 1
+
+
+def make_project(name, language="java", template_id="java-hello", **metadata):
+    return Project(
+        name=name,
+        description=f"{name} project",
+        language=language,
+        template_id=template_id,
+        github_username="test",
+        repository_url=f"https://github.com/test/{name}",
+        metadata={"github_repo": name, **metadata}
+    )
+
+
+def make_service(projects, github=None):
+    github = github or FakeGitHubService()
+    repository = FakeProjectRepository(projects)
+    return ProjectService(repository, github, TemplateService(), job_repository=object()), repository, github
+
+
+class TestProjectUpgrade:
+    """Test single and fleet-wide upgrades."""
+    
+    @pytest.mark.asyncio
+    async def test_upgrade_renders_with_project_variables(self):
+        """Test that an upgrade pushes the rendered template and records its digest."""
+        project = make_project("demo")
+        service, repository, github = make_service([project])
+        
+        result = await service.upgrade_project(project)
+        
+        assert github.upgraded == ["demo"]
+        assert result["commit"] == "abc"
+        assert "README.md" in result["changed_files"]
+        metadata = repository.updates[project.id]["metadata"]
+        assert metadata["template_digest"] == result["template_digest"]
+        assert metadata["github_repo"] == "demo"
+    
+    @pytest.mark.asyncio
+    async def test_unchanged_template_is_skipped(self):
+        """Test that a project already on the current template costs no GitHub call."""
+        project = make_project("demo")
+        service, _, github = make_service([project])
+        template = service.template_service.get_template("java", "java-hello")
+        project.metadata["template_digest"] = service.template_service.get_compiled_template(template).digest
+        
+        assert (await service.upgrade_project(project))["skipped"] is True
+        assert github.upgraded == []
+        assert (await service.upgrade_project(project, force=True))["skipped"] is False
+        assert github.upgraded == ["demo"]
+    
+    @pytest.mark.asyncio
+    async def test_fleet_upgrade_is_bounded_and_isolates_failures(self):
+        """Test that the fleet upgrade respects its concurrency and keeps going on errors."""
+        projects = [make_project(f"p{i}") for i in range(10)]
+        projects.append(make_project("other", language="dotnet", template_id="dotnet-console"))
+        service, _, github = make_service(projects, FakeGitHubService(failing={"p3"}))
+        
+        summary = await service.upgrade_projects(language="java", concurrency=3)
+        
+        assert summary["projects"] == 10
+        assert summary["upgraded"] == 9
+        assert summary["failed"] == 1
+        assert "cannot push p3" in summary["errors"][projects[3].id]
+        assert github.max_running == 3
+        assert "other" not in github.upgraded
+    
+    @pytest.mark.asyncio
+    async def test_fleet_upgrade_reads_projects_in_pages(self, monkeypatch):
+        """Test that projects are read page by page instead of through one long-lived cursor."""
+        monkeypatch.setattr("app.services.project_service.UPGRADE_PAGE_SIZE", 4)
+        projects = [make_project(f"p{i}") for i in range(10)]
+        service, repository, github = make_service(projects)
+        
+        summary = await service.upgrade_projects(concurrency=2)
+        
+        assert summary["projects"] == 10
+        assert repository.pages == 3
+        assert sorted(github.upgraded) == sorted(project.name for project in projects)
@@ -0,0 +1,94 @@
+"""
+Unit tests for the rendered template cache.
+"""
+from app.services.render_cache import RenderCache, hash_variables
+from app.services.template_service import TemplateService
+
+
+def key(template_id, variables):
+    return (template_id, "digest", hash_variables(variables))
+
+
+class TestRenderCache:
+    """Test LRU behaviour and statistics."""
+    
+    def test_hit_and_miss(self):
+        """Test that lookups are counted and return copies."""
+        cache = RenderCache(max_size=1000)
+        k = key("t", {"project_name": "a"})
+        
+        assert cache.get(k) is None
+        cache.put(k, {"a.txt": "hello"})
+        files = cache.get(k)
+        assert files == {"a.txt": "hello"}
+        
+        files["b.txt"] = "mutated"
+        assert cache.get(k) == {"a.txt": "hello"}
+        assert cache.snapshot()["hits"] == 2
+        assert cache.snapshot()["misses"] == 1
+    
+    def test_variables_hash_ignores_order(self):
+        """Test that the same variables in another order share an entry."""
+        assert hash_variables({"a": "1", "b": "2"}) == hash_variables({"b": "2", "a": "1"})
+        assert hash_variables({"a": "1"}) != hash_variables({"a": "2"})
+    
+    def test_evicts_least_recently_used_by_size(self):
+        """Test that the size budget evicts the oldest unused entries."""
+        cache = RenderCache(max_size=25)
+        first, second, third = key("t", {"n": "1"}), key("t", {"n": "2"}), key("t", {"n": "3"})
+        cache.put(first, {"f": "x" * 9})
+        cache.put(second, {"f": "x" * 9})
+        cache.get(first)
+        cache.put(third, {"f": "x" * 9})
+        
+        assert cache.get(second) is None
+        assert cache.get(first) is not None
+        assert cache.get(third) is not None
+        assert cache.size == 20
+        assert cache.snapshot()["evictions"] == 1
+    
+    def test_oversized_entries_are_not_cached(self):
+        """Test that a single entry above the budget is skipped."""
+        cache = RenderCache(max_size=10)
+        cache.put(key("t", {}), {"big": "x" * 100})
+        assert len(cache) == 0
+    
+    def test_invalidate_template(self):
+        """Test that invalidation only drops the given template."""
+        cache = RenderCache(max_size=1000)
+        cache.put(key("a", {"n": "1"}), {"f": "1"})
+        cache.put(key("a", {"n": "2"}), {"f": "2"})
+        cache.put(key("b", {"n": "1"}), {"f": "3"})
+        
+        assert cache.invalidate("a") == 2
+        assert len(cache) == 1
+        assert cache.size == 2
+        assert cache.get(key("b", {"n": "1"})) == {"f": "3"}
+
+
+class TestTemplateServiceCache:
+    """Test rendering through the cache."""
+    
+    def test_repeated_render_hits_cache(self):
+        """Test that rendering the same variables twice is one render."""
+        service = TemplateService()
+        template = service.get_template("java", "java-hello")
+        variables = {"project_name": "my-project", "project_description": "A sample project"}
+        
+        first = service.process_template(template, variables)
+        second = service.process_template(template, variables)
+        assert first == second
+        assert service.render_cache.hits == 1
+        assert service.render_cache.misses == 1
+        
+        service.process_template(template, {**variables, "project_name": "other"})
+        assert service.render_cache.misses == 2
+    
+    def test_pack_change_invalidates(self):
+        """Test that a pack reload drops its rendered output."""
+        service = TemplateService()
+        template = service.get_template("java", "java-hello")
+        service.process_template(template, {"project_name": "x", "project_description": "y"})
+        
+        service._invalidate("java-hello")
+        assert len(service.render_cache) == 0
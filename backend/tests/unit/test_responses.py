@@ -0,0 +1,103 @@
+"""
+Unit tests for the responses of database read endpoints.
+"""
+import json
+from datetime import datetime
+
+import httpx
+import pytest
+from bson import ObjectId
+
+from fastapi import Response
+
+from app.dependencies import init_services
+from app.main import app
+from app.models.project import Project, ProjectListResponse
+from app.models.status import StatusCheckSummary
+from app.repositories.base import SCHEMA_FIELD
+from app.repositories.project import ProjectRepository
+from app.utils.responses import read_json, trusted_json
+from tests.fakes import FakeCollection
+
+
+def project_document(**overrides):
+    document = {
+        "_id": ObjectId(), "id": "uuid", "name": "demo", "description": "d", "language": "java",
+        "template_id": "java-hello", "github_username": "u", "repository_url": "url",
+        "created_at": datetime(2024, 1, 1, 12, 0, 0, 500000), "metadata": {"files_created": 9}
+    }
+    document.update(overrides)
+    return document
+
+
+class TestTrustedJson:
+    """Test serializing models without response validation."""
+    
+    def test_same_json_as_model(self):
+        """Test that the body is what the model serializes to."""
+        project = Project(**project_document())
+        response = trusted_json([project], headers={"X-Next-Cursor": "abc"})
+        
+        assert response.status_code == 200
+        assert response.media_type == "application/json"
+        assert response.headers["X-Next-Cursor"] == "abc"
+        assert json.loads(response.body) == [json.loads(project.model_dump_json())]
+        assert json.loads(response.body)[0]["created_at"] == "2024-01-01T12:00:00.500000"
+    
+    @pytest.mark.asyncio
+    async def test_only_stamped_documents_are_trusted(self):
+        """Test that documents without the schema stamp keep response validation."""
+        repository = ProjectRepository()
+        repository._collection = FakeCollection([
+            project_document(name="stamped", **{SCHEMA_FIELD: repository.schema_version}),
+            project_document(name="legacy")
+        ])
+        
+        projects, _ = await repository.get_page(limit=10, summary=True)
+        stamped, legacy = projects
+        
+        assert stamped.trusted and not legacy.trusted
+        assert isinstance(read_json(stamped), Response)
+        assert read_json(legacy) is legacy
+        assert read_json([stamped, legacy]) == [stamped, legacy]
+        listing = ProjectListResponse(projects=[stamped], total=1)
+        assert isinstance(read_json(listing, trusted=listing.projects), Response)
+
+
+class TestReadEndpoints:
+    """Test read endpoints end to end through the ASGI app."""
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("stamp", [{SCHEMA_FIELD: 1}, {}], ids=["trusted", "legacy"])
+    async def test_status_checks_endpoint(self, stamp):
+        """Test a list endpoint end to end with the cursor header."""
+        init_services(app)
+        documents = [
+            {"_id": ObjectId(), "client_name": f"client-{i}", "created_at": datetime(2024, 1, 1, 0, 0, i), **stamp}
+            for i in range(3)
+        ]
+        app.state.status_repository._collection = FakeCollection(documents)
+        
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://localhost") as api:
+            response = await api.get("/api/status/checks", params={"limit": 2})
+        
+        assert response.status_code == 200
+        assert "X-Next-Cursor" in response.headers
+        body = response.json()
+        assert body == [
+            json.loads(StatusCheckSummary(id=str(d["_id"]), client_name=d["client_name"], created_at=d["created_at"]).model_dump_json())
+            for d in documents[:2]
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_job_keeps_submitted_id(self):
+        """Test that a job is reported under the id returned when it was submitted."""
+        init_services(app)
+        document = {"_id": ObjectId(), "id": "job-uuid", "type": "generate_project", "status": "queued"}
+        app.state.project_service.job_repository._collection = FakeCollection([document])
+        
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://localhost") as api:
+            response = await api.get("/api/projects/jobs/job-uuid")
+        
+        assert response.status_code == 200
+        assert response.json()["id"] == "job-uuid"
@@ -0,0 +1,363 @@
+"""
+Unit tests for the status check write-behind buffer.
+"""
+import asyncio
+
+import httpx
+import pytest
+from bson.errors import InvalidDocument
+from pymongo.errors import AutoReconnect, BulkWriteError
+
+from app.core.exceptions import DatabaseError, ServiceUnavailableError
+from app.dependencies import init_services
+from app.main import app
+from app.models.status import StatusCheck
+from app.repositories.status import StatusCheckRepository
+from app.services.status_buffer import StatusCheckBuffer, parse_write_concern
+from tests.fakes import FakeCollection
+
+
+class FakeRepository:
+    """Records insert_many batches; can be paused or made to reject documents."""
+    
+    def __init__(self):
+        self.batches = []
+        self.write_concerns = []
+        self.release = asyncio.Event()
+        self.release.set()
+        self.fail = False
+        self.reject = set()
+    
+    async def insert_many(self, documents, write_concern=None):
+        await self.release.wait()
+        if self.fail:
+            raise DatabaseError("rejected", details={"failed_indexes": list(range(len(documents)))})
+        if self.reject:
+            # Like an unordered insert_many: the other documents are stored
+            failed = [index for index, document in enumerate(documents) if document["client_name"] in self.reject]
+            self.batches.append([document for index, document in enumerate(documents) if index not in failed])
+            raise DatabaseError("duplicate key", details={"failed_indexes": failed})
+        self.batches.append(list(documents))
+        self.write_concerns.append(write_concern)
+        return len(documents)
+
+
+class FakeStatsRepository:
+    """Records the batches folded into the client statistics."""
+    
+    def __init__(self):
+        self.batches = []
+        self.fail = False
+    
+    async def record(self, documents, write_concern=None):
+        if self.fail:
+            raise DatabaseError("down")
+        self.batches.append(list(documents))
+        return len({document["client_name"] for document in documents})
+
+
+def check(i=0):
+    return StatusCheck(client_name=f"client-{i}")
+
+
+def make_buffer(repository, **options):
+    options.setdefault("batch_size", 3)
+    options.setdefault("flush_interval", 10)
+    options.setdefault("max_pending", 100)
+    options.setdefault("enqueue_timeout", 1)
+    return StatusCheckBuffer(repository, **options)
+
+
+class TestStatusCheckBuffer:
+    """Test batching, draining and backpressure."""
+    
+    @pytest.mark.asyncio
+    async def test_flushes_full_batches_and_drains_on_stop(self):
+        """Test that full batches are written at once and the rest on stop."""
+        repository = FakeRepository()
+        buffer = make_buffer(repository)
+        buffer.start()
+        
+        for i in range(7):
+            await buffer.submit(check(i))
+        await asyncio.sleep(0.01)
+        assert [len(batch) for batch in repository.batches] == [3, 3]
+        assert buffer.snapshot()["depth"] == 1
+        
+        await buffer.stop()
+        assert [len(batch) for batch in repository.batches] == [3, 3, 1]
+        assert buffer.written_total == 7
+        assert buffer.snapshot()["flushes"] == 3
+    
+    @pytest.mark.asyncio
+    async def test_flushes_on_interval(self):
+        """Test that a partial batch is written after the flush interval."""
+        repository = FakeRepository()
+        buffer = make_buffer(repository, batch_size=100, flush_interval=0.02)
+        buffer.start()
+        
+        await buffer.submit(check())
+        await asyncio.sleep(0.1)
+        assert len(repository.batches) == 1
+        await buffer.stop()
+    
+    @pytest.mark.asyncio
+    async def test_ids_match_stored_documents(self):
+        """Test that the returned id is the string form of the stored _id."""
+        repository = FakeRepository()
+        buffer = make_buffer(repository, write_concern=parse_write_concern("majority"))
+        buffer.start()
+        
+        queued = await buffer.submit(check())
+        await buffer.stop()
+        
+        document = repository.batches[0][0]
+        assert queued.id == str(document["_id"]) == document["id"]
+        assert repository.write_concerns[0].document == {"w": "majority"}
+    
+    @pytest.mark.asyncio
+    async def test_backpressure_rejects_when_full(self):
+        """Test that a full queue makes submit wait, then fail with 503."""
+        repository = FakeRepository()
+        repository.release.clear()
+        buffer = make_buffer(repository, batch_size=2, max_pending=2, enqueue_timeout=0.02)
+        buffer.start()
+        
+        for i in range(4):
+            await buffer.submit(check(i))
+            await asyncio.sleep(0)
+        # Two checks are being written, two more fill the queue
+        assert buffer.snapshot()["in_flight"] == 2
+        assert buffer.snapshot()["depth"] == 2
+        
+        with pytest.raises(ServiceUnavailableError):
+            await buffer.submit(check(5))
+        assert buffer.rejected_total == 1
+        
+        repository.release.set()
+        await buffer.submit(check(6))
+        await buffer.stop()
+        assert sum(len(batch) for batch in repository.batches) == 5
+    
+    @pytest.mark.asyncio
+    async def test_rejected_batches_are_counted(self):
+        """Test that a rejected batch is dropped without stopping the buffer."""
+        repository = FakeRepository()
+        repository.fail = True
+        buffer = make_buffer(repository, batch_size=2)
+        buffer.start()
+        
+        await buffer.submit(check(1))
+        await buffer.submit(check(2))
+        await asyncio.sleep(0.01)
+        repository.fail = False
+        await buffer.submit(check(3))
+        await buffer.stop()
+        
+        assert buffer.failed_total == 2
+        assert buffer.written_total == 1
+    
+    @pytest.mark.asyncio
+    async def test_written_batches_update_client_stats(self):
+        """Test that only written batches reach the statistics, whose failures are counted."""
+        repository = FakeRepository()
+        stats = FakeStatsRepository()
+        buffer = make_buffer(repository, stats_repository=stats, batch_size=2)
+        buffer.start()
+        
+        await buffer.submit(check(1))
+        await buffer.submit(check(1))
+        await asyncio.sleep(0.01)
+        repository.fail = True
+        await buffer.submit(check(2))
+        await buffer.submit(check(3))
+        await asyncio.sleep(0.01)
+        repository.fail = False
+        stats.fail = True
+        await buffer.submit(check(4))
+        await buffer.stop()
+        
+        assert [len(batch) for batch in stats.batches] == [2]
+        assert buffer.written_total == 3
+        assert buffer.snapshot()["stats_failed_total"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_partial_batch_failure_counts_only_rejected_checks(self):
+        """Test that the stored part of a partly failed batch is counted and reaches the statistics."""
+        repository = FakeRepository()
+        repository.reject = {"client-2"}
+        stats = FakeStatsRepository()
+        buffer = make_buffer(repository, stats_repository=stats, batch_size=3)
+        buffer.start()
+        
+        for i in range(3):
+            await buffer.submit(check(i))
+        await buffer.stop()
+        
+        assert buffer.written_total == 2
+        assert buffer.failed_total == 1
+        assert [document["client_name"] for document in stats.batches[0]] == ["client-0", "client-1"]
+    
+    @pytest.mark.asyncio
+    async def test_writes_through_when_not_started(self):
+        """Test that checks are written directly while the buffer is not running."""
+        repository = FakeRepository()
+        buffer = make_buffer(repository)
+        
+        await buffer.submit(check())
+        assert len(repository.batches) == 1
+        
+        repository.fail = True
+        with pytest.raises(DatabaseError):
+            await buffer.submit(check())
+
+
+class FailingOnceCollection(FakeCollection):
+    """Raises its insert error on the first insert_many only."""
+    
+    async def insert_many(self, documents, ordered=True):
+        try:
+            return await super().insert_many(documents, ordered)
+        finally:
+            self.insert_error = None
+
+
+def stored_checks(collection):
+    return [document["client_name"] for document in collection.documents]
+
+
+class TestFlushErrors:
+    """Test which errors of the real repository drop checks and which retry them."""
+    
+    @pytest.mark.asyncio
+    async def test_connection_errors_retry_the_batch(self):
+        """Test that checks failing on a lost connection are written once it is back."""
+        repository = StatusCheckRepository()
+        repository._collection = FakeCollection(insert_error=AutoReconnect("connection reset"))
+        buffer = make_buffer(repository, batch_size=2, flush_interval=0.01)
+        buffer.start()
+        
+        await buffer.submit(check(1))
+        await buffer.submit(check(2))
+        # Far more attempts than a batch with any other error gets
+        await asyncio.sleep(0.2)
+        assert buffer.running
+        assert buffer.failed_total == 0
+        assert buffer.snapshot()["depth"] == 2
+        
+        repository._collection.insert_error = None
+        await buffer.submit(check(3))
+        await buffer.stop()
+        
+        assert stored_checks(repository._collection) == ["client-1", "client-2", "client-3"]
+        assert buffer.written_total == 3
+        assert buffer.failed_total == 0
+    
+    @pytest.mark.asyncio
+    async def test_write_concern_errors_retry_the_batch(self):
+        """Test that unacknowledged checks are sent again, only rejected ones dropped."""
+        repository = StatusCheckRepository()
+        repository._collection = FailingOnceCollection(insert_error=BulkWriteError({
+            "nInserted": 1,
+            "writeErrors": [{"index": 0, "code": 11000, "errmsg": "duplicate key"}],
+            "writeConcernErrors": [{"code": 64, "errmsg": "waiting for replication timed out"}]
+        }))
+        buffer = make_buffer(repository, batch_size=2, flush_interval=0.01)
+        buffer.start()
+        
+        await buffer.submit(check(1))
+        await buffer.submit(check(2))
+        await buffer.stop()
+        
+        assert stored_checks(repository._collection) == ["client-2"]
+        assert buffer.failed_total == 1
+        assert buffer.written_total == 1
+    
+    @pytest.mark.asyncio
+    async def test_other_errors_drop_the_batch_after_a_few_attempts(self):
+        """Test that a batch failing for another reason is dropped and the buffer keeps running."""
+        repository = StatusCheckRepository()
+        repository._collection = FakeCollection(insert_error=InvalidDocument("cannot encode"))
+        buffer = make_buffer(repository, batch_size=2, flush_interval=0.01)
+        buffer.start()
+        
+        await buffer.submit(check(1))
+        await buffer.submit(check(2))
+        await asyncio.sleep(0.1)
+        assert buffer.running
+        assert buffer.failed_total == 2
+        
+        repository._collection.insert_error = None
+        await buffer.submit(check(3))
+        await buffer.stop()
+        assert stored_checks(repository._collection) == ["client-3"]
+
+
+def rejecting(*failed, inserted):
+    """Error of an unordered insert_many that rejected the given positions."""
+    return BulkWriteError({
+        "nInserted": inserted,
+        "writeErrors": [{"index": index, "code": 11000, "errmsg": "duplicate key"} for index in failed]
+    })
+
+
+class TestInsertMany:
+    """Test how partial insert failures are reported."""
+    
+    @pytest.mark.asyncio
+    async def test_bulk_write_error_lists_rejected_documents(self):
+        """Test that a partly failed insert reports which documents were rejected."""
+        repository = StatusCheckRepository()
+        repository._collection = FakeCollection(insert_error=rejecting(2, 0, inserted=2))
+        
+        with pytest.raises(DatabaseError) as error:
+            await repository.insert_many([{"n": i} for i in range(4)])
+        assert error.value.details == {"failed_indexes": [0, 2]}
+        
+        repository._collection = FakeCollection(insert_error=rejecting(inserted=1))
+        with pytest.raises(DatabaseError) as error:
+            await repository.insert_many([{"n": 1}])
+        assert error.value.details == {"failed_indexes": []}
+    
+    @pytest.mark.asyncio
+    async def test_unacknowledged_and_connection_errors_are_retryable(self):
+        """Test that write concern and connection errors are told apart from rejections."""
+        repository = StatusCheckRepository()
+        repository._collection = FailingOnceCollection(insert_error=BulkWriteError({
+            "nInserted": 1, "writeErrors": [], "writeConcernErrors": [{"code": 64, "errmsg": "timed out"}]
+        }))
+        with pytest.raises(DatabaseError) as error:
+            await repository.insert_many([{"n": 1}])
+        assert error.value.details == {"failed_indexes": [], "retryable": True}
+        
+        repository._collection = FakeCollection(insert_error=AutoReconnect("connection reset"))
+        with pytest.raises(DatabaseError) as error:
+            await repository.insert_many([{"n": 1}])
+        assert error.value.details == {"retryable": True}
+        
+        repository._collection = FakeCollection(insert_error=InvalidDocument("cannot encode"))
+        with pytest.raises(DatabaseError) as error:
+            await repository.insert_many([{"n": 1}])
+        assert error.value.details == {}
+
+
+class TestStatusCheckEndpoint:
+    """Test the ingestion endpoint through the ASGI app."""
+    
+    @pytest.mark.asyncio
+    async def test_post_is_accepted_and_reported_in_metrics(self):
+        """Test that a check is queued with 202 and shows up in the metrics."""
+        init_services(app)
+        repository = FakeRepository()
+        app.state.status_buffer = make_buffer(repository)
+        app.state.status_buffer.start()
+        
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://localhost") as api:
+            response = await api.post("/api/status/check", json={"client_name": "probe"})
+            metrics = await api.get("/api/status/metrics")
+        await app.state.status_buffer.stop()
+        
+        assert response.status_code == 202
+        assert response.json()["client_name"] == "probe"
+        assert metrics.json()["status_buffer"]["depth"] == 1
+        assert repository.batches[0][0]["id"] == response.json()["id"]
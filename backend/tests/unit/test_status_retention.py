@@ -0,0 +1,55 @@
+"""
+Unit tests for the status check collection setup.
+"""
+import pytest
+
+from app.repositories.status import TTL_INDEX_NAME, StatusCheckRepository
+from tests.fakes import FakeCollection, FakeDatabase
+
+
+def repository_for(database, index_information=None):
+    repository = StatusCheckRepository()
+    repository.retention = 86400
+    repository._collection = FakeCollection(database=database, index_information=index_information)
+    return repository
+
+
+class TestStatusCollection:
+    """Test time-series creation and retention updates."""
+    
+    @pytest.mark.asyncio
+    async def test_creates_time_series_collection(self):
+        """Test that a missing collection is created as time-series with a TTL."""
+        database = FakeDatabase()
+        await repository_for(database).ensure_collection()
+        
+        name, options = database.created[0]
+        assert name == "status_checks"
+        assert options["timeseries"]["timeField"] == "created_at"
+        assert options["timeseries"]["metaField"] == "client_name"
+        assert options["expireAfterSeconds"] == 86400
+    
+    @pytest.mark.asyncio
+    async def test_updates_retention(self):
+        """Test that a changed retention setting is applied with collMod."""
+        database = FakeDatabase(collection_infos=[{"name": "status_checks", "type": "timeseries", "options": {"expireAfterSeconds": 60}}])
+        await repository_for(database).ensure_collection()
+        assert database.created == []
+        assert database.commands == [("collMod", "status_checks", {"expireAfterSeconds": 86400})]
+        
+        database = FakeDatabase(collection_infos=[{"name": "status_checks", "type": "timeseries", "options": {"expireAfterSeconds": 86400}}])
+        await repository_for(database).ensure_collection()
+        assert database.commands == []
+    
+    @pytest.mark.asyncio
+    async def test_regular_collection_gets_ttl_index(self):
+        """Test that an existing regular collection expires checks with a TTL index."""
+        database = FakeDatabase(collection_infos=[{"name": "status_checks", "type": "collection", "options": {}}])
+        repository = repository_for(database, {TTL_INDEX_NAME: {"key": [("created_at", 1)], "expireAfterSeconds": 60}})
+        await repository.ensure_collection()
+        
+        names = [index.document["name"] for index in repository.indexes]
+        assert "id_unique" in names and TTL_INDEX_NAME in names
+        assert database.commands == [
+            ("collMod", "status_checks", {"index": {"name": TTL_INDEX_NAME, "expireAfterSeconds": 86400}})
+        ]
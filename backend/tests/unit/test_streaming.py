@@ -0,0 +1,119 @@
+"""
+Unit tests for streamed JSON and NDJSON responses.
+"""
+import json
+from datetime import datetime
+
+import httpx
+import pytest
+from bson import ObjectId
+
+from app.core.exceptions import DatabaseError
+from app.dependencies import init_services
+from app.main import app
+from app.utils import responses
+from app.utils.responses import negotiate_stream_format, stream_json
+from tests.fakes import FakeCollection
+
+
+async def iterate(items):
+    for item in items:
+        yield item
+
+
+async def body(response):
+    return [chunk async for chunk in response.body_iterator]
+
+
+class TestStreamJson:
+    """Test chunked encoding of async iterators."""
+    
+    @pytest.mark.asyncio
+    async def test_json_array(self):
+        """Test that chunks join into one JSON array."""
+        items = [{"_id": ObjectId(), "n": i, "at": datetime(2024, 1, 1)} for i in range(5)]
+        response = await stream_json(iterate(items))
+        
+        assert response.media_type == "application/json"
+        decoded = json.loads(b"".join(await body(response)))
+        assert [item["n"] for item in decoded] == list(range(5))
+        assert decoded[0]["_id"] == str(items[0]["_id"])
+        assert decoded[0]["at"] == "2024-01-01T00:00:00"
+    
+    @pytest.mark.asyncio
+    async def test_ndjson_and_wrapping(self):
+        """Test NDJSON lines and arrays wrapped in an object."""
+        response = await stream_json(iterate([{"n": 1}, {"n": 2}]), "ndjson")
+        assert response.media_type == "application/x-ndjson"
+        assert b"".join(await body(response)) == b'{"n":1}\n{"n":2}\n'
+        
+        response = await stream_json(iterate([{"n": 1}]), prefix=b'{"items":[', suffix=b"]}")
+        assert json.loads(b"".join(await body(response))) == {"items": [{"n": 1}]}
+    
+    @pytest.mark.asyncio
+    async def test_empty(self):
+        """Test that an empty iterator is an empty array or body."""
+        assert b"".join(await body(await stream_json(iterate([])))) == b"[]"
+        assert b"".join(await body(await stream_json(iterate([]), "ndjson"))) == b""
+    
+    @pytest.mark.asyncio
+    async def test_chunks_are_bounded(self, monkeypatch):
+        """Test that the first item is sent alone and the rest in bounded chunks."""
+        monkeypatch.setattr(responses, "STREAM_CHUNK_SIZE", 100)
+        items = [{"value": "x" * 40} for _ in range(20)]
+        chunks = await body(await stream_json(iterate(items)))
+        
+        assert json.loads(chunks[0] + b"]") == items[:1]
+        assert len(chunks) > 5
+        assert all(len(chunk) < 200 for chunk in chunks)
+        assert json.loads(b"".join(chunks)) == items
+    
+    @pytest.mark.asyncio
+    async def test_first_item_error_raises_before_response(self):
+        """Test that a failing query surfaces before the status line is sent."""
+        async def failing():
+            raise DatabaseError("down")
+            yield
+        
+        with pytest.raises(DatabaseError):
+            await stream_json(failing())
+    
+    def test_negotiate_format(self):
+        """Test that the parameter wins over the Accept header."""
+        assert negotiate_stream_format(None, None) == "json"
+        assert negotiate_stream_format(None, "application/x-ndjson") == "ndjson"
+        assert negotiate_stream_format("json", "application/x-ndjson") == "json"
+        with pytest.raises(ValueError):
+            negotiate_stream_format("xml", None)
+
+
+class TestExportEndpoints:
+    """Test the streaming export endpoints through the ASGI app."""
+    
+    @pytest.mark.asyncio
+    async def test_project_export(self):
+        """Test that projects stream from a sorted, batched cursor that is closed."""
+        init_services(app)
+        documents = [
+            {
+                "_id": ObjectId(), "id": f"uuid-{i}", "name": f"p{i}", "description": "d", "language": "java",
+                "template_id": "java-hello", "github_username": "u", "repository_url": "url",
+                "status": "created", "created_at": datetime(2024, 1, 1, 0, 0, i), "metadata": {}
+            }
+            for i in range(3)
+        ]
+        collection = FakeCollection(documents)
+        app.state.project_service.project_repository._collection = collection
+        
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://localhost") as api:
+            as_json = await api.get("/api/projects/export")
+            as_ndjson = await api.get("/api/projects/export", headers={"Accept": "application/x-ndjson"})
+            bad = await api.get("/api/projects/export", params={"format": "xml"})
+        
+        assert as_json.status_code == 200
+        assert [project["name"] for project in as_json.json()] == ["p0", "p1", "p2"]
+        assert "metadata" not in as_json.json()[0]
+        assert as_ndjson.headers["content-type"] == "application/x-ndjson"
+        assert [json.loads(line)["id"] for line in as_ndjson.text.splitlines()] == [str(d["_id"]) for d in documents]
+        assert bad.status_code == 400
+        assert all(cursor.closed and cursor.sorted_by and cursor.batch for cursor in collection.cursors)
@@ -0,0 +1,103 @@
+"""
+Unit tests for the compiled template engine.
+"""
+from app.services.template_engine import CompiledTemplate, CompiledText
+from app.services.template_service import TemplateService
+
+
+def replace_render(files, variables):
+    """Reference implementation: one str.replace per variable."""
+    rendered = {}
+    for path, content in files.items():
+        for name, value in variables.items():
+            path = path.replace(f"{{{name}}}", value)
+            content = content.replace(f"{{{name}}}", value)
+        rendered[path] = content
+    return rendered
+
+
+class TestCompiledText:
+    """Test segment parsing and rendering."""
+    
+    def test_segments(self):
+        """Test that text is split into literals and placeholders."""
+        text = CompiledText("Hello {name}, welcome to {project_name}!")
+        assert text.names == ("name", "project_name")
+        assert text.literals == ("Hello ", ", welcome to ", "!")
+        assert text.positions == (6, 25)
+    
+    def test_render(self):
+        """Test variable substitution."""
+        text = CompiledText("{a}-{b}-{a}")
+        assert text.render({"a": "1", "b": "2"}) == "1-2-1"
+    
+    def test_unknown_placeholders_kept(self):
+        """Test that placeholders without a value are left untouched."""
+        text = CompiledText('@GetMapping("/{id}") {project_name}')
+        assert text.render({"project_name": "demo"}) == '@GetMapping("/{id}") demo'
+    
+    def test_non_placeholders_ignored(self):
+        """Test that GitHub expressions and Maven properties are literals."""
+        source = "java ${{ matrix.java-version }} ${junit.version} { get; set; }"
+        text = CompiledText(source)
+        assert text.is_static
+        assert text.render({"project_name": "demo"}) is source
+    
+    def test_rendered_size_without_rendering(self):
+        """Test that the computed size matches the rendered UTF-8 size."""
+        text = CompiledText("olá {project_name}, {unknown} {project_name}!")
+        variables = {"project_name": "démo"}
+        sizes = {name: len(value.encode("utf-8")) for name, value in variables.items()}
+        assert text.rendered_size(sizes) == len(text.render(variables).encode("utf-8"))
+
+    
+    def test_undeclared_placeholders_are_literal(self):
+        """Test that only allowed names become placeholders."""
+        text = CompiledText('@GetMapping("/{id}") {project_name}', allowed={"project_name"})
+        assert text.names == ("project_name",)
+        assert text.ignored == {"id"}
+        assert text.render({"project_name": "demo", "id": "7"}) == '@GetMapping("/{id}") demo'
+
+
+class TestCompiledTemplate:
+    """Test whole-template rendering."""
+    
+    def test_matches_replace_rendering(self):
+        """Test that every shipped template renders like the replace loop."""
+        service = TemplateService()
+        variables = {"project_name": "demo-app", "project_description": "A demo"}
+        
+        for language, packs in service.store.packs.items():
+            for template_id in packs:
+                template = service.get_template(language, template_id)
+                compiled = CompiledTemplate(template.files)
+                assert compiled.render(variables) == replace_render(template.files, variables)
+    
+    def test_paths_are_rendered(self):
+        """Test that placeholders in file paths are substituted."""
+        compiled = CompiledTemplate({"src/{project_name}/main.py": "print('{project_name}')"})
+        assert compiled.render({"project_name": "demo"}) == {"src/demo/main.py": "print('demo')"}
+    
+    def test_variable_index(self):
+        """Test the per-file and per-template variable index."""
+        compiled = CompiledTemplate({
+            "{project_name}.csproj": "<Project/>",
+            "README.md": "# {project_name}\n{project_description}",
+            "ci.yml": "runs-on: ${{ matrix.os }}",
+        })
+        assert compiled.variables == {"project_name", "project_description"}
+        assert compiled.file_variables == {
+            "{project_name}.csproj": {"project_name"},
+            "README.md": {"project_name", "project_description"},
+            "ci.yml": frozenset(),
+        }
+        assert compiled.static == (False, False, True)
+        assert compiled.static_count == 1
+    
+    def test_static_files_pass_through_by_reference(self):
+        """Test that files without placeholders are not re-rendered."""
+        source = "name: CI\n" * 100
+        compiled = CompiledTemplate({"ci.yml": source, "a.txt": "{project_name}"})
+        rendered = compiled.render({"project_name": "demo"})
+        assert rendered["ci.yml"] is source
+        assert rendered["a.txt"] == "demo"
@@ -0,0 +1,174 @@
+"""
+Unit tests for on-disk template packs.
+"""
+import asyncio
+import json
+
+import pytest
+
+from app.core.exceptions import ValidationError
+from app.services.template_packs import TemplatePackStore
+from app.services.template_service import TemplateService
+
+
+def write_pack(root, language, template_id, files, name="Demo"):
+    """Write a language manifest and one template pack below root."""
+    language_dir = root / language
+    language_dir.mkdir(parents=True, exist_ok=True)
+    (language_dir / "language.json").write_text(json.dumps({
+        "name": language.title(), "description": "Test language", "icon": "*"
+    }))
+    pack_dir = language_dir / template_id
+    for path, content in files.items():
+        target = pack_dir / "files" / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(content)
+    (pack_dir / "template.json").write_text(json.dumps({
+        "id": template_id,
+        "name": name,
+        "description": "Demo template",
+        "type": "console",
+        "variables": {"project_name": "string"},
+        "files": list(files)
+    }))
+    return pack_dir
+
+
+class TestTemplatePackStore:
+    """Test indexing, lazy loading and reloading of packs."""
+    
+    def test_files_load_on_first_use(self, tmp_path):
+        """Test that only manifests are read until a template is requested."""
+        write_pack(tmp_path, "python", "py-hello", {"main.py": "print('{project_name}')"})
+        store = TemplatePackStore(tmp_path)
+        
+        assert store.loaded_count() == 0
+        assert store.packs["python"]["py-hello"].info().name == "Demo"
+        assert store.loaded_count() == 0
+        
+        template = store.get("python", "py-hello")
+        assert template.language == "python"
+        assert template.files == {"main.py": "print('{project_name}')"}
+        assert store.get("python", "py-hello") is template
+        assert store.loaded_count() == 1
+    
+    def test_scan_reloads_changed_pack(self, tmp_path):
+        """Test that a rescan replaces changed packs and keeps unchanged ones."""
+        pack_dir = write_pack(tmp_path, "python", "py-hello", {"main.py": "v1"})
+        write_pack(tmp_path, "python", "py-other", {"main.py": "other"})
+        store = TemplatePackStore(tmp_path)
+        changed = []
+        store.subscribe(changed.append)
+        old = store.get("python", "py-hello")
+        other = store.get("python", "py-other")
+        
+        assert store.scan() == []
+        
+        (pack_dir / "files" / "main.py").write_text("version two")
+        assert store.scan() == ["py-hello"]
+        assert changed == ["py-hello"]
+        assert store.get("python", "py-hello") is not old
+        assert store.get("python", "py-hello").files["main.py"] == "version two"
+        assert store.get("python", "py-other") is other
+    
+    def test_scan_picks_up_added_and_removed_packs(self, tmp_path):
+        """Test that new packs appear and deleted packs disappear."""
+        write_pack(tmp_path, "python", "py-hello", {"main.py": "v1"})
+        store = TemplatePackStore(tmp_path)
+        
+        write_pack(tmp_path, "python", "py-new", {"app.py": "new"})
+        assert store.scan() == ["py-new"]
+        assert store.get("python", "py-new") is not None
+        
+        (tmp_path / "python" / "py-new" / "template.json").unlink()
+        assert store.scan() == ["py-new"]
+        assert store.get("python", "py-new") is None
+    
+    def test_shared_fragment_changes_reload_every_user(self, tmp_path):
+        """Test that packs read fragments and reload when a fragment changes."""
+        fragment = tmp_path / "_fragments" / "ci.yml"
+        fragment.parent.mkdir()
+        fragment.write_text("name: CI\n")
+        for template_id in ("py-hello", "py-web"):
+            pack_dir = write_pack(tmp_path, "python", template_id, {"main.py": template_id})
+            manifest = json.loads((pack_dir / "template.json").read_text())
+            manifest["files"].append("ci.yml")
+            manifest["fragments"] = {"ci.yml": "ci.yml"}
+            (pack_dir / "template.json").write_text(json.dumps(manifest))
+        store = TemplatePackStore(tmp_path)
+        
+        assert list(store.packs) == ["python"]
+        assert store.get("python", "py-web").files["ci.yml"] == "name: CI\n"
+        
+        fragment.write_text("name: CI v2\n")
+        assert sorted(store.scan()) == ["py-hello", "py-web"]
+        assert store.get("python", "py-hello").files["ci.yml"] == "name: CI v2\n"
+    
+    def test_broken_manifest_keeps_last_good_pack(self, tmp_path):
+        """Test that a half-written manifest does not drop the pack."""
+        pack_dir = write_pack(tmp_path, "python", "py-hello", {"main.py": "v1"})
+        store = TemplatePackStore(tmp_path)
+        
+        (pack_dir / "template.json").write_text("{ not json")
+        store.scan()
+        assert store.get("python", "py-hello").files == {"main.py": "v1"}
+    
+    @pytest.mark.asyncio
+    async def test_watch_stops_on_event(self, tmp_path):
+        """Test that the watcher exits once the stop event is set."""
+        write_pack(tmp_path, "python", "py-hello", {"main.py": "v1"})
+        store = TemplatePackStore(tmp_path)
+        stop = asyncio.Event()
+        
+        task = asyncio.create_task(store.watch(stop, poll_interval=0.01))
+        await asyncio.sleep(0.05)
+        stop.set()
+        await asyncio.wait_for(task, timeout=5)
+
+
+class TestTemplateServicePacks:
+    """Test the template service on top of the pack store."""
+    
+    def test_shipped_catalog(self):
+        """Test that the bundled packs are indexed without loading files."""
+        service = TemplateService()
+        
+        assert [language.id for language in service.get_languages()] == ["java", "dotnet"]
+        assert {t.id for t in service.get_templates_by_language("java")} == {"java-hello", "java-springboot"}
+        assert service.store.loaded_count() == 0
+        
+        template = service.get_template("dotnet", "dotnet-console")
+        assert "{project_name}.csproj" in template.files
+        assert service.store.loaded_count() == 1
+    
+    def test_unknown_template(self):
+        """Test that unknown languages and templates are validation errors."""
+        service = TemplateService()
+        
+        with pytest.raises(ValidationError):
+            service.get_template("cobol", "hello")
+        with pytest.raises(ValidationError):
+            service.get_template("java", "missing")
+    
+    def test_reload_invalidates_compiled_template(self, tmp_path):
+        """Test that a changed pack is recompiled on next render."""
+        pack_dir = write_pack(tmp_path, "python", "py-hello", {"main.py": "v1 {project_name}"})
+        service = TemplateService(TemplatePackStore(tmp_path))
+        template = service.get_template("python", "py-hello")
+        assert service.process_template(template, {"project_name": "x"}) == {"main.py": "v1 x"}
+        
+        (pack_dir / "files" / "main.py").write_text("version 2 {project_name}")
+        service.store.scan()
+        template = service.get_template("python", "py-hello")
+        assert service.process_template(template, {"project_name": "x"}) == {"main.py": "version 2 x"}
+    
+    def test_validation_uses_placeholder_index(self, tmp_path):
+        """Test that validation requires the variables the files actually use."""
+        write_pack(tmp_path, "python", "py-hello", {"main.py": "print('{project_name}')"})
+        service = TemplateService(TemplatePackStore(tmp_path))
+        template = service.get_template("python", "py-hello")
+        
+        assert service.validate_template_variables(template, {"project_name": "demo"})
+        with pytest.raises(ValidationError) as error:
+            service.validate_template_variables(template, {"project_description": "d"})
+        assert error.value.details == {"missing": ["project_name"]}
@@ -0,0 +1,339 @@
+"""
+Unit tests for the background job worker.
+"""
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from pymongo.results import UpdateResult
+
+from app.core.exceptions import DatabaseError, GitHubError, GitHubRequestError, ValidationError
+from app.models.job import Job
+from app.models.project import ProjectRequest, ProjectResponse
+from app.repositories.job import JobRepository
+from app.services.project_service import ProjectService
+from app.services.template_service import TemplateService
+from app.worker import Worker
+
+
+class FakeJobRepository:
+    """In-memory stand-in for JobRepository."""
+    
+    def __init__(self, jobs, lock_lost=False):
+        self.jobs = list(jobs)
+        self.finished = {}
+        self.beats = []
+        self.lock_lost = lock_lost
+    
+    async def claim_next(self, worker_id, lock_timeout, max_attempts):
+        if not self.jobs:
+            return None
+        job = self.jobs.pop(0)
+        job.attempts += 1
+        job.status = "running"
+        job.worker_id = worker_id
+        return job
+    
+    async def heartbeat(self, job_id, worker_id, progress=None):
+        self.beats.append(progress)
+        return not self.lock_lost
+    
+    async def mark_succeeded(self, job_id, worker_id, result):
+        self.finished[job_id] = ("succeeded", result)
+        return True
+    
+    async def mark_failed(self, job_id, worker_id, error, retry, retry_delay=0):
+        self.finished[job_id] = ("queued" if retry else "failed", error)
+        self.retry_delay = retry_delay
+        return True
+
+
+class FakeProjectService:
+    """Project service stub that succeeds or raises a given error."""
+    
+    def __init__(self, error=None, delay=0):
+        self.error = error
+        self.delay = delay
+        self.progress = None
+        self.cancelled = False
+    
+    async def create_project(self, request, progress=None, on_progress=None):
+        self.progress = progress
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error:
+            raise self.error
+        return ProjectResponse(message="ok", repository_url=f"https://github.com/test/{request.name}")
+
+
+def make_job(**overrides):
+    """Build a project generation job."""
+    payload = {
+        "name": "demo",
+        "description": "Demo project",
+        "language": "java",
+        "template_id": "java-hello",
+        "github_username": "test"
+    }
+    return Job(payload=payload, **overrides)
+
+
+class TestWorker:
+    """Test job processing."""
+    
+    @pytest.mark.asyncio
+    async def test_empty_queue(self):
+        """Test that an empty queue reports no work."""
+        worker = Worker(FakeProjectService(), FakeJobRepository([]), worker_id="w1")
+        assert await worker.run_once() is False
+    
+    @pytest.mark.asyncio
+    async def test_successful_job(self):
+        """Test that a successful job stores the project response."""
+        job = make_job()
+        repo = FakeJobRepository([job])
+        worker = Worker(FakeProjectService(), repo, worker_id="w1")
+        
+        assert await worker.run_once() is True
+        status, result = repo.finished[job.id]
+        assert status == "succeeded"
+        assert result["repository_url"] == "https://github.com/test/demo"
+    
+    @pytest.mark.asyncio
+    async def test_transient_failure_is_retried(self):
+        """Test that GitHub failures put the job back in the queue."""
+        job = make_job()
+        repo = FakeJobRepository([job])
+        worker = Worker(FakeProjectService(GitHubError("boom")), repo, worker_id="w1")
+        
+        await worker.run_once()
+        assert repo.finished[job.id][0] == "queued"
+    
+    @pytest.mark.asyncio
+    async def test_retries_back_off(self, monkeypatch):
+        """Test that each retry of a job waits twice as long as the one before."""
+        monkeypatch.setattr("app.worker.settings.job_retry_delay", 10)
+        job = make_job(attempts=1)
+        repo = FakeJobRepository([job])
+        worker = Worker(FakeProjectService(GitHubError("boom")), repo, worker_id="w1")
+        
+        await worker.run_once()
+        assert repo.finished[job.id][0] == "queued"
+        assert repo.retry_delay == 20
+    
+    @pytest.mark.asyncio
+    async def test_rejected_github_request_is_final(self):
+        """Test that a request GitHub will reject again, like an existing repository, is not retried."""
+        job = make_job()
+        repo = FakeJobRepository([job])
+        error = GitHubRequestError("Repository 'demo' already exists")
+        worker = Worker(FakeProjectService(error), repo, worker_id="w1")
+        
+        await worker.run_once()
+        assert repo.finished[job.id] == ("failed", "Repository 'demo' already exists")
+    
+    @pytest.mark.asyncio
+    async def test_validation_failure_is_final(self):
+        """Test that validation failures are not retried."""
+        job = make_job()
+        repo = FakeJobRepository([job])
+        worker = Worker(FakeProjectService(ValidationError("bad")), repo, worker_id="w1")
+        
+        await worker.run_once()
+        assert repo.finished[job.id] == ("failed", "bad")
+    
+    @pytest.mark.asyncio
+    async def test_unknown_job_type(self):
+        """Test that unknown job types fail without retry."""
+        job = make_job(type="unknown")
+        repo = FakeJobRepository([job])
+        worker = Worker(FakeProjectService(), repo, worker_id="w1")
+        
+        await worker.run_once()
+        assert repo.finished[job.id][0] == "failed"
+    
+    @pytest.mark.asyncio
+    async def test_retry_resumes_from_saved_progress(self):
+        """Test that a retried job hands the saved progress to the project service."""
+        job = make_job(progress={"repository": {"name": "demo"}})
+        service = FakeProjectService()
+        worker = Worker(service, FakeJobRepository([job]), worker_id="w1")
+        
+        await worker.run_once()
+        assert service.progress == {"repository": {"name": "demo"}}
+    
+    @pytest.mark.asyncio
+    async def test_long_job_renews_its_lock(self, monkeypatch):
+        """Test that a running job keeps renewing its lock until it finishes."""
+        monkeypatch.setattr("app.worker.settings.job_heartbeat_interval", 0.01)
+        job = make_job()
+        repo = FakeJobRepository([job])
+        worker = Worker(FakeProjectService(delay=0.05), repo, worker_id="w1")
+        
+        await worker.run_once()
+        beats = len(repo.beats)
+        assert beats >= 2
+        await asyncio.sleep(0.03)
+        assert len(repo.beats) == beats
+
+    
+    @pytest.mark.asyncio
+    async def test_lost_lock_cancels_the_job(self, monkeypatch):
+        """Test that a worker stops running a job once another worker owns it."""
+        monkeypatch.setattr("app.worker.settings.job_heartbeat_interval", 0.01)
+        job = make_job()
+        repo = FakeJobRepository([job], lock_lost=True)
+        service = FakeProjectService(delay=1)
+        worker = Worker(service, repo, worker_id="w1")
+        
+        assert await asyncio.wait_for(worker.run_once(), timeout=0.5) is True
+        assert service.cancelled
+        assert job.id not in repo.finished
+
+
+class RecordingJobCollection:
+    """Records the queries sent by JobRepository.claim_next and mark_failed."""
+    
+    def __init__(self):
+        self.calls = []
+    
+    async def update_many(self, query, update):
+        self.calls.append(("update_many", query, update))
+    
+    async def find_one_and_update(self, query, update, **kwargs):
+        self.calls.append(("find_one_and_update", query, update))
+        return None
+    
+    async def update_one(self, query, update):
+        self.calls.append(("update_one", query, update))
+        return UpdateResult({"n": 1, "nModified": 1}, True)
+
+
+class TestClaimNext:
+    """Test the attempt limit on reclaimed jobs."""
+    
+    @pytest.mark.asyncio
+    async def test_stale_jobs_count_against_the_attempt_limit(self):
+        """Test that exhausted stale jobs are failed and never claimed again."""
+        repo = JobRepository()
+        repo._collection = RecordingJobCollection()
+        
+        assert await repo.claim_next("w1", lock_timeout=60, max_attempts=3) is None
+        (_, failed_query, failed_update), (_, claim_query, claim_update) = repo.collection.calls
+        assert failed_query["status"] == "running"
+        assert failed_query["attempts"] == {"$gte": 3}
+        assert failed_update["$set"]["status"] == "failed"
+        stale_clause = claim_query["$or"][1]
+        assert stale_clause["status"] == "running"
+        assert stale_clause["attempts"] == {"$lt": 3}
+        assert claim_update["$inc"] == {"attempts": 1}
+    
+    @pytest.mark.asyncio
+    async def test_retried_jobs_wait_for_their_retry_time(self):
+        """Test that a job put back in the queue is not claimed before its retry time."""
+        repo = JobRepository()
+        repo._collection = RecordingJobCollection()
+        before = datetime.utcnow()
+        
+        await repo.mark_failed("job-1", "w1", "boom", retry=True, retry_delay=30)
+        await repo.claim_next("w1", lock_timeout=60, max_attempts=3)
+        
+        (_, _, failed_update), _, (_, claim_query, _) = repo.collection.calls
+        assert failed_update["$set"]["status"] == "queued"
+        assert failed_update["$set"]["retry_at"] >= before + timedelta(seconds=30)
+        assert claim_query["$or"][0]["status"] == "queued"
+        assert set(claim_query["$or"][0]["retry_at"]["$not"]) == {"$gt"}
+
+
+class TestCreateProjectErrors:
+    """Test which create_project errors the worker may retry."""
+    
+    class BrokenGitHubService:
+        async def create_repository(self, name, description, private=False):
+            raise ConnectionError("connection reset by peer")
+    
+    @pytest.mark.asyncio
+    async def test_unexpected_errors_are_not_wrapped(self):
+        """Test that network errors keep their type so the job is retried."""
+        service = ProjectService(object(), self.BrokenGitHubService(), TemplateService(), job_repository=object())
+        request = ProjectRequest(**make_job().payload)
+        
+        with pytest.raises(ConnectionError):
+            await service.create_project(request)
+    
+    @pytest.mark.asyncio
+    async def test_network_error_job_is_retried(self):
+        """Test that a job failing with a network error goes back to the queue."""
+        job = make_job()
+        repo = FakeJobRepository([job])
+        service = ProjectService(object(), self.BrokenGitHubService(), TemplateService(), job_repository=object())
+        worker = Worker(service, repo, worker_id="w1")
+        
+        await worker.run_once()
+        assert repo.finished[job.id][0] == "queued"
+
+
+class FlakyGitHubService:
+    """Creates repositories once; a second creation fails like GitHub would."""
+    
+    def __init__(self):
+        self.created = []
+        self.pushes = 0
+    
+    async def create_repository(self, name, description, private=False):
+        if name in self.created:
+            raise GitHubError(f"Repository '{name}' already exists")
+        self.created.append(name)
+        return {"name": name, "html_url": f"https://github.com/test/{name}"}
+    
+    async def create_files(self, repo_name, files, commit_message="Initial commit"):
+        self.pushes += 1
+        return True
+
+
+class FlakyProjectRepository:
+    """Fails the first insert, then stores projects."""
+    
+    def __init__(self):
+        self.failures = 1
+        self.created = []
+    
+    async def create(self, project):
+        if self.failures:
+            self.failures -= 1
+            raise DatabaseError("connection reset")
+        self.created.append(project)
+        return project
+    
+    async def bump_stats_version(self):
+        pass
+
+
+class TestResumableGeneration:
+    """Test that a retried generation resumes instead of starting over."""
+    
+    @pytest.mark.asyncio
+    async def test_retry_reuses_created_repository(self):
+        """Test that a failure after the push retries only the project record."""
+        github = FlakyGitHubService()
+        projects = FlakyProjectRepository()
+        service = ProjectService(projects, github, TemplateService(), job_repository=object())
+        request = ProjectRequest(**make_job().payload)
+        progress = {}
+        saved = []
+        
+        async def on_progress(current):
+            saved.append(dict(current))
+        
+        with pytest.raises(DatabaseError):
+            await service.create_project(request, progress, on_progress)
+        assert set(progress) == {"repository", "files_pushed"}
+        
+        response = await service.create_project(request, progress, on_progress)
+        assert github.created == ["demo"]
+        assert github.pushes == 1
+        assert response.project_id == projects.created[0].id
+        assert saved[-1]["project_id"] == response.project_id
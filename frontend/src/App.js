@@ -43,6 +43,9 @@ import {
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL || '';
 const API = `${BACKEND_URL}/api`;
+// Generation jobs are polled every 1.5s for at most 10 minutes
+const JOB_POLL_INTERVAL_MS = 1500;
+const JOB_POLL_MAX_ATTEMPTS = 400;
 
 const Home = () => {
   const { isDarkMode, toggleTheme } = useTheme();
@@ -111,9 +114,11 @@ const Home = () => {
 
   const fetchRecentProjects = async () => {
     try {
-      const response = await axios.get(`${API}/projects`);
+      const response = await axios.get(`${API}/projects`, { params: { limit: 3 } });
       const projects = response.data?.projects || [];
-      setRecentProjects(projects.slice(-3));
+      // Newest first; older servers return the whole list oldest first
+      const newest = [...projects].sort((a, b) => String(b.created_at || '').localeCompare(String(a.created_at || '')));
+      setRecentProjects(newest.slice(0, 3));
     } catch (error) {
       console.error("Error fetching projects:", error);
       setRecentProjects([]);
@@ -159,6 +164,26 @@ const Home = () => {
     }));
   };
 
+  const waitForJob = async (jobId) => {
+    for (let attempt = 0; attempt < JOB_POLL_MAX_ATTEMPTS; attempt++) {
+      const { data: job } = await axios.get(`${API}/projects/jobs/${jobId}`);
+      if (job.status === "succeeded") {
+        return job.result;
+      }
+      if (job.status === "failed") {
+        const error = new Error(job.error || "Failed to generate project");
+        error.response = { data: { detail: error.message } };
+        throw error;
+      }
+      await new Promise((resolve) => setTimeout(resolve, JOB_POLL_INTERVAL_MS));
+    }
+    const error = new Error(
+      `Project generation is still running (job ${jobId}). Check Recent Projects again in a few minutes.`
+    );
+    error.response = { data: { detail: error.message } };
+    throw error;
+  };
+
   const generateProject = async () => {
     if (!selectedLanguage || !selectedTemplate) {
       toast.error("Please select a language and template");
@@ -193,17 +218,20 @@ const Home = () => {
         github_username: projectForm.github_username
       });
 
+      // Generation runs in a background job; poll until it finishes
+      const result = await waitForJob(response.data.job_id);
+
       clearInterval(progressInterval);
       setLoadingProgress(100);
 
-      if (response.data.success) {
+      if (result.success) {
         toast.success(
           <div className="flex flex-col gap-2">
             <span className="font-semibold">🎉 Project Generated Successfully!</span>
-            <span>{response.data.message}</span>
+            <span>{result.message}</span>
             <div className="flex gap-2 mt-2">
               <a 
-                href={response.data.repository_url} 
+                href={result.repository_url} 
                 target="_blank" 
                 rel="noopener noreferrer"
                 className="text-blue-500 hover:text-blue-700 flex items-center gap-1 text-sm"
@@ -212,7 +240,7 @@ const Home = () => {
                 View Repository
               </a>
               <button
-                onClick={() => copyToClipboard(response.data.repository_url)}
+                onClick={() => copyToClipboard(result.repository_url)}
                 className="text-gray-500 hover:text-gray-700 flex items-center gap-1 text-sm"
               >
                 <Copy className="w-4 h-4" />
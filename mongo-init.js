@@ -2,23 +2,16 @@
 db = db.getSiblingDB('scaffold_forge');
 
 // Create collections
-db.createCollection('status_checks');
 db.createCollection('projects');
+db.createCollection('jobs');
 
-// Create indexes for better performance
-db.status_checks.createIndex({ "timestamp": 1 });
-db.status_checks.createIndex({ "client_name": 1 });
-db.projects.createIndex({ "github_username": 1 });
-db.projects.createIndex({ "created_at": 1 });
-db.projects.createIndex({ "language": 1 });
-
-// Insert sample data (optional)
-db.status_checks.insertOne({
-  client_name: "docker-init",
-  timestamp: new Date(),
-  id: "init-" + new Date().getTime()
-});
+// Indexes are declared on the backend repository classes and created by the
+// API and worker at every startup (app/repositories/indexes.py), so they stay
+// in sync with the queries even on existing volumes.
+//
+// status_checks is created there too, as a time-series collection that
+// expires checks after STATUS_RETENTION_DAYS; creating it here would make
+// it a regular collection.
 
 print("✅ MongoDB initialized successfully for Scaffold Forge");
-print("📊 Collections created: status_checks, projects");
-print("🔍 Indexes created for better performance");
+print("📊 Collections created: projects, jobs");